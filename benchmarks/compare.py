@@ -0,0 +1,51 @@
+"""Compares two result files written by run.py.
+
+Prints the speed-up (>1 is faster) of every function, corpus and cache state,
+and the change in import time and peak memory:
+
+    python benchmarks/compare.py before.json after.json
+"""
+
+import argparse
+import json
+
+
+def _load(path: str) -> dict:
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("before")
+    parser.add_argument("after")
+    args = parser.parse_args()
+    before, after = _load(args.before), _load(args.after)
+
+    print(f"{before['meta']['commit']} -> {after['meta']['commit']}")
+    print(
+        f"import_ms (median): {before['import_ms']['median']} -> "
+        f"{after['import_ms']['median']}"
+    )
+    print(f"{'corpus':<14}{'function':<30}{'cold':>8}{'warm':>8}")
+    for corpus, old in before["corpora"].items():
+        new = after["corpora"].get(corpus)
+        if new is None:
+            continue
+        for function, old_times in old["functions"].items():
+            new_times = new["functions"].get(function)
+            if new_times is None:
+                continue
+            speedups = [
+                old_times[state]["seconds"] / new_times[state]["seconds"]
+                for state in ("cold", "warm")
+            ]
+            print(f"{corpus:<14}{function:<30}{speedups[0]:>7.2f}x{speedups[1]:>7.2f}x")
+        print(
+            f"{corpus:<14}{'peak memory (KiB)':<30}"
+            f"{old['peak_memory_kib']:>8} -> {new['peak_memory_kib']}"
+        )
+
+
+if __name__ == "__main__":
+    main()
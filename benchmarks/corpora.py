@@ -0,0 +1,120 @@
+"""Deterministic synthetic corpora for the benchmarks.
+
+Every corpus is generated from a fixed seed, so the same scale always gives
+the same texts and results are comparable across commits. The vocabulary
+mixes the easy-word list, common scientific terms and made-up words, so all
+syllable tiers (custom dictionary, CMU dictionary, regex, species names) get
+exercised.
+"""
+
+import os
+import random
+from typing import Callable, Dict, List
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+EASY_WORDS_PATH = os.path.join(
+    REPO_ROOT, "scireadability", "resources", "en", "easy_words.txt"
+)
+
+SCIENTIFIC_TERMS = """
+analysis hypothesis significant correlation regression variance coefficient
+methodology experimental parameter statistical distribution probability
+molecular protein expression mitochondrial transcription phosphorylation
+genome sequencing phylogenetic morphology taxonomy ecological population
+temperature concentration spectroscopy chromatography calibration
+algorithm computational simulation optimization convergence approximation
+neural network classification evaluation benchmark dataset representation
+participants longitudinal cohort intervention randomized placebo clinical
+""".split()
+
+SYLLABLES = "ba ce di fo gu ka le mi no pu ra se ti vo zy tron lex phy cho".split()
+GENUS_ENDINGS = ["us", "ia", "ella", "myces", "opsis", "ites"]
+SPECIES_ENDINGS = ["ii", "oides", "eae", "odes", "ensis", "atus", "mallei"]
+
+
+def _easy_words() -> List[str]:
+    with open(EASY_WORDS_PATH, encoding="utf-8") as f:
+        return [line.strip() for line in f if line.strip()]
+
+
+def _made_up_word(rng: random.Random) -> str:
+    return "".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 5)))
+
+
+def _binomial(rng: random.Random) -> str:
+    genus = _made_up_word(rng).capitalize() + rng.choice(GENUS_ENDINGS)
+    return f"{genus} {_made_up_word(rng)}{rng.choice(SPECIES_ENDINGS)}"
+
+
+class _Writer:
+    def __init__(self, seed: int, species_rate: float = 0.0):
+        self.rng = random.Random(seed)
+        self.easy = _easy_words()
+        self.species_rate = species_rate
+
+    def word(self) -> str:
+        roll = self.rng.random()
+        if roll < self.species_rate:
+            return _binomial(self.rng)
+        if roll < 0.65:
+            return self.rng.choice(self.easy)
+        if roll < 0.9:
+            return self.rng.choice(SCIENTIFIC_TERMS)
+        return _made_up_word(self.rng)
+
+    def sentence(self) -> str:
+        words = [self.word() for _ in range(self.rng.randint(4, 30))]
+        if self.rng.random() < 0.3:
+            words[self.rng.randrange(len(words))] += ","
+        words[0] = words[0].capitalize()
+        return " ".join(words) + self.rng.choice(".....?!")
+
+    def text(self, n_words: int, paragraph: int = 0) -> str:
+        sentences: List[str] = []
+        count = 0
+        while count < n_words:
+            sentence = self.sentence()
+            count += sentence.count(" ") + 1
+            sentences.append(sentence)
+            if paragraph and len(sentences) % paragraph == 0:
+                sentences[-1] += "\n\n"
+        return " ".join(sentences)
+
+
+def abstracts(scale: float = 1.0) -> List[str]:
+    """Short abstracts of 150-300 words."""
+    writer = _Writer(seed=1)
+    return [
+        writer.text(writer.rng.randint(150, 300))
+        for _ in range(max(1, int(200 * scale)))
+    ]
+
+
+def papers(scale: float = 1.0) -> List[str]:
+    """Full papers of about 6,000 words, split into paragraphs."""
+    writer = _Writer(seed=2)
+    return [writer.text(6000, paragraph=6) for _ in range(max(1, int(8 * scale)))]
+
+
+def species(scale: float = 1.0) -> List[str]:
+    """Taxonomic text in which about a fifth of the words are binomials."""
+    writer = _Writer(seed=3, species_rate=0.2)
+    return [writer.text(400) for _ in range(max(1, int(60 * scale)))]
+
+
+def unpunctuated(scale: float = 1.0) -> List[str]:
+    """Lowercase text without punctuation, e.g. from speech transcripts."""
+    writer = _Writer(seed=4)
+    texts = []
+    for _ in range(max(1, int(20 * scale))):
+        words = [writer.word().lower() for _ in range(2000)]
+        texts.append(" ".join(words))
+    return texts
+
+
+CORPORA: Dict[str, Callable[[float], List[str]]] = {
+    "abstracts": abstracts,
+    "papers": papers,
+    "species": species,
+    "unpunctuated": unpunctuated,
+}
@@ -0,0 +1,69 @@
+"""Measures the cost of `import scireadability` and of loading its lexicons.
+
+Each sample runs in a fresh interpreter so that nothing is already imported
+or cached. Results are printed as JSON (times in milliseconds):
+
+    python benchmarks/import_time.py --runs 20
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SAMPLE = """
+import time
+start = time.perf_counter()
+import scireadability
+imported = time.perf_counter()
+scireadability.warmup()
+warmed = time.perf_counter()
+print((imported - start) * 1000, (warmed - imported) * 1000)
+"""
+
+
+def sample_import() -> tuple:
+    """Returns (import ms, warmup ms) measured in a fresh interpreter."""
+    output = subprocess.run(
+        [sys.executable, "-c", SAMPLE],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=REPO_ROOT,
+    ).stdout.split()
+    return float(output[-2]), float(output[-1])
+
+
+def summarize(samples: list) -> dict:
+    return {
+        "min": round(min(samples), 3),
+        "median": round(statistics.median(samples), 3),
+        "max": round(max(samples), 3),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args()
+
+    samples = [sample_import() for _ in range(args.runs)]
+    print(
+        json.dumps(
+            {
+                "python": sys.version.split()[0],
+                "runs": args.runs,
+                "import_ms": summarize([s[0] for s in samples]),
+                "warmup_ms": summarize([s[1] for s in samples]),
+            },
+            indent=2,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
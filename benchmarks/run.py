@@ -0,0 +1,149 @@
+"""Runs the benchmark suite and prints the results as JSON.
+
+For each synthetic corpus (see corpora.py) it measures the throughput of the
+main functions with cold caches (lexicon loaded, word and document caches
+empty) and warm caches (the same texts again), text_standard end to end, and
+the peak memory of profiling every text. Import and warmup times are sampled
+in fresh interpreters as in import_time.py. Save the output of two commits and
+compare them with compare.py:
+
+    python benchmarks/run.py --scale 0.25 --output before.json
+"""
+
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+import warnings
+from typing import Callable, Dict, List
+
+from corpora import CORPORA, REPO_ROOT
+from import_time import sample_import, summarize
+
+sys.path.insert(0, REPO_ROOT)
+
+import scireadability  # noqa: E402
+from scireadability import scireadability as core  # noqa: E402
+
+FUNCTIONS: Dict[str, Callable] = {
+    "syllable_count": scireadability.syllable_count,
+    "lexicon_count": scireadability.lexicon_count,
+    "sentence_count": scireadability.sentence_count,
+    "flesch_kincaid_grade": scireadability.flesch_kincaid_grade,
+    "gunning_fog": scireadability.gunning_fog,
+    "dale_chall_readability_score": scireadability.dale_chall_readability_score,
+    "text_standard": scireadability.text_standard,
+    # every formula from one fresh profile per text, bypassing the caches
+    "all_formulas": lambda text: scireadability.TextProfile(text).scores(),
+}
+
+
+def _clear_caches() -> None:
+    core._word_cache.clear()
+    core._document_cache.clear()
+
+
+def _time_pass(func: Callable, texts: List[str]) -> float:
+    start = time.perf_counter()
+    for text in texts:
+        func(text)
+    return time.perf_counter() - start
+
+
+def _rates(seconds: float, texts: List[str], words: int) -> Dict[str, float]:
+    return {
+        "seconds": round(seconds, 6),
+        "texts_per_s": round(len(texts) / seconds, 2),
+        "words_per_s": round(words / seconds, 1),
+    }
+
+
+def bench_corpus(texts: List[str], repeat: int) -> Dict[str, Dict]:
+    words = sum(len(text.split()) for text in texts)
+    results = {}
+    for name, func in FUNCTIONS.items():
+        _clear_caches()
+        cold = _time_pass(func, texts)
+        warm = min(_time_pass(func, texts) for _ in range(repeat))
+        results[name] = {
+            "cold": _rates(cold, texts, words),
+            "warm": _rates(warm, texts, words),
+        }
+    return results
+
+
+def peak_memory_kib(texts: List[str]) -> float:
+    _clear_caches()
+    tracemalloc.start()
+    for text in texts:
+        scireadability.TextProfile(text).scores()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return round(peak / 1024, 1)
+
+
+def _commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=REPO_ROOT,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--scale", type=float, default=1.0, help="corpus size multiplier"
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=3, help="warm passes; the best is kept"
+    )
+    parser.add_argument("--import-runs", type=int, default=5)
+    parser.add_argument(
+        "--corpus", action="append", choices=sorted(CORPORA), help="default: all"
+    )
+    parser.add_argument("--output", help="write the JSON here instead of stdout")
+    args = parser.parse_args()
+
+    warnings.filterwarnings("ignore", message="FORCAST")
+    imports = [sample_import() for _ in range(args.import_runs)]
+    scireadability.warmup()
+    report = {
+        "meta": {
+            "commit": _commit(),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "scale": args.scale,
+            "repeat": args.repeat,
+        },
+        "import_ms": summarize([s[0] for s in imports]),
+        "warmup_ms": summarize([s[1] for s in imports]),
+        "corpora": {},
+    }
+    for name in args.corpus or CORPORA:
+        texts = CORPORA[name](args.scale)
+        report["corpora"][name] = {
+            "texts": len(texts),
+            "words": sum(len(text.split()) for text in texts),
+            "functions": bench_corpus(texts, args.repeat),
+            "peak_memory_kib": peak_memory_kib(texts),
+        }
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(output + "\n")
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
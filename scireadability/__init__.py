@@ -4,12 +4,30 @@ from .scireadability import (
     # Configuration
     set_rounding,
     set_rm_apostrophe,
+    set_lexicon_backend,
+    set_read_only,
+    warmup,
+    set_word_cache_size,
+    word_cache_info,
+    set_document_cache_size,
+    document_cache_info,
+    enable_stats,
+    stats,
+    reset_stats,
+    profile,
+    # Text profiles
+    TextProfile,
+    analyze,
+    METRICS,
     # Dictionary management
     add_word_to_dictionary,
+    add_words_to_dictionary,
     add_words_from_file_to_dictionary,
+    export_dictionary,
     overwrite_dictionary,
     revert_dictionary_to_default,
     print_dictionary,
+    load_cmu_pronunciations,
     # Core stats
     char_count,
     letter_count,
@@ -51,17 +69,56 @@ from .scireadability import (
     remove_punctuation,
     _cache_clear,
 )
+from .analyzer import Analyzer, Config
+from .batch import analyze_many
+from .frames import score_frame
+from .streaming import StreamProfile, analyze_stream
+from .incremental import Document, DocumentProfile
+from .windows import WindowScores, readability_profile
 
 __all__ = [
     # Configuration
     "set_rounding",
     "set_rm_apostrophe",
+    "set_lexicon_backend",
+    "set_read_only",
+    "warmup",
+    "set_word_cache_size",
+    "word_cache_info",
+    "set_document_cache_size",
+    "document_cache_info",
+    "enable_stats",
+    "stats",
+    "reset_stats",
+    "profile",
+    # Configuration objects
+    "Config",
+    "Analyzer",
+    # Text profiles
+    "TextProfile",
+    "analyze",
+    "METRICS",
+    # Batch scoring
+    "analyze_many",
+    "score_frame",
+    # Streaming
+    "analyze_stream",
+    "StreamProfile",
+    # Incremental editing
+    "Document",
+    "DocumentProfile",
+    # Sliding windows
+    "readability_profile",
+    "WindowScores",
     # Dictionary management
     "add_word_to_dictionary",
+    "add_words_to_dictionary",
     "add_words_from_file_to_dictionary",
+    "export_dictionary",
     "overwrite_dictionary",
     "revert_dictionary_to_default",
     "print_dictionary",
+    "load_cmu_pronunciations",
     # Core stats
     "char_count",
     "letter_count",
@@ -0,0 +1,249 @@
+"""Asyncio front end for services that score texts inside an event loop.
+
+Texts shorter than `inline_chars` are scored directly in the loop, where an
+executor round trip would cost more than the work. Longer texts are scored in
+a managed thread pool (or process pool, see `configure`). At most
+`max_pending` jobs are in flight at once; further calls wait for a free slot,
+which gives backpressure to callers that produce texts faster than they can
+be scored. Cancelling a call cancels its job if it hasn't started yet, and
+otherwise discards its result.
+"""
+
+import asyncio
+import os
+import weakref
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Union,
+)
+
+from . import scireadability as _core
+from .batch import _init_worker, _worker_settings
+from .scireadability import DEFAULT_METRICS, METRICS, TextProfile
+
+Scores = Dict[str, Any]
+
+# counts that, once computed, fill in every other count of a profile
+_FILL_COUNTS = (
+    "_is_blank",
+    "char_count",
+    "letter_count",
+    "sentence_count",
+    "syllable_count",
+    "_syllables",
+    "_linsear_counts",
+)
+
+_executor: Optional[Executor] = None
+_owns_executor = False
+_kind = "thread"
+_max_workers: Optional[int] = None
+_max_pending: Optional[int] = None
+_inline_chars = 1000
+_semaphores: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+
+def configure(
+    executor: Union[str, Executor] = "thread",
+    max_workers: Optional[int] = None,
+    max_pending: Optional[int] = None,
+    inline_chars: int = 1000,
+) -> None:
+    """Sets how texts are offloaded.
+
+    `executor` is "thread", "process" or an Executor you manage yourself.
+    Managed pools have `max_workers` workers (default: CPU count) and are
+    started on first use; a process pool copies the module's apostrophe,
+    rounding and lexicon settings when it starts. `max_pending` bounds the
+    jobs in flight (default: twice the workers). Texts shorter than
+    `inline_chars` characters are scored in the event loop.
+    """
+    global _executor, _owns_executor, _kind, _max_workers, _max_pending
+    global _inline_chars
+    if max_workers is not None and max_workers < 1:
+        raise ValueError("max_workers must be a positive integer.")
+    if max_pending is not None and max_pending < 1:
+        raise ValueError("max_pending must be a positive integer.")
+    shutdown()
+    if isinstance(executor, Executor):
+        _executor, _owns_executor = executor, False
+        _kind = "process" if isinstance(executor, ProcessPoolExecutor) else "thread"
+    elif executor in ("thread", "process"):
+        _kind = executor
+    else:
+        raise ValueError(f"Unknown executor: {executor}")
+    _max_workers = max_workers
+    _max_pending = max_pending
+    _inline_chars = inline_chars
+    _semaphores.clear()
+
+
+def shutdown(wait: bool = True) -> None:
+    """Shuts down the managed pool, if one was started. A new one is started
+    on the next offloaded call."""
+    global _executor, _owns_executor
+    if _executor is not None and _owns_executor:
+        _executor.shutdown(wait=wait, cancel_futures=True)
+    _executor, _owns_executor = None, False
+
+
+def _workers() -> int:
+    return _max_workers or os.cpu_count() or 1
+
+
+def _get_executor() -> Executor:
+    global _executor, _owns_executor
+    if _executor is None:
+        if _kind == "process":
+            _executor = ProcessPoolExecutor(
+                max_workers=_workers(),
+                initializer=_init_worker,
+                initargs=(_worker_settings(),),
+            )
+        else:
+            _executor = ThreadPoolExecutor(
+                max_workers=_workers(), thread_name_prefix="scireadability"
+            )
+        _owns_executor = True
+    return _executor
+
+
+def _pending_limit() -> int:
+    return _max_pending or 2 * _workers()
+
+
+def _semaphore(loop: asyncio.AbstractEventLoop) -> asyncio.Semaphore:
+    # asyncio primitives belong to one event loop, so each loop gets its own
+    semaphore = _semaphores.get(loop)
+    if semaphore is None:
+        semaphore = _semaphores[loop] = asyncio.Semaphore(_pending_limit())
+    return semaphore
+
+
+async def _run(text: str, job, *args):
+    if len(text) < _inline_chars:
+        return job(text, *args)
+    loop = asyncio.get_running_loop()
+    async with _semaphore(loop):
+        return await loop.run_in_executor(_get_executor(), job, text, *args)
+
+
+# --- jobs, run in the executor ---
+def _profile_job(text: str) -> TextProfile:
+    profile = _core.analyze(text)
+    for name in _FILL_COUNTS:
+        getattr(profile, name)
+    return profile
+
+
+def _counts_job(text: str) -> Dict:
+    # a process pool sends back only the counts, not the tokens
+    return _profile_job(text).counts
+
+
+def _scores_job(
+    text: str, metrics: tuple, rounding: Optional[bool], points: Optional[int]
+) -> Scores:
+    return _core.analyze(text).scores(metrics, rounding, points)
+
+
+def _text_standard_job(text: str, as_string: bool) -> Union[float, str]:
+    return _core.text_standard(text, as_string)
+
+
+# --- public API ---
+async def analyze(text: str) -> TextProfile:
+    """Returns a TextProfile of a text with every count already computed, so
+    reading its formulas doesn't block the loop."""
+    if _kind == "process" and len(text) >= _inline_chars:
+        return TextProfile(text, await _run(text, _counts_job))
+    return await _run(text, _profile_job)
+
+
+async def score(
+    text: str,
+    name: str,
+    rounding: Optional[bool] = None,
+    points: Optional[int] = None,
+) -> Union[float, int, str]:
+    """Returns one statistic or formula (any of `METRICS`) for a text."""
+    return (await scores(text, [name], rounding, points))[name]
+
+
+async def scores(
+    text: str,
+    metrics: Optional[Iterable[str]] = None,
+    rounding: Optional[bool] = None,
+    points: Optional[int] = None,
+) -> Scores:
+    """Returns a dict of the requested metrics (default: all formulas)."""
+    metrics = _metrics(metrics)
+    return await _run(text, _scores_job, metrics, rounding, points)
+
+
+async def text_standard(text: str, as_string: bool = True) -> Union[float, str]:
+    """Returns the consensus grade level of a text."""
+    return await _run(text, _text_standard_job, as_string)
+
+
+async def analyze_many(
+    texts: Union[Iterable[str], AsyncIterable[str]],
+    metrics: Optional[Iterable[str]] = None,
+    rounding: Optional[bool] = None,
+    points: Optional[int] = None,
+) -> AsyncIterator[Scores]:
+    """Scores texts from an iterable or async iterable, yielding score dicts
+    in input order. Texts are read only as fast as results are consumed, with
+    up to `max_pending` being scored at a time. Closing the iterator early
+    cancels the outstanding jobs."""
+    metrics = _metrics(metrics)
+    limit = _pending_limit()
+    pending: deque = deque()
+    try:
+        async for text in _aiter(texts):
+            job = _run(text, _scores_job, metrics, rounding, points)
+            pending.append(asyncio.ensure_future(job))
+            if len(pending) >= limit:
+                yield await pending.popleft()
+        while pending:
+            yield await pending.popleft()
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+async def scores_many(
+    texts: Union[Iterable[str], AsyncIterable[str]],
+    metrics: Optional[Iterable[str]] = None,
+    rounding: Optional[bool] = None,
+    points: Optional[int] = None,
+) -> List[Scores]:
+    """Scores many texts concurrently and returns their score dicts in input
+    order."""
+    results = analyze_many(texts, metrics, rounding, points)
+    return [result async for result in results]
+
+
+def _metrics(metrics: Optional[Iterable[str]]) -> tuple:
+    metrics = tuple(metrics) if metrics is not None else DEFAULT_METRICS
+    for name in metrics:
+        if name not in METRICS:
+            raise ValueError(f"Unknown metric: {name}")
+    return metrics
+
+
+async def _aiter(texts):
+    if hasattr(texts, "__aiter__"):
+        async for text in texts:
+            yield text
+    else:
+        for text in texts:
+            yield text
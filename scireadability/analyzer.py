@@ -0,0 +1,158 @@
+import threading
+from dataclasses import dataclass, replace
+from typing import Dict, Iterable, Mapping, Optional, Tuple, Union
+
+from . import scireadability as _core
+from .caching import (
+    CacheInfo,
+    DocumentCache,
+    DocumentCacheInfo,
+    WordCache,
+    content_digest,
+    content_key,
+)
+from .lexicon import LEXICON_BACKENDS, Lexicon, with_custom_dict
+from .scireadability import TextProfile, _lookup_word_syllables
+
+
+@dataclass(frozen=True)
+class Config:
+    """Settings of an `Analyzer`.
+
+    `rounding` and `points` are the defaults that per-call arguments
+    override, as with `set_rounding`. `custom_dict` maps words to syllable
+    counts and replaces the user's custom dictionary; None keeps it. It is
+    stored as a sorted tuple of (lowercase word, count) pairs, so configs are
+    hashable.
+    """
+
+    rounding: bool = False
+    points: Optional[int] = None
+    rm_apostrophe: bool = False
+    lexicon_backend: str = "memory"
+    custom_dict: Optional[Tuple[Tuple[str, int], ...]] = None
+
+    def __post_init__(self):
+        if self.lexicon_backend not in LEXICON_BACKENDS:
+            raise ValueError(
+                f"Unknown lexicon backend: {self.lexicon_backend}. "
+                f"Choose from {LEXICON_BACKENDS}."
+            )
+        if self.custom_dict is not None:
+            items = (
+                self.custom_dict.items()
+                if isinstance(self.custom_dict, Mapping)
+                else self.custom_dict
+            )
+            custom = {str(word).lower(): int(syls) for word, syls in items}
+            object.__setattr__(self, "custom_dict", tuple(sorted(custom.items())))
+
+
+def _load_lexicon(config: Config) -> Lexicon:
+    if config.lexicon_backend == _core._lexicon_backend:
+        # a snapshot of the module's lexicon; later dictionary edits update
+        # the module's custom dictionary in place, so it gets its own copy
+        base = _core._get_lexicon()
+        if config.custom_dict is None and isinstance(base.custom, dict):
+            return base._replace(custom=dict(base.custom))
+    else:
+        base = _core._load_lexicon(config.lexicon_backend)
+    if config.custom_dict is None:
+        return base
+    return with_custom_dict(base, dict(config.custom_dict))
+
+
+class Analyzer:
+    """Scores texts under one immutable `Config`.
+
+    An analyzer never reads or changes the module-level settings. It has its
+    own word and document caches and loads its lexicon once, on first use, so
+    analyzers with different configurations can serve many threads at once
+    without clearing each other's caches. Results equal those of the module
+    functions under the same settings.
+
+        analyzer = Analyzer(Config(rounding=True, rm_apostrophe=True))
+        analyzer.score(text, "gunning_fog")
+    """
+
+    def __init__(
+        self,
+        config: Optional[Config] = None,
+        word_cache_size: int = 32768,
+        document_cache_bytes: int = 8 * 2**20,
+    ):
+        self.config = config if config is not None else Config()
+        self._word_cache = WordCache(word_cache_size)
+        self._document_cache = DocumentCache(document_cache_bytes)
+        self._lexicon_lock = threading.Lock()
+        self._loaded: Optional[Lexicon] = None
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.config!r})"
+
+    def replace(self, **changes) -> "Analyzer":
+        """Returns a new analyzer, with its own caches, whose config differs
+        from this one's by `changes`."""
+        return Analyzer(replace(self.config, **changes))
+
+    def _lexicon(self) -> Lexicon:
+        lexicon = self._loaded
+        if lexicon is None:
+            with self._lexicon_lock:
+                if self._loaded is None:
+                    self._loaded = _load_lexicon(self.config)
+                lexicon = self._loaded
+        return lexicon
+
+    def _word_syllables(self, word: str) -> int:
+        syls = self._word_cache.get(word)
+        if syls is None:
+            syls = _lookup_word_syllables(word, self._lexicon())
+            self._word_cache.put(word, syls)
+        return syls
+
+    def warmup(self) -> None:
+        """Loads the lexicon now rather than on first use."""
+        self._lexicon()
+
+    def analyze(self, text: str) -> TextProfile:
+        """Returns a TextProfile of a text, reusing any counts this analyzer
+        already computed for the same text."""
+        key = content_key(text)
+        digest = content_digest(text)
+        counts = self._document_cache.get(key, digest)
+        if counts is None:
+            counts = self._document_cache.create(key, digest)
+        profile = TextProfile(text, counts, analyzer=self)
+        profile._cache_key = key
+        return profile
+
+    def score(
+        self,
+        text: str,
+        name: str,
+        rounding: Optional[bool] = None,
+        points: Optional[int] = None,
+    ) -> Union[float, int, str]:
+        """Returns one statistic or formula (any of `METRICS`) for a text."""
+        return self.analyze(text).score(name, rounding, points)
+
+    def scores(
+        self,
+        text: str,
+        metrics: Optional[Iterable[str]] = None,
+        rounding: Optional[bool] = None,
+        points: Optional[int] = None,
+    ) -> Dict[str, Union[float, int, str]]:
+        """Returns a dict of the requested metrics (default: all formulas)."""
+        return self.analyze(text).scores(metrics, rounding, points)
+
+    def text_standard(self, text: str, as_string: bool = True) -> Union[float, str]:
+        """Returns the consensus grade level of a text."""
+        return self.analyze(text).text_standard(as_string)
+
+    def word_cache_info(self) -> CacheInfo:
+        return self._word_cache.info()
+
+    def document_cache_info(self) -> DocumentCacheInfo:
+        return self._document_cache.info()
@@ -0,0 +1,146 @@
+import itertools
+import os
+from collections import deque
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from . import scireadability as _core
+from .scireadability import DEFAULT_METRICS, METRICS, TextProfile
+
+Scores = Dict[str, Any]
+
+
+# --- worker side ---
+def _read_only_settings() -> Tuple[bool, Optional[Dict[str, int]], Optional[str]]:
+    return _core._read_only, _core._read_only_custom, _core._read_only_lexicon_path
+
+
+def _worker_settings() -> Tuple[bool, bool, Optional[int], str, Tuple]:
+    """The module settings a worker process needs to score like this one."""
+    return (
+        _core._rm_apostrophe,
+        _core._round_outputs,
+        _core._round_points,
+        _core._lexicon_backend,
+        _read_only_settings(),
+    )
+
+
+def _init_worker(settings: Tuple[bool, bool, Optional[int], str, Tuple]) -> None:
+    """Applies the parent's settings and loads the lexicons once per worker."""
+    rm_apostrophe, round_outputs, round_points, lexicon_backend, read_only = settings
+    if _read_only_settings() != read_only:
+        _core.set_read_only(*read_only)
+    if _core._lexicon_backend != lexicon_backend:
+        _core.set_lexicon_backend(lexicon_backend)
+    if _core._rm_apostrophe != rm_apostrophe:
+        _core.set_rm_apostrophe(rm_apostrophe)
+    _core.set_rounding(round_outputs, round_points)
+    _core.warmup()
+
+
+def _score_chunk(
+    texts: List[str],
+    metrics: Tuple[str, ...],
+    rounding: Optional[bool],
+    points: Optional[int],
+) -> List[Scores]:
+    """Scores a chunk of texts. Profiles are not cached, so a worker never
+    keeps documents alive between chunks."""
+    return [TextProfile(text).scores(metrics, rounding, points) for text in texts]
+
+
+# --- parent side ---
+def _chunked(texts: Iterable[str], chunksize: int) -> Iterator[Tuple[int, List[str]]]:
+    """Yields (index of first text, texts) chunks without materializing the input."""
+    iterator = iter(texts)
+    start = 0
+    while True:
+        chunk = list(itertools.islice(iterator, chunksize))
+        if not chunk:
+            return
+        yield start, chunk
+        start += len(chunk)
+
+
+def _analyze_inline(chunks, metrics, rounding, points, ordered):
+    for start, chunk in chunks:
+        for offset, result in enumerate(_score_chunk(chunk, metrics, rounding, points)):
+            yield result if ordered else (start + offset, result)
+
+
+def _analyze_parallel(chunks, metrics, rounding, points, ordered, workers):
+    # Imported here so that `import scireadability` doesn't pay for
+    # concurrent.futures and multiprocessing.
+    from concurrent.futures import (
+        FIRST_COMPLETED,
+        ProcessPoolExecutor,
+        as_completed,
+        wait,
+    )
+
+    executor = ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=(_worker_settings(),)
+    )
+    # Two chunks in flight per worker keeps every core busy while bounding how
+    # much of the input is held in memory at once.
+    max_pending = 2 * workers
+    try:
+        if ordered:
+            queue = deque()
+            for start, chunk in chunks:
+                queue.append(
+                    executor.submit(_score_chunk, chunk, metrics, rounding, points)
+                )
+                if len(queue) >= max_pending:
+                    yield from queue.popleft().result()
+            while queue:
+                yield from queue.popleft().result()
+        else:
+            pending = {}
+            for start, chunk in chunks:
+                future = executor.submit(_score_chunk, chunk, metrics, rounding, points)
+                pending[future] = start
+                if len(pending) >= max_pending:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        start = pending.pop(future)
+                        yield from enumerate(future.result(), start)
+            for future in as_completed(list(pending)):
+                start = pending.pop(future)
+                yield from enumerate(future.result(), start)
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def analyze_many(
+    texts: Iterable[str],
+    metrics: Optional[Iterable[str]] = None,
+    workers: Optional[int] = None,
+    chunksize: int = 64,
+    ordered: bool = True,
+    rounding: Optional[bool] = None,
+    points: Optional[int] = None,
+) -> Iterator[Any]:
+    """Scores many texts across a pool of worker processes.
+
+    `texts` may be any iterable, including a generator; it is consumed lazily,
+    so only a few chunks per worker are held in memory at once. Each result is
+    a dict mapping metric names (any of `METRICS`) to values, defaulting to all
+    formulas. With `ordered=False`, results are yielded as soon as they are
+    ready, as `(index, result)` pairs. `workers=1` scores in the calling
+    process without starting a pool.
+    """
+    metrics = tuple(metrics) if metrics is not None else DEFAULT_METRICS
+    for name in metrics:
+        if name not in METRICS:
+            raise ValueError(f"Unknown metric: {name}")
+    if chunksize < 1:
+        raise ValueError("chunksize must be a positive integer.")
+    workers = workers if workers is not None else os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError("workers must be a positive integer.")
+
+    chunks = _chunked(texts, chunksize)
+    if workers == 1:
+        return _analyze_inline(chunks, metrics, rounding, points, ordered)
+    return _analyze_parallel(chunks, metrics, rounding, points, ordered, workers)
@@ -0,0 +1,264 @@
+import hashlib
+import sys
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, NamedTuple, Optional, Tuple
+
+# approximate bytes a dict spends per item, besides the value itself
+_SLOT_BYTES = 48
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: int
+    currsize: int
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class DocumentCacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    maxbytes: int
+    currbytes: int
+    entries: int
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+def content_key(text: str) -> Tuple[int, int]:
+    """A cheap fingerprint of a text, used instead of the text as a cache key.
+
+    Python caches str hashes on the string, so scoring the same string with
+    several functions hashes it only once. The hash is only 64 bits and, with
+    a fixed PYTHONHASHSEED, predictable, so texts can collide; the document
+    cache checks a `content_digest` on every hit.
+    """
+    return hash(text), len(text)
+
+
+# the last text digested, with its digest
+_last_digest: Tuple[Optional[str], bytes] = (None, b"")
+
+
+def content_digest(text: str) -> bytes:
+    """A collision-resistant digest of a text, stored alongside a document
+    cache entry so that texts with equal `content_key`s never share counts.
+
+    Like str hashes, the digest of the last text is remembered (which keeps
+    that one text alive), so scoring the same string with several functions
+    in a row digests it only once.
+    """
+    global _last_digest
+    last_text, digest = _last_digest
+    if last_text is not text:
+        data = text.encode("utf-8", "surrogatepass")
+        digest = hashlib.sha256(data).digest()
+        _last_digest = (text, digest)
+    return digest
+
+
+def _sizeof(obj: Any) -> int:
+    if isinstance(obj, tuple):
+        return sys.getsizeof(obj) + sum(sys.getsizeof(item) for item in obj)
+    return sys.getsizeof(obj)
+
+
+class WordCache:
+    """A bounded LRU cache for per-word values such as syllable counts.
+
+    Unlike `functools.lru_cache`, single entries can be evicted (when one
+    dictionary word changes) and the cache can be resized in place. Hits never
+    take the lock; the statistics may undercount slightly under heavy thread
+    contention.
+    """
+
+    def __init__(self, maxsize: int = 32768):
+        self._entries: "OrderedDict[Hashable, int]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Optional[int]:
+        """Returns the cached value, or None (counted as a miss)."""
+        try:
+            value = self._entries[key]
+            self._entries.move_to_end(key)
+        except KeyError:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return value
+
+    def put(self, key: Hashable, value: int) -> None:
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._entries[key] = value
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def discard(self, key: Hashable) -> None:
+        """Drops one entry, if present."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def resize(self, maxsize: int) -> None:
+        """Changes the capacity, evicting the oldest entries if needed."""
+        if maxsize < 0:
+            raise ValueError("Cache size must be zero or a positive integer.")
+        with self._lock:
+            self.maxsize = maxsize
+            while len(self._entries) > maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def reset_stats(self) -> None:
+        """Zeroes the hit, miss and eviction counters, keeping the entries."""
+        self.hits = self.misses = self.evictions = 0
+
+    def clear(self) -> None:
+        """Drops every entry and resets the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self.reset_stats()
+
+    def info(self) -> CacheInfo:
+        return CacheInfo(
+            self.hits, self.misses, self.evictions, self.maxsize, len(self._entries)
+        )
+
+
+class DocumentCache:
+    """Per-document statistics, bounded by an approximate byte budget.
+
+    Each entry is a dict of small values (counts, not tokens) keyed by a
+    content key plus configuration, so the cache never keeps a text alive.
+    Entries created with a digest are only returned to lookups that give the
+    same digest.
+    Entries are filled in after they are created, through :meth:`add`, which
+    charges each value to the budget and evicts the least recently used
+    documents once it is exceeded.
+    """
+
+    def __init__(self, maxbytes: int = 8 * 2**20):
+        self._entries: "OrderedDict[Hashable, Dict[Hashable, Any]]" = OrderedDict()
+        self._sizes: Dict[Hashable, int] = {}
+        self._digests: Dict[Hashable, Optional[bytes]] = {}
+        self._lock = threading.Lock()
+        self.maxbytes = maxbytes
+        self.currbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(
+        self, key: Hashable, digest: Optional[bytes] = None
+    ) -> Optional[Dict[Hashable, Any]]:
+        """Returns the entry for a key, or None (counted as a miss) if there is
+        none or it was created with a different digest."""
+        try:
+            entry = self._entries[key]
+            if self._digests[key] != digest:
+                raise KeyError(key)
+            self._entries.move_to_end(key)
+        except KeyError:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return entry
+
+    def create(
+        self, key: Hashable, digest: Optional[bytes] = None
+    ) -> Dict[Hashable, Any]:
+        """Returns a new, empty entry for a key, replacing any other. It is only
+        stored if it fits in the budget."""
+        entry: Dict[Hashable, Any] = {}
+        size = _sizeof(key) + sys.getsizeof(entry) + _sizeof(digest)
+        if size > self.maxbytes:
+            return entry
+        with self._lock:
+            self._discard(key)
+            self._entries[key] = entry
+            self._digests[key] = digest
+            self._sizes[key] = size
+            self.currbytes += size
+            self._evict()
+        return entry
+
+    def add(
+        self, key: Hashable, entry: Dict[Hashable, Any], name: Hashable, value: Any
+    ) -> None:
+        """Sets ``entry[name]``, charging it to the budget if the entry is
+        still cached."""
+        entry[name] = value
+        with self._lock:
+            if self._entries.get(key) is not entry:
+                return
+            size = _SLOT_BYTES + _sizeof(value)
+            if isinstance(name, tuple):
+                size += _sizeof(name)
+            self._sizes[key] += size
+            self.currbytes += size
+            self._evict()
+
+    def _discard(self, key: Hashable) -> None:
+        if self._entries.pop(key, None) is not None:
+            del self._digests[key]
+            self.currbytes -= self._sizes.pop(key)
+
+    def _evict(self) -> None:
+        while self.currbytes > self.maxbytes and self._entries:
+            key, _ = self._entries.popitem(last=False)
+            del self._digests[key]
+            self.currbytes -= self._sizes.pop(key)
+            self.evictions += 1
+
+    def resize(self, maxbytes: int) -> None:
+        """Changes the budget, evicting the oldest entries if needed."""
+        if maxbytes < 0:
+            raise ValueError("Cache size must be zero or a positive integer.")
+        with self._lock:
+            self.maxbytes = maxbytes
+            self._evict()
+
+    def reset_stats(self) -> None:
+        """Zeroes the hit, miss and eviction counters, keeping the entries."""
+        self.hits = self.misses = self.evictions = 0
+
+    def clear(self) -> None:
+        """Drops every entry and resets the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._sizes.clear()
+            self._digests.clear()
+            self.currbytes = 0
+            self.reset_stats()
+
+    def info(self) -> DocumentCacheInfo:
+        return DocumentCacheInfo(
+            self.hits,
+            self.misses,
+            self.evictions,
+            self.maxbytes,
+            self.currbytes,
+            len(self._entries),
+        )
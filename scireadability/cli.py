@@ -0,0 +1,289 @@
+import argparse
+import csv
+import json
+import os
+import sys
+from collections import deque
+from pathlib import Path
+from typing import IO, Dict, Iterator, List, Optional, Tuple
+
+from . import lexicon
+from .batch import analyze_many
+from .scireadability import DEFAULT_METRICS, METRICS
+
+Record = Tuple[str, str]  # (id, text)
+
+INPUT_FORMATS = ("text", "jsonl", "csv")
+OUTPUT_FORMATS = ("jsonl", "csv")
+_EXTENSION_FORMATS = {".jsonl": "jsonl", ".ndjson": "jsonl", ".csv": "csv"}
+
+
+def _positive_int(value: str) -> int:
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer: {value}")
+    return number
+
+
+def _lexicon_command(args: argparse.Namespace) -> int:
+    if args.action == "build":
+        print(lexicon.build_lexicon(args.output))
+        return 0
+    current = lexicon.is_up_to_date(args.output)
+    print(f"{args.output}: {'up to date' if current else 'stale'}")
+    return 0 if current else 1
+
+
+# --- score: input ---
+def _input_paths(inputs: List[str], pattern: str) -> Iterator[str]:
+    """Expands directories (recursively, in sorted order) into the files
+    matching `pattern`; "-" stands for stdin."""
+    for name in inputs:
+        if name != "-" and os.path.isdir(name):
+            for path in sorted(Path(name).rglob(pattern)):
+                if path.is_file():
+                    yield str(path)
+        else:
+            yield name
+
+
+def _input_format(path: str, requested: Optional[str]) -> str:
+    if requested:
+        return requested
+    return _EXTENSION_FORMATS.get(os.path.splitext(path)[1].lower(), "text")
+
+
+def _read_records(
+    name: str, stream: IO[str], fmt: str, text_field: str, id_field: Optional[str]
+) -> Iterator[Record]:
+    if fmt == "text":
+        yield name, stream.read()
+        return
+    if fmt == "jsonl":
+        rows = (
+            (number, json.loads(line))
+            for number, line in enumerate(stream, 1)
+            if line.strip()
+        )
+    else:
+        rows = enumerate(csv.DictReader(stream), 2)  # line 1 is the header
+    for number, row in rows:
+        if text_field not in row:
+            raise ValueError(f"{name}:{number}: no field {text_field!r}")
+        record_id = row.get(id_field) if id_field else None
+        text = row[text_field]
+        yield (
+            str(record_id) if record_id is not None else f"{name}:{number}",
+            text if text is not None else "",
+        )
+
+
+def _records(args: argparse.Namespace) -> Iterator[Record]:
+    for path in _input_paths(args.inputs or ["-"], args.glob):
+        fmt = _input_format(path, args.input_format)
+        if path == "-":
+            yield from _read_records(
+                "<stdin>", sys.stdin, fmt, args.text_field, args.id_field
+            )
+            continue
+        with open(path, encoding="utf-8", newline="") as stream:
+            yield from _read_records(path, stream, fmt, args.text_field, args.id_field)
+
+
+# --- score: checkpoints ---
+def _load_checkpoint(path: str, signature: Dict) -> Tuple[int, int]:
+    """Returns (records done, output bytes written) from a checkpoint, or
+    (0, 0) if there is none."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            state = json.load(f)
+    except FileNotFoundError:
+        return 0, 0
+    if state.get("signature") != signature:
+        raise SystemExit(
+            f"scireadability score: {path} was written for different inputs or options"
+        )
+    return state["records"], state["offset"]
+
+
+def _save_checkpoint(path: str, signature: Dict, records: int, offset: int) -> None:
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump({"signature": signature, "records": records, "offset": offset}, f)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+# --- score: output ---
+class _Writer:
+    def __init__(self, stream: IO[str], fmt: str, fields: List[str], header: bool):
+        self.stream = stream
+        self.fmt = fmt
+        if fmt == "csv":
+            self._csv = csv.DictWriter(stream, fieldnames=fields)
+            if header:
+                self._csv.writeheader()
+
+    def write(self, row: Dict) -> None:
+        if self.fmt == "csv":
+            self._csv.writerow(row)
+        else:
+            self.stream.write(json.dumps(row) + "\n")
+
+
+def _score_command(args: argparse.Namespace) -> int:
+    metrics = tuple(args.metrics) if args.metrics else DEFAULT_METRICS
+    for name in metrics:
+        if name not in METRICS:
+            raise SystemExit(f"scireadability score: unknown metric {name!r}")
+    if args.checkpoint and args.output in (None, "-"):
+        raise SystemExit("scireadability score: --checkpoint requires --output")
+
+    signature = {
+        "inputs": args.inputs,
+        "glob": args.glob,
+        "input_format": args.input_format,
+        "text_field": args.text_field,
+        "id_field": args.id_field,
+        "metrics": list(metrics),
+        "format": args.format,
+    }
+    done, offset = (
+        _load_checkpoint(args.checkpoint, signature) if args.checkpoint else (0, 0)
+    )
+
+    to_stdout = args.output in (None, "-")
+    if to_stdout:
+        output = sys.stdout
+    elif done:
+        if not os.path.exists(args.output) or os.path.getsize(args.output) < offset:
+            raise SystemExit(
+                f"scireadability score: {args.output} is shorter than its checkpoint"
+            )
+        output = open(args.output, "r+", encoding="utf-8", newline="")
+        # drop anything written after the last checkpoint
+        output.seek(offset)
+        output.truncate()
+    else:
+        output = open(args.output, "w", encoding="utf-8", newline="")
+    writer = _Writer(output, args.format, ["id", *metrics], header=not done)
+
+    records = _records(args)
+    for _ in range(done):
+        next(records, None)
+    ids: deque = deque()
+
+    def texts() -> Iterator[str]:
+        for record_id, text in records:
+            ids.append(record_id)
+            yield text
+
+    results = analyze_many(
+        texts(), metrics=metrics, workers=args.workers, chunksize=args.chunksize
+    )
+    try:
+        for scores in results:
+            writer.write({"id": ids.popleft(), **scores})
+            done += 1
+            if args.checkpoint and done % args.checkpoint_every == 0:
+                output.flush()
+                _save_checkpoint(args.checkpoint, signature, done, output.tell())
+        output.flush()
+        if args.checkpoint:
+            _save_checkpoint(args.checkpoint, signature, done, output.tell())
+    finally:
+        if not to_stdout:
+            output.close()
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="scireadability",
+        description="Readability statistics for English (scientific) texts.",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    lexicon_parser = commands.add_parser(
+        "lexicon", help="build or check the compiled lexicon"
+    )
+    lexicon_parser.add_argument("action", choices=["build", "check"])
+    lexicon_parser.add_argument(
+        "--output",
+        default=lexicon.default_lexicon_path(),
+        help="lexicon file (default: %(default)s)",
+    )
+    lexicon_parser.set_defaults(handler=_lexicon_command)
+
+    score_parser = commands.add_parser(
+        "score", help="score files, directories, JSONL or CSV records"
+    )
+    score_parser.add_argument(
+        "inputs",
+        nargs="*",
+        help="files or directories to score; '-' or nothing reads stdin",
+    )
+    score_parser.add_argument(
+        "--glob",
+        default="*.txt",
+        help="files to take from directories, recursively (default: %(default)s)",
+    )
+    score_parser.add_argument(
+        "--input-format",
+        choices=INPUT_FORMATS,
+        help="how to read inputs (default: by extension, .jsonl/.csv or text)",
+    )
+    score_parser.add_argument(
+        "--text-field",
+        default="text",
+        help="JSONL/CSV field holding the text (default: %(default)s)",
+    )
+    score_parser.add_argument(
+        "--id-field",
+        help="JSONL/CSV field to copy into the output id (default: file:line)",
+    )
+    score_parser.add_argument(
+        "--metrics",
+        type=lambda value: [
+            name for name in (part.strip() for part in value.split(",")) if name
+        ],
+        help="comma-separated metrics to compute (default: all formulas)",
+    )
+    score_parser.add_argument(
+        "--format",
+        choices=OUTPUT_FORMATS,
+        default="jsonl",
+        help="output format (default: %(default)s)",
+    )
+    score_parser.add_argument(
+        "-o", "--output", help="output file (default: stdout)"
+    )
+    score_parser.add_argument(
+        "--workers",
+        type=_positive_int,
+        default=None,
+        help="worker processes (default: CPU count; 1 scores in-process)",
+    )
+    score_parser.add_argument("--chunksize", type=_positive_int, default=64)
+    score_parser.add_argument(
+        "--checkpoint",
+        help="file recording progress; rerunning with it resumes an interrupted run",
+    )
+    score_parser.add_argument(
+        "--checkpoint-every",
+        type=_positive_int,
+        default=1000,
+        help="records between checkpoints (default: %(default)s)",
+    )
+    score_parser.set_defaults(handler=_score_command)
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
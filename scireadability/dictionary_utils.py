@@ -1,14 +1,29 @@
 from appdirs import user_config_dir
-from importlib.resources import files
+from contextlib import contextmanager
 import json
 import os
+import tempfile
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
 
 PACKAGE_NAME = "scireadability"
+# The user dictionary is a JSON snapshot plus a log of the terms added since,
+# one JSON object of {word: syllables} per line. The log is folded into the
+# snapshot once it grows past this size.
+LOG_COMPACT_BYTES = 1 << 20
 
 
 def _read_package_resource(resource_path: str) -> bytes:
     """Reads a package resource file and returns its contents as bytes."""
-    return files("scireadability").joinpath(resource_path).read_bytes()
+    # importlib.resources is slow to import, so it is only loaded once a
+    # resource is actually read.
+    from importlib.resources import files
+
+    return files(PACKAGE_NAME).joinpath(resource_path).read_bytes()
 
 
 def _get_default_dict_path():
@@ -16,21 +31,68 @@ def _get_default_dict_path():
     return "resources/en/custom_dict.json"
 
 
-def _get_user_dict_path():
-    """Returns the path to the user's custom dictionary in the config directory."""
+def _get_user_dict_path(create=False):
+    """Returns the path to the user's custom dictionary in the config directory,
+    creating the directory if `create` is set (only writers need it)."""
     config_dir = user_config_dir(PACKAGE_NAME)
     dict_dir = os.path.join(config_dir, "en")
-    os.makedirs(dict_dir, exist_ok=True)
+    if create:
+        os.makedirs(dict_dir, exist_ok=True)
     return os.path.join(dict_dir, "custom_dict.json")
 
 
-def load_custom_syllable_dict():
-    """Loads the custom syllable dictionary, prioritizing user overrides.
+def _get_user_log_path(user_dict_path):
+    """Returns the path to the log of terms added since the last snapshot."""
+    return os.path.splitext(user_dict_path)[0] + ".log"
+
+
+@contextmanager
+def _dict_lock(user_dict_path, exclusive=True):
+    """Holds a lock on the user dictionary, shared between processes."""
+    lock_path = os.path.splitext(user_dict_path)[0] + ".lock"
+    with open(lock_path, "a+b") as lock_file:
+        if fcntl is not None:
+            fcntl.flock(lock_file, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+        else:
+            # msvcrt has no shared locks; lock the first byte exclusively
+            lock_file.seek(0)
+            msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+            else:
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+def _read_log(log_path):
+    """Returns the terms recorded in the log, later lines winning. A last
+    line cut short by an interrupted write is ignored, and so is any line
+    that is corrupt or holds invalid terms."""
+    terms = {}
+    try:
+        with open(log_path, "rb") as f:
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break
+                try:
+                    line_terms = json.loads(line.decode("utf-8"))
+                    if not isinstance(line_terms, dict):
+                        raise ValueError("Not a dictionary of terms.")
+                    _validate_terms(line_terms)
+                except ValueError:
+                    continue
+                terms.update(line_terms)
+    except FileNotFoundError:
+        pass
+    return terms
 
-    Loads the dictionary from the user's config directory if it exists,
-    otherwise loads the default dictionary from the package resources.
-    """
-    user_dict_path = _get_user_dict_path()
+
+def _load_snapshot(user_dict_path, verbose=False):
+    """Loads the user's JSON dictionary, or the package default if the user
+    has none. `verbose` reports where the user's dictionary was loaded from."""
     default_dict_path = _get_default_dict_path()
     loaded_dict = {}
 
@@ -42,7 +104,10 @@ def load_custom_syllable_dict():
                 loaded_dict.update(
                     {k.lower(): v for k, v in user_data["CUSTOM_SYLLABLE_DICT"].items()}
                 )
-                print(f"Loaded custom dictionary from user config: {user_dict_path}")
+                if verbose:
+                    print(
+                        f"Loaded custom dictionary from user config: {user_dict_path}"
+                    )
                 return loaded_dict  # User dict takes precedence
     except FileNotFoundError:
         pass  # User dict is optional
@@ -68,6 +133,100 @@ def load_custom_syllable_dict():
     return loaded_dict
 
 
+def load_default_custom_dict():
+    """Loads the custom dictionary packaged with scireadability, without
+    reading the user's config directory or printing anything. Returns an empty
+    dictionary if the packaged one is missing or invalid."""
+    try:
+        default_data = json.loads(
+            _read_package_resource(_get_default_dict_path()).decode("utf-8")
+        )
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+    terms = default_data.get("CUSTOM_SYLLABLE_DICT", {})
+    return {k.lower(): v for k, v in terms.items()}
+
+
+def load_custom_syllable_dict():
+    """Loads the custom syllable dictionary, prioritizing user overrides.
+
+    Loads the dictionary from the user's config directory if it exists,
+    otherwise loads the default dictionary from the package resources, then
+    applies the terms added since it was last saved.
+    """
+    user_dict_path = _get_user_dict_path()
+    log_path = _get_user_log_path(user_dict_path)
+    if not os.path.exists(log_path):
+        return _load_snapshot(user_dict_path, verbose=True)
+    # a compaction rewrites the snapshot and empties the log; don't read
+    # one without the other
+    with _dict_lock(user_dict_path, exclusive=False):
+        loaded_dict = _load_snapshot(user_dict_path, verbose=True)
+        loaded_dict.update({k.lower(): v for k, v in _read_log(log_path).items()})
+    return loaded_dict
+
+
+def _write_snapshot(user_dict_path, dict_data):
+    """Replaces the user's JSON dictionary atomically and empties the log.
+    Call with the lock held."""
+    fd, tmp_path = tempfile.mkstemp(
+        dir=os.path.dirname(user_dict_path), suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as outfile:
+            json.dump(dict_data, outfile, indent=4)
+            outfile.flush()
+            os.fsync(outfile.fileno())
+        os.replace(tmp_path, user_dict_path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    log_path = _get_user_log_path(user_dict_path)
+    if os.path.exists(log_path):
+        os.remove(log_path)
+
+
+def _compact(user_dict_path):
+    """Folds the log into the JSON snapshot. Call with the lock held."""
+    current_dict = _load_snapshot(user_dict_path)
+    log_terms = _read_log(_get_user_log_path(user_dict_path))
+    current_dict.update({k.lower(): v for k, v in log_terms.items()})
+    _write_snapshot(user_dict_path, {"CUSTOM_SYLLABLE_DICT": current_dict})
+
+
+def _append_terms(terms):
+    """Records terms in the log in a single write, so a batch is added
+    completely or not at all. Returns the user dictionary path."""
+    user_dict_path = _get_user_dict_path(create=True)
+    line = json.dumps(terms, ensure_ascii=False).encode("utf-8") + b"\n"
+    with _dict_lock(user_dict_path):
+        with open(_get_user_log_path(user_dict_path), "a+b") as log:
+            size = log.seek(0, os.SEEK_END)
+            if size:
+                log.seek(size - 1)
+                if log.read(1) != b"\n":
+                    # drop a line cut short by an interrupted write
+                    log.seek(0)
+                    log.truncate(log.read().rfind(b"\n") + 1)
+            log.write(line)
+            size = log.tell()
+        if size > LOG_COMPACT_BYTES:
+            _compact(user_dict_path)
+    return user_dict_path
+
+
+def _validate_terms(terms):
+    for word, syllable_count in terms.items():
+        if not isinstance(word, str) or not word:
+            raise ValueError(f"Invalid word: {word!r}")
+        if (
+            not isinstance(syllable_count, int)
+            or isinstance(syllable_count, bool)
+            or syllable_count < 1
+        ):
+            raise ValueError("Syllable count must be a positive integer.")
+
+
 def overwrite_custom_dict(file_path):
     """Overwrites the user's custom dictionary with the contents of a given JSON file."""
     try:
@@ -81,9 +240,9 @@ def overwrite_custom_dict(file_path):
                     "Invalid dictionary format in provided file.  "
                     "Should be a JSON with 'CUSTOM_SYLLABLE_DICT' key."
                 )
-            user_dict_path = _get_user_dict_path()
-            with open(user_dict_path, "w", encoding="utf-8") as outfile:
-                json.dump(new_dict_data, outfile, indent=4)
+            user_dict_path = _get_user_dict_path(create=True)
+            with _dict_lock(user_dict_path):
+                _write_snapshot(user_dict_path, new_dict_data)
             print(
                 f"Custom dictionary overwritten with file: {file_path}. Saved to {user_dict_path}"
             )
@@ -101,22 +260,29 @@ def overwrite_custom_dict(file_path):
 
 def add_term_to_custom_dict(word, syllable_count):
     """Adds a single term to the user's custom dictionary."""
-    if not isinstance(syllable_count, int) or syllable_count < 1:
-        raise ValueError("Syllable count must be a positive integer.")
+    _validate_terms({word: syllable_count})
 
-    user_dict_path = _get_user_dict_path()
-    current_dict = load_custom_syllable_dict()
+    try:
+        user_dict_path = _append_terms({word: syllable_count})
+        print(
+            f"Added term '{word}': {syllable_count} syllables to custom dictionary. "
+            f"Saved to {user_dict_path}"
+        )
+    except Exception as e:
+        raise Exception(f"Error saving updated custom dictionary: {e}")
 
-    current_dict[word] = syllable_count
 
-    dict_data_to_save = {
-        "CUSTOM_SYLLABLE_DICT": current_dict
-    }  # Re-wrap for JSON structure
+def add_terms_to_custom_dict(terms):
+    """Adds or updates many terms ({word: syllables}) in the user's custom
+    dictionary in one transaction."""
+    terms = dict(terms)
+    _validate_terms(terms)
+    if not terms:
+        return
     try:
-        with open(user_dict_path, "w", encoding="utf-8") as outfile:
-            json.dump(dict_data_to_save, outfile, indent=4)
+        user_dict_path = _append_terms(terms)
         print(
-            f"Added term '{word}': {syllable_count} syllables to custom dictionary. "
+            f"Added {len(terms)} terms to custom dictionary. "
             f"Saved to {user_dict_path}"
         )
     except Exception as e:
@@ -143,17 +309,12 @@ def add_terms_from_file(file_path):
                 "The value associated with 'CUSTOM_SYLLABLE_DICT' key must be a dictionary."
             )
 
-        current_dict = load_custom_syllable_dict()
-        current_dict.update(new_terms_data)
-
-        dict_data_to_save = {"CUSTOM_SYLLABLE_DICT": current_dict}
-        user_dict_path = _get_user_dict_path()
-
-        with open(user_dict_path, "w", encoding="utf-8") as outfile:
-            json.dump(dict_data_to_save, outfile, indent=4)
-        print(
-            f"Added terms from file: {file_path}. Updated dictionary saved to {user_dict_path}"
-        )
+        _validate_terms(new_terms_data)
+        if new_terms_data:
+            user_dict_path = _append_terms(new_terms_data)
+            print(
+                f"Added terms from file: {file_path}. Updated dictionary saved to {user_dict_path}"
+            )
 
     except FileNotFoundError:
         raise FileNotFoundError(f"File not found: {file_path}")
@@ -165,9 +326,29 @@ def add_terms_from_file(file_path):
         raise Exception(f"Error adding terms from file: {e}")
 
 
-def print_custom_dict():
-    """Prints the currently loaded custom dictionary to the console."""
-    current_dict = load_custom_syllable_dict()
+def export_custom_dict(file_path, current_dict=None):
+    """Writes the current custom dictionary (or `current_dict`) to a JSON file
+    in the 'CUSTOM_SYLLABLE_DICT' format."""
+    if current_dict is None:
+        current_dict = load_custom_syllable_dict()
+    with open(file_path, "w", encoding="utf-8") as outfile:
+        json.dump({"CUSTOM_SYLLABLE_DICT": current_dict}, outfile, indent=4)
+
+
+def compact_custom_dict():
+    """Folds the terms added since the last save into the user's JSON
+    dictionary file. Happens automatically as the log grows."""
+    user_dict_path = _get_user_dict_path()
+    if os.path.exists(_get_user_log_path(user_dict_path)):
+        with _dict_lock(user_dict_path):
+            _compact(user_dict_path)
+
+
+def print_custom_dict(current_dict=None):
+    """Prints the currently loaded custom dictionary (or `current_dict`) to the
+    console."""
+    if current_dict is None:
+        current_dict = load_custom_syllable_dict()
     print(
         json.dumps({"CUSTOM_SYLLABLE_DICT": current_dict}, indent=4)
     )  # Print in readable JSON format
@@ -178,7 +359,7 @@ def revert_custom_dict_to_default():
     that is included with the package. This effectively removes any
     customizations made by the user.
     """
-    user_dict_path = _get_user_dict_path()
+    user_dict_path = _get_user_dict_path(create=True)
     default_dict_path = _get_default_dict_path()
 
     try:
@@ -189,8 +370,8 @@ def revert_custom_dict_to_default():
 
         # Write the default dictionary content to the user's custom dictionary path,
         # effectively overwriting the user's customizations.
-        with open(user_dict_path, "w", encoding="utf-8") as outfile:
-            json.dump(default_dict_data, outfile, indent=4)
+        with _dict_lock(user_dict_path):
+            _write_snapshot(user_dict_path, default_dict_data)
 
         print(
             f"Custom dictionary reverted to the default package dictionary. "
@@ -0,0 +1,5 @@
+"""Readability formulas evaluated from precomputed counts.
+
+`scireadability.formulas.vectorized` evaluates them over NumPy arrays and
+needs the optional ``numpy`` extra; importing this package does not.
+"""
@@ -0,0 +1,222 @@
+"""Readability formulas over arrays of precomputed counts.
+
+Each function takes one array per count (any array-like of numbers, one
+element per document) and returns a float64 array of scores. Scores match the
+scalar functions exactly, including the zero-word and zero-sentence rules and
+the rounding settings. Counts use the names below; ``unfamiliar_words`` are
+the words not on the easy-word list (``difficult_words(text, 0)``, used by
+Dale-Chall) and ``difficult_words`` are those with two or more syllables
+(``difficult_words(text)``, used by Spache).
+"""
+
+from typing import Dict, Iterable, Mapping, Optional
+
+try:
+    import numpy as np
+except ImportError as e:  # pragma: no cover
+    raise ImportError(
+        "scireadability.formulas.vectorized requires NumPy: "
+        "pip install scireadability[numpy]"
+    ) from e
+
+from .. import scireadability as _core
+from ..scireadability import (
+    FORMULA_POINTS,
+    FRE_BASE,
+    FRE_SENTENCE_LENGTH,
+    FRE_SYLL_PER_WORD,
+    TextProfile,
+)
+
+# count name -> TextProfile attribute (or difficult_words threshold)
+COUNTS = {
+    "words": "lexicon_count",
+    "sentences": "sentence_count",
+    "syllables": "syllable_count",
+    "polysyllables": "polysyllabcount",
+    "letters": "letter_count",
+    "chars": "char_count",
+    "long_words": "long_word_count",
+    "miniwords": "miniword_count",
+    "unfamiliar_words": 0,
+    "difficult_words": 2,
+}
+
+# formula -> the counts it reads
+FORMULA_COUNTS = {
+    "flesch_reading_ease": ("words", "sentences", "syllables"),
+    "flesch_kincaid_grade": ("words", "sentences", "syllables"),
+    "smog_index": ("words", "sentences", "polysyllables"),
+    "coleman_liau_index": ("words", "sentences", "letters"),
+    "automated_readability_index": ("words", "sentences", "chars"),
+    "dale_chall_readability_score": ("words", "sentences", "unfamiliar_words"),
+    "gunning_fog": ("words", "sentences", "polysyllables"),
+    "lix": ("words", "sentences", "long_words"),
+    "rix": ("words", "sentences", "long_words"),
+    "spache_readability": ("words", "sentences", "difficult_words"),
+    "mcalpine_eflaw": ("words", "sentences", "miniwords"),
+}
+VECTORIZED_METRICS = tuple(FORMULA_COUNTS)
+
+
+def _float(values) -> "np.ndarray":
+    return np.asarray(values, dtype=np.float64)
+
+
+def _prepare(words, sentences):
+    """Returns (words, sentences, mask of documents with words, safe words).
+
+    As `sentence_count` never reports fewer than one sentence, neither does
+    this; documents without words score 0.0 like the scalar functions.
+    """
+    words = _float(words)
+    sentences = np.maximum(_float(sentences), 1.0)
+    has_words = words != 0
+    return words, sentences, has_words, np.where(has_words, words, 1.0)
+
+
+def _finish(name, scores, has_words, rounding, points) -> "np.ndarray":
+    scores = np.where(has_words, scores, 0.0)
+    round_this_call = rounding if rounding is not None else _core._round_outputs
+    if not round_this_call:
+        return scores
+    round_points = points if points is not None else _core._round_points
+    num_points = round_points if round_points is not None else FORMULA_POINTS[name]
+    p = 10**num_points
+    return np.floor((scores * p) + np.copysign(0.5, scores)) / p
+
+
+def flesch_reading_ease(
+    words, sentences, syllables, rounding: Optional[bool] = None, points=None
+) -> "np.ndarray":
+    words, sentences, has_words, safe_words = _prepare(words, sentences)
+    scores = (
+        FRE_BASE
+        - (FRE_SENTENCE_LENGTH * (words / sentences))
+        - (FRE_SYLL_PER_WORD * (_float(syllables) / safe_words))
+    )
+    return _finish("flesch_reading_ease", scores, has_words, rounding, points)
+
+
+def flesch_kincaid_grade(
+    words, sentences, syllables, rounding: Optional[bool] = None, points=None
+) -> "np.ndarray":
+    words, sentences, has_words, safe_words = _prepare(words, sentences)
+    scores = (
+        (0.39 * (words / sentences))
+        + (11.8 * (_float(syllables) / safe_words))
+        - 15.59
+    )
+    return _finish("flesch_kincaid_grade", scores, has_words, rounding, points)
+
+
+def smog_index(
+    words, sentences, polysyllables, rounding: Optional[bool] = None, points=None
+) -> "np.ndarray":
+    words, sentences, has_words, _ = _prepare(words, sentences)
+    scores = (1.043 * (30 * (_float(polysyllables) / sentences)) ** 0.5) + 3.1291
+    return _finish("smog_index", scores, has_words & (sentences >= 3), rounding, points)
+
+
+def coleman_liau_index(
+    words, sentences, letters, rounding: Optional[bool] = None, points=None
+) -> "np.ndarray":
+    words, sentences, has_words, safe_words = _prepare(words, sentences)
+    letters_per_100 = (_float(letters) / safe_words) * 100
+    sentences_per_100 = (sentences / safe_words) * 100
+    scores = (0.0588 * letters_per_100) - (0.296 * sentences_per_100) - 15.8
+    return _finish("coleman_liau_index", scores, has_words, rounding, points)
+
+
+def automated_readability_index(
+    words, sentences, chars, rounding: Optional[bool] = None, points=None
+) -> "np.ndarray":
+    words, sentences, has_words, safe_words = _prepare(words, sentences)
+    scores = (
+        (4.71 * (_float(chars) / safe_words)) + (0.5 * (words / sentences)) - 21.43
+    )
+    return _finish("automated_readability_index", scores, has_words, rounding, points)
+
+
+def dale_chall_readability_score(
+    words, sentences, unfamiliar_words, rounding: Optional[bool] = None, points=None
+) -> "np.ndarray":
+    words, sentences, has_words, safe_words = _prepare(words, sentences)
+    pdw = (_float(unfamiliar_words) / safe_words) * 100
+    scores = (0.1579 * pdw) + (0.0496 * (words / sentences))
+    scores = np.where(pdw > 5, scores + 3.6365, scores)
+    return _finish("dale_chall_readability_score", scores, has_words, rounding, points)
+
+
+def gunning_fog(
+    words, sentences, polysyllables, rounding: Optional[bool] = None, points=None
+) -> "np.ndarray":
+    words, sentences, has_words, safe_words = _prepare(words, sentences)
+    per_complex_words = (_float(polysyllables) / safe_words) * 100
+    scores = 0.4 * ((words / sentences) + per_complex_words)
+    return _finish("gunning_fog", scores, has_words, rounding, points)
+
+
+def lix(
+    words, sentences, long_words, rounding: Optional[bool] = None, points=None
+) -> "np.ndarray":
+    words, sentences, has_words, safe_words = _prepare(words, sentences)
+    scores = words / sentences + (_float(long_words) * 100) / safe_words
+    return _finish("lix", scores, has_words, rounding, points)
+
+
+def rix(
+    words, sentences, long_words, rounding: Optional[bool] = None, points=None
+) -> "np.ndarray":
+    words, sentences, has_words, _ = _prepare(words, sentences)
+    scores = _float(long_words) / sentences
+    return _finish("rix", scores, has_words, rounding, points)
+
+
+def spache_readability(
+    words, sentences, difficult_words, rounding: Optional[bool] = None, points=None
+) -> "np.ndarray":
+    words, sentences, has_words, safe_words = _prepare(words, sentences)
+    pdw = (_float(difficult_words) / safe_words) * 100
+    scores = (0.141 * (words / sentences)) + (0.086 * pdw) + 0.839
+    return _finish("spache_readability", scores, has_words, rounding, points)
+
+
+def mcalpine_eflaw(
+    words, sentences, miniwords, rounding: Optional[bool] = None, points=None
+) -> "np.ndarray":
+    words, sentences, has_words, _ = _prepare(words, sentences)
+    scores = (words + _float(miniwords)) / sentences
+    return _finish("mcalpine_eflaw", scores, has_words, rounding, points)
+
+
+def count_arrays(profiles: Iterable[TextProfile]) -> Dict[str, "np.ndarray"]:
+    """Collects the counts of many profiles into one int64 array per count."""
+    columns = {name: [] for name in COUNTS}
+    for profile in profiles:
+        for name, source in COUNTS.items():
+            if isinstance(source, int):
+                columns[name].append(profile.difficult_words(source))
+            else:
+                columns[name].append(getattr(profile, source))
+    return {
+        name: np.asarray(values, dtype=np.int64) for name, values in columns.items()
+    }
+
+
+def scores(
+    counts: Mapping[str, Iterable],
+    metrics: Optional[Iterable[str]] = None,
+    rounding: Optional[bool] = None,
+    points: Optional[int] = None,
+) -> Dict[str, "np.ndarray"]:
+    """Evaluates several formulas (default: all of `VECTORIZED_METRICS`) from a
+    mapping of count name to array, such as the result of `count_arrays`."""
+    metrics = tuple(metrics) if metrics is not None else VECTORIZED_METRICS
+    results = {}
+    for name in metrics:
+        if name not in FORMULA_COUNTS:
+            raise ValueError(f"No vectorized formula for: {name}")
+        args = [counts[count] for count in FORMULA_COUNTS[name]]
+        results[name] = globals()[name](*args, rounding=rounding, points=points)
+    return results
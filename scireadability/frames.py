@@ -0,0 +1,60 @@
+from typing import Any, Dict, Iterable, List, Optional
+
+from .batch import analyze_many
+from .scireadability import DEFAULT_METRICS
+
+
+def _column_texts(data: Any, text_column: str) -> List[Any]:
+    """Returns the column's values as a list, missing values as None."""
+    if hasattr(data, "column_names"):  # pyarrow.Table
+        return data.column(text_column).to_pylist()
+    column = data[text_column]
+    return [
+        None if missing else value
+        for value, missing in zip(column.tolist(), column.isna().tolist())
+    ]
+
+
+def score_frame(
+    data: Any,
+    text_column: str,
+    metrics: Optional[Iterable[str]] = None,
+    workers: Optional[int] = 1,
+    chunksize: int = 64,
+    rounding: Optional[bool] = None,
+    points: Optional[int] = None,
+) -> Any:
+    """Scores the texts in one column of a pandas DataFrame or pyarrow Table.
+
+    The strings are pulled out of the column in one pass and each row is
+    profiled once for all `metrics` (default: all formulas), in `workers`
+    processes as with `analyze_many`. Returns a new frame of the same kind
+    with one column per metric, built column-wise; a pandas result keeps the
+    input's index. Missing texts get missing scores. Requires the optional
+    ``pandas`` or ``arrow`` extra, whichever matches the input.
+    """
+    metrics = tuple(metrics) if metrics is not None else DEFAULT_METRICS
+    texts = _column_texts(data, text_column)
+    present = [text for text in texts if text is not None]
+    results = analyze_many(
+        present,
+        metrics=metrics,
+        workers=workers,
+        chunksize=chunksize,
+        rounding=rounding,
+        points=points,
+    )
+
+    columns: Dict[str, List[Any]] = {name: [] for name in metrics}
+    for text in texts:
+        row = next(results) if text is not None else None
+        for name in metrics:
+            columns[name].append(row[name] if row is not None else None)
+
+    if hasattr(data, "column_names"):
+        import pyarrow
+
+        return pyarrow.table(columns)
+    import pandas
+
+    return pandas.DataFrame(columns, index=data.index)
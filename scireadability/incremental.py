@@ -0,0 +1,256 @@
+import re
+from bisect import bisect_right
+from functools import cached_property
+from itertools import accumulate
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+from . import scireadability as _core
+from .scireadability import (
+    MIXED_CASE_CONTRACTION,
+    WHITESPACE_RE,
+    TextProfile,
+    _forcast_sample,
+    _get_easy_words,
+    _linsear_sample,
+    _sentence_spans,
+    _text_syllables,
+    _tokenize,
+    _word_syllables,
+)
+
+# A block ends after a sentence terminator and the whitespace that follows it.
+# No sentence match, word or contraction spans such a cut, so the counts of
+# the blocks add up to the counts of the whole text.
+BLOCK_END_RE = re.compile(r"[.!?]\s+")
+
+# positions in a block's count tuple
+(
+    CHARS,
+    LETTERS,
+    WORDS,
+    TOKEN_SYLLABLES,
+    TEXT_SYLLABLES,
+    MIXED_CASE,
+    POLYSYLLABLES,
+    MONOSYLLABLES,
+    LONG_WORDS,
+    MINIWORDS,
+    DIFFICULT_ANY,
+    DIFFICULT,
+    SENTENCES,
+    SHORT_SENTENCES,
+) = range(14)
+BlockCounts = Tuple[int, ...]
+
+
+def _split_blocks(text: str) -> List[str]:
+    blocks = []
+    start = 0
+    for match in BLOCK_END_RE.finditer(text):
+        blocks.append(text[start : match.end()])
+        start = match.end()
+    if start < len(text):
+        blocks.append(text[start:])
+    return blocks
+
+
+def _is_block_end(text: str) -> bool:
+    stripped = text.rstrip()
+    return len(stripped) < len(text) and stripped[-1:] in (".", "!", "?")
+
+
+def _block_counts(block: str, rm_apostrophe: bool) -> BlockCounts:
+    """Counts one block the way TextProfile counts a whole text."""
+    easy_words = _get_easy_words()
+    words = _tokenize(block, rm_apostrophe)
+    lowered = [word.lower() for word in words]
+    syllables = [_word_syllables(word) for word in lowered]
+    token_syllables = sum(syllables)
+    mixed = not rm_apostrophe and MIXED_CASE_CONTRACTION.search(block) is not None
+    if rm_apostrophe or (block.isascii() and not mixed):
+        text_syllables = token_syllables
+    else:
+        text_syllables = _text_syllables(block, rm_apostrophe)
+    difficult = [
+        syls for word, syls in zip(lowered, syllables) if word not in easy_words
+    ]
+    sentences = [words for _, _, words in _sentence_spans(block)]
+    return (
+        len(WHITESPACE_RE.sub("", block)),
+        sum(1 for ch in block if ch.isalpha()),
+        len(words),
+        token_syllables,
+        text_syllables,
+        int(mixed),
+        sum(1 for syls in syllables if syls >= 3),
+        sum(1 for syls in syllables if syls < 2),
+        sum(1 for word in words if len(word) > 6),
+        sum(1 for word in words if len(word) <= 3),
+        len(difficult),
+        sum(1 for syls in difficult if syls >= 2),
+        len(sentences),
+        sum(1 for words in sentences if words <= 2),
+    )
+
+
+class DocumentProfile(TextProfile):
+    """The TextProfile of one version of a Document. Its counts come from the
+    document's running totals; the text is only joined if a statistic that
+    isn't maintained (such as ``words``) is asked for."""
+
+    def __init__(self, blocks: Tuple[str, ...], counts: Dict, rm_apostrophe: bool):
+        super().__init__(None, counts)
+        del self.text  # joined on first use, by the cached property below
+        self._blocks = blocks
+        self._rm_apostrophe = rm_apostrophe
+
+    @cached_property
+    def text(self) -> str:
+        return "".join(self._blocks)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({len(self._blocks)} blocks)"
+
+
+class Document:
+    """A text edited in place, for re-scoring after every change.
+
+    The text is kept as a list of blocks (runs of sentences cut after a
+    terminator and whitespace) with per-block counts and running totals. An
+    edit re-tokenizes only the blocks it touches, and every formula is then
+    computed from the totals. Counts reflect the settings and dictionaries in
+    effect when each block was counted.
+    """
+
+    def __init__(self, text: str = ""):
+        self._rm_apostrophe = _core._rm_apostrophe
+        self._blocks: List[str] = []
+        self._counts: List[BlockCounts] = []
+        self._starts: List[int] = []
+        self._totals = [0] * 14
+        self._length = 0
+        self._profile: Optional[DocumentProfile] = None
+        if text:
+            self.edit(0, 0, text)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._length} chars)"
+
+    @property
+    def text(self) -> str:
+        return "".join(self._blocks)
+
+    def edit(
+        self, offset: int, deleted_length: int = 0, inserted_text: str = ""
+    ) -> None:
+        """Replaces `deleted_length` characters at `offset` by `inserted_text`."""
+        if not 0 <= offset <= self._length:
+            raise ValueError(f"offset {offset} is outside the document.")
+        if deleted_length < 0 or offset + deleted_length > self._length:
+            raise ValueError("deleted_length must stay within the document.")
+        if not deleted_length and not inserted_text:
+            return
+
+        blocks, starts = self._blocks, self._starts
+        if blocks:
+            first = max(bisect_right(starts, offset) - 1, 0)
+            last_char = max(offset + deleted_length - 1, offset)
+            last = max(bisect_right(starts, last_char) - 1, first)
+            region = "".join(blocks[first : last + 1])
+            local = offset - starts[first]
+            region = region[:local] + inserted_text + region[local + deleted_length :]
+        else:
+            first, last = 0, -1
+            region = inserted_text
+        # the edit may have removed the terminator or whitespace that ended
+        # the last block; if so, it merges with the following ones
+        while region and last + 1 < len(blocks) and not _is_block_end(region):
+            last += 1
+            region += blocks[last]
+
+        pieces = _split_blocks(region)
+        counts = [_block_counts(piece, self._rm_apostrophe) for piece in pieces]
+        totals = self._totals
+        for old in self._counts[first : last + 1]:
+            for i, value in enumerate(old):
+                totals[i] -= value
+        for new in counts:
+            for i, value in enumerate(new):
+                totals[i] += value
+        blocks[first : last + 1] = pieces
+        self._counts[first : last + 1] = counts
+        self._starts = list(accumulate(map(len, blocks), initial=0))
+        self._starts.pop()
+        self._length += len(inserted_text) - deleted_length
+        self._profile = None
+
+    def _prefix_tokens(self, limit: int) -> List[str]:
+        """The first `limit` whitespace-separated tokens."""
+        tokens: List[str] = []
+        for block in self._blocks:
+            tokens.extend(block.split())
+            if len(tokens) >= limit:
+                break
+        return tokens[:limit]
+
+    def _prefix_syllables(self, limit: int) -> List[int]:
+        """Syllables of the first `limit` words."""
+        syllables: List[int] = []
+        for block in self._blocks:
+            words = _tokenize(block, self._rm_apostrophe)
+            syllables.extend(_word_syllables(word.lower()) for word in words)
+            if len(syllables) >= limit:
+                break
+        return syllables[:limit]
+
+    @property
+    def profile(self) -> DocumentProfile:
+        """A TextProfile of the current text, built from the running totals."""
+        if self._profile is None:
+            totals = self._totals
+            if self._rm_apostrophe or not totals[MIXED_CASE]:
+                syllable_count = totals[TOKEN_SYLLABLES]
+            else:
+                syllable_count = totals[TEXT_SYLLABLES]
+            counts = {
+                "_is_blank": totals[CHARS] == 0,
+                "char_count": totals[CHARS],
+                "letter_count": totals[LETTERS],
+                "lexicon_count": totals[WORDS],
+                "sentence_count": max(
+                    1, totals[SENTENCES] - totals[SHORT_SENTENCES]
+                ),
+                "syllable_count": syllable_count,
+                "polysyllabcount": totals[POLYSYLLABLES],
+                "monosyllabcount": totals[MONOSYLLABLES],
+                "long_word_count": totals[LONG_WORDS],
+                "miniword_count": totals[MINIWORDS],
+                ("difficult_words", 0): totals[DIFFICULT_ANY],
+                ("difficult_words", 2): totals[DIFFICULT],
+                "_forcast_counts": _forcast_sample(self._prefix_syllables(150)),
+                "_linsear_counts": _linsear_sample(
+                    self._prefix_tokens(100), self._rm_apostrophe
+                ),
+            }
+            self._profile = DocumentProfile(
+                tuple(self._blocks), counts, self._rm_apostrophe
+            )
+        return self._profile
+
+    def score(
+        self, name: str, rounding: Optional[bool] = None, points: Optional[int] = None
+    ) -> Union[float, int, str]:
+        """Returns a statistic or formula by name, like `TextProfile.score`."""
+        return self.profile.score(name, rounding, points)
+
+    def scores(
+        self,
+        metrics: Optional[Iterable[str]] = None,
+        rounding: Optional[bool] = None,
+        points: Optional[int] = None,
+    ) -> Dict[str, Union[float, int, str]]:
+        """Returns a dict of the requested metrics (default: all formulas)."""
+        return self.profile.scores(metrics, rounding, points)
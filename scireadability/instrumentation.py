@@ -0,0 +1,196 @@
+"""Opt-in call and syllable-lookup counters, and per-stage profiling.
+
+Instrumentation is off unless ``SCIREADABILITY_STATS=1`` is set or
+`scireadability.enable_stats()` is called. While it is off, an instrumented
+function costs one extra call and a flag check. Stage timings are only taken
+inside `scireadability.profile()`; outside it a stage costs one call.
+"""
+
+import os
+import threading
+import time
+from collections import Counter
+from functools import wraps
+from typing import Any, Dict, List, Optional, Tuple
+
+SYLLABLE_TIERS = ("custom", "cmu", "regex", "species")
+
+enabled = os.environ.get("SCIREADABILITY_STATS", "") not in ("", "0")
+
+_lock = threading.Lock()
+# function name -> [calls, cumulative seconds]
+_calls: Dict[str, List[Any]] = {}
+tiers: Counter = Counter()
+
+
+def instrumented(func):
+    """Counts calls to `func` and the time spent in them, when enabled."""
+    name = func.__name__
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        if not enabled:
+            return func(*args, **kwargs)
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - start
+            with _lock:
+                entry = _calls.setdefault(name, [0, 0.0])
+                entry[0] += 1
+                entry[1] += elapsed
+
+    return wrapper
+
+
+def calls() -> Dict[str, Dict[str, Any]]:
+    with _lock:
+        return {
+            name: {"calls": count, "seconds": seconds}
+            for name, (count, seconds) in sorted(_calls.items())
+        }
+
+
+def syllable_tiers() -> Dict[str, int]:
+    return {tier: tiers[tier] for tier in SYLLABLE_TIERS}
+
+
+def reset() -> None:
+    with _lock:
+        _calls.clear()
+        tiers.clear()
+
+
+# --- stage profiling ---
+class Profiler:
+    """Wall time spent in each pipeline stage, per document and in total.
+
+    Times are exclusive: a stage's time excludes the stages nested inside
+    it, so they add up to the time spent in the library. Documents are told
+    apart by their counts, so repeated `analyze` calls on one text add up to
+    one document.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        # stack of stage names -> exclusive seconds
+        self._paths: Counter = Counter()
+        # id(counts) -> (counts, chars, stage -> exclusive seconds)
+        self._documents: Dict[int, Tuple[Dict, Optional[int], Counter]] = {}
+
+    def _stack(self) -> List["_Stage"]:
+        try:
+            return self._local.stack
+        except AttributeError:
+            self._local.stack = []
+            return self._local.stack
+
+    def _record(self, stack: List["_Stage"], seconds: float) -> None:
+        path = tuple(frame.name for frame in stack)
+        profile = next((f.profile for f in stack if f.profile is not None), None)
+        with self._lock:
+            self._paths[path] += seconds
+            if profile is None:
+                return
+            document = self._documents.get(id(profile.counts))
+            if document is None:
+                text = profile.__dict__.get("text")
+                chars = len(text) if isinstance(text, str) else None
+                document = (profile.counts, chars, Counter())
+                self._documents[id(profile.counts)] = document
+            document[2][_stage_name(path[-1])] += seconds
+
+    def stages(self) -> Dict[str, float]:
+        """Seconds per stage across all documents, slowest first."""
+        totals: Counter = Counter()
+        with self._lock:
+            for path, seconds in self._paths.items():
+                totals[_stage_name(path[-1])] += seconds
+        return dict(totals.most_common())
+
+    def documents(self) -> List[Dict[str, Any]]:
+        """One entry per document, in the order they were first seen, with
+        its length in characters (None if unknown), total seconds and seconds
+        per stage."""
+        with self._lock:
+            documents = list(self._documents.values())
+        return [
+            {
+                "chars": chars,
+                "seconds": sum(stages.values()),
+                "stages": dict(stages.most_common()),
+            }
+            for _, chars, stages in documents
+        ]
+
+    def to_dict(self) -> Dict[str, Any]:
+        stages = self.stages()
+        return {
+            "seconds": sum(stages.values()),
+            "stages": stages,
+            "documents": self.documents(),
+        }
+
+    def collapsed(self) -> str:
+        """The timings as collapsed stacks ("outer;inner microseconds" per
+        line), the input format of flamegraph.pl and speedscope."""
+        with self._lock:
+            paths = sorted(self._paths.items())
+        return "".join(
+            f"{';'.join(path)} {round(seconds * 1e6)}\n" for path, seconds in paths
+        )
+
+
+def _stage_name(frame: str) -> str:
+    # "formula:gunning_fog" frames are reported together as "formula"
+    return frame.split(":", 1)[0]
+
+
+class _Stage:
+    __slots__ = ("profiler", "name", "profile", "start", "nested")
+
+    def __init__(self, active: Profiler, name: str, profile: Any):
+        self.profiler = active
+        self.name = name
+        self.profile = profile
+
+    def __enter__(self) -> "_Stage":
+        self.profiler._stack().append(self)
+        self.nested = 0.0
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        elapsed = time.perf_counter() - self.start
+        stack = self.profiler._stack()
+        self.profiler._record(stack, elapsed - self.nested)
+        stack.pop()
+        if stack:
+            stack[-1].nested += elapsed
+
+
+class _NoStage:
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, *exc_info) -> None:
+        return None
+
+
+_NO_STAGE = _NoStage()
+
+# the Profiler of the innermost active `scireadability.profile()`, if any
+profiler: Optional[Profiler] = None
+
+
+def stage(name: str, profile: Any = None):
+    """Times the enclosed block as pipeline stage `name` of the document that
+    `profile` (a TextProfile) describes; nested stages inherit it."""
+    active = profiler
+    if active is None:
+        return _NO_STAGE
+    return _Stage(active, name, profile)
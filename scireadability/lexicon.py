@@ -0,0 +1,484 @@
+"""Compiled lexicon: the CMU syllable table, the custom dictionary and the
+easy-word list merged into one binary file.
+
+Parsing the text resources takes most of a second; reading the compiled file
+takes milliseconds. The file carries a digest of its sources, and is rebuilt
+whenever they change (e.g. after the user dictionary is edited).
+
+Layout (little-endian)::
+
+    header   magic, format version, source digest, entry count, blob size
+    offsets  uint32[count + 1]  start of each word in the blob
+    blob     utf-8 words sorted by code point, joined by "\\n"
+    flags    uint8[count]       FLAG_CMU | FLAG_CUSTOM | FLAG_EASY
+    cmu      uint8[count]       CMU syllable count (0 if not in cmudict)
+    custom   uint8[count]       custom syllable count (0 if not custom)
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import re
+import struct
+import sys
+import tempfile
+import warnings
+from array import array
+from bisect import bisect_right
+from collections.abc import Collection, Mapping
+from functools import lru_cache
+from itertools import compress
+from typing import Container, Dict, List, NamedTuple, Optional, Set
+
+from appdirs import user_cache_dir
+
+from .dictionary_utils import (
+    PACKAGE_NAME,
+    _read_package_resource,
+    load_custom_syllable_dict,
+    load_default_custom_dict,
+)
+
+CMU_DICT_PATH = "resources/en/cmudict.dict"
+EASY_WORDS_PATH = "resources/en/easy_words.txt"
+CMU_VARIANT = re.compile(r"\(\d+\)$")
+
+MAGIC = b"SRLX"
+FORMAT_VERSION = 1
+HEADER = struct.Struct("<4sHxx32sII")
+FLAG_CMU = 1
+FLAG_CUSTOM = 2
+FLAG_EASY = 4
+MAX_SYLLABLES = 255
+SPARSE_STEP = 64
+
+_SELECT_CMU, _SELECT_CUSTOM, _SELECT_EASY = (
+    bytes(1 if value & flag else 0 for value in range(256))
+    for flag in (FLAG_CMU, FLAG_CUSTOM, FLAG_EASY)
+)
+
+
+class Lexicon(NamedTuple):
+    """Word lookups used by syllable counting and difficult-word detection."""
+
+    custom: Mapping[str, int]
+    cmu: Mapping[str, int]
+    easy: Container[str]
+    digest: str
+
+
+# --- text sources ---
+def _iter_cmu_entries(cmu_bytes: bytes):
+    """Yields (word, phonemes) pairs from the CMU dictionary."""
+    for line in cmu_bytes.decode("utf-8").splitlines():
+        if not line.startswith(";;;"):
+            parts = line.split()
+            if len(parts) > 1:
+                word = parts[0]
+                if word.endswith(")"):
+                    word = CMU_VARIANT.sub("", word)
+                yield word.lower(), parts[1:]
+
+
+def parse_cmu_syllables(cmu_bytes: bytes) -> Dict[str, int]:
+    """Parses the CMU dictionary into a table of syllable counts, keeping the
+    minimum count across a word's pronunciations."""
+    syllable_dict: Dict[str, int] = {}
+    for word, phones in _iter_cmu_entries(cmu_bytes):
+        syls = sum(1 for p in phones if p[-1].isdigit())
+        if syls < syllable_dict.get(word, syls + 1):
+            syllable_dict[word] = syls
+    return syllable_dict
+
+
+def parse_easy_words(easy_bytes: bytes) -> Set[str]:
+    """Parses the easy-word list, one word per line."""
+    return {ln.decode("utf-8").strip() for ln in easy_bytes.splitlines()}
+
+
+@lru_cache(maxsize=1)
+def load_cmu_pronunciations() -> Dict[str, List[List[str]]]:
+    """Loads every CMU dictionary pronunciation as lists of phonemes.
+
+    Syllable counting only needs the compiled syllable table; this much larger
+    mapping is only built when called.
+    """
+    pronouncing_dict: Dict[str, List[List[str]]] = {}
+    for word, phones in _iter_cmu_entries(_read_package_resource(CMU_DICT_PATH)):
+        pronouncing_dict.setdefault(word, []).append(phones)
+    return pronouncing_dict
+
+
+def _read_package_sources():
+    """Returns (cmudict bytes, easy-word bytes) from the package."""
+    cmu_bytes = _read_package_resource(CMU_DICT_PATH)
+    try:
+        easy_bytes = _read_package_resource(EASY_WORDS_PATH)
+    except FileNotFoundError:
+        warnings.warn("Could not find the easy words vocabulary file.", Warning)
+        easy_bytes = b""
+    return cmu_bytes, easy_bytes
+
+
+def _read_sources():
+    """Returns (cmudict bytes, easy-word bytes, custom dictionary)."""
+    return (*_read_package_sources(), load_custom_syllable_dict())
+
+
+def source_digest(cmu_bytes: bytes, easy_bytes: bytes, custom: Mapping) -> str:
+    """Hashes the lexicon sources together with the file format version."""
+    digest = hashlib.sha256(b"%s%d" % (MAGIC, FORMAT_VERSION))
+    for part in (
+        cmu_bytes,
+        easy_bytes,
+        json.dumps(custom, sort_keys=True).encode("utf-8"),
+    ):
+        digest.update(struct.pack("<Q", len(part)))
+        digest.update(part)
+    return digest.hexdigest()
+
+
+def parse_lexicon(cmu_bytes: bytes, easy_bytes: bytes, custom: Mapping) -> Lexicon:
+    """Builds an in-memory lexicon from the text sources."""
+    return Lexicon(
+        custom=dict(custom),
+        cmu=parse_cmu_syllables(cmu_bytes),
+        easy=frozenset(parse_easy_words(easy_bytes)),
+        digest=source_digest(cmu_bytes, easy_bytes, custom),
+    )
+
+
+def with_custom_dict(lexicon: Lexicon, custom: Mapping[str, int]) -> Lexicon:
+    """Returns `lexicon` with its custom dictionary replaced by `custom`."""
+    digest = hashlib.sha256(lexicon.digest.encode("ascii"))
+    digest.update(json.dumps(custom, sort_keys=True).encode("utf-8"))
+    return lexicon._replace(custom=dict(custom), digest=digest.hexdigest())
+
+
+def with_custom_terms(lexicon: Lexicon, terms: Mapping[str, int]) -> Lexicon:
+    """Returns `lexicon` with `terms` added to its custom dictionary, in time
+    proportional to the terms. A dict custom dictionary is updated in place,
+    so only use this on a lexicon nobody else holds."""
+    custom = lexicon.custom
+    if not isinstance(custom, dict):
+        custom = dict(custom)
+    custom.update(terms)
+    digest = hashlib.sha256(lexicon.digest.encode("ascii"))
+    digest.update(json.dumps(terms, sort_keys=True).encode("utf-8"))
+    return lexicon._replace(custom=custom, digest=digest.hexdigest())
+
+
+# --- compiled file ---
+def default_lexicon_path() -> str:
+    """Returns where the compiled lexicon is cached for this user."""
+    return os.path.join(
+        user_cache_dir(PACKAGE_NAME), "en", f"lexicon-v{FORMAT_VERSION}.bin"
+    )
+
+
+def _little_endian(values: array) -> bytes:
+    if sys.byteorder != "little":
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def write_lexicon(lexicon: Lexicon, path: str) -> str:
+    """Writes a lexicon to `path` atomically and returns the path."""
+    words = sorted(set(lexicon.cmu) | set(lexicon.custom) | set(lexicon.easy))
+    flags = bytearray(len(words))
+    cmu = bytearray(len(words))
+    custom = bytearray(len(words))
+    offsets = array("I", [0])
+    for i, word in enumerate(words):
+        if word in lexicon.cmu:
+            flags[i] |= FLAG_CMU
+            cmu[i] = lexicon.cmu[word]
+        if word in lexicon.custom:
+            syls = lexicon.custom[word]
+            if not isinstance(syls, int) or not 0 <= syls <= MAX_SYLLABLES:
+                raise ValueError(
+                    f"Cannot compile syllable count {syls!r} for '{word}'."
+                )
+            flags[i] |= FLAG_CUSTOM
+            custom[i] = syls
+        if word in lexicon.easy:
+            flags[i] |= FLAG_EASY
+        offsets.append(offsets[-1] + len(word.encode("utf-8")) + 1)
+    blob = "\n".join(words).encode("utf-8")
+
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(
+                HEADER.pack(
+                    MAGIC,
+                    FORMAT_VERSION,
+                    bytes.fromhex(lexicon.digest),
+                    len(words),
+                    len(blob),
+                )
+            )
+            f.write(_little_endian(offsets))
+            f.write(blob)
+            f.write(flags)
+            f.write(cmu)
+            f.write(custom)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    return path
+
+
+def read_lexicon_digest(path: str) -> Optional[str]:
+    """Returns the source digest stored in a compiled lexicon, or None if the
+    file is missing or not a lexicon of this format version."""
+    try:
+        with open(path, "rb") as f:
+            header = f.read(HEADER.size)
+    except OSError:
+        return None
+    if len(header) < HEADER.size:
+        return None
+    magic, version, digest, _, _ = HEADER.unpack(header)
+    if magic != MAGIC or version != FORMAT_VERSION:
+        return None
+    return digest.hex()
+
+
+def read_lexicon(path: str) -> Lexicon:
+    """Reads a compiled lexicon into in-memory lookups."""
+    with open(path, "rb") as f:
+        data = f.read()
+    magic, version, digest, count, blob_size = HEADER.unpack_from(data)
+    if magic != MAGIC or version != FORMAT_VERSION:
+        raise ValueError(f"Not a version {FORMAT_VERSION} lexicon: {path}")
+
+    start = HEADER.size + 4 * (count + 1)
+    words = data[start : start + blob_size].decode("utf-8").split("\n")
+    start += blob_size
+    flags = data[start : start + count]
+    cmu = data[start + count : start + 2 * count]
+    custom = data[start + 2 * count : start + 3 * count]
+    if len(words) != count or len(custom) != count:
+        raise ValueError(f"Truncated lexicon file: {path}")
+
+    # bytes.translate turns the flags into per-word selectors at C speed
+    return Lexicon(
+        custom=dict(compress(zip(words, custom), flags.translate(_SELECT_CUSTOM))),
+        cmu=dict(compress(zip(words, cmu), flags.translate(_SELECT_CMU))),
+        easy=frozenset(compress(words, flags.translate(_SELECT_EASY))),
+        digest=digest.hex(),
+    )
+
+
+def build_lexicon(path: Optional[str] = None) -> str:
+    """Compiles the current sources (including the user dictionary) and
+    returns the path of the written file."""
+    lexicon = parse_lexicon(*_read_sources())
+    return write_lexicon(lexicon, path or default_lexicon_path())
+
+
+def is_up_to_date(path: Optional[str] = None) -> bool:
+    """Returns whether a compiled lexicon exists and matches its sources."""
+    path = path or default_lexicon_path()
+    return read_lexicon_digest(path) == source_digest(*_read_sources())
+
+
+class MappedLexicon:
+    """Lookups made directly against a memory-mapped compiled lexicon.
+
+    Words are found by binary search over the sorted string table, so nothing
+    is copied into the process: every process mapping the same file shares
+    one copy through the OS page cache.
+    """
+
+    def __init__(self, path: str):
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, digest, count, blob_size = HEADER.unpack_from(self._mmap)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            self._mmap.close()
+            raise ValueError(f"Not a version {FORMAT_VERSION} lexicon: {path}")
+
+        self.path = path
+        self.digest = digest.hex()
+        self._count = count
+        self._blob = HEADER.size + 4 * (count + 1)
+        self._flags = self._blob + blob_size
+        if len(self._mmap) < self._flags + 3 * count:
+            self._mmap.close()
+            raise ValueError(f"Truncated lexicon file: {path}")
+
+        offsets = memoryview(self._mmap)[HEADER.size : self._blob]
+        if sys.byteorder == "little":
+            self._offsets = offsets.cast("I")
+        else:
+            self._offsets = array("I", offsets.tobytes())
+            self._offsets.byteswap()
+            offsets.release()
+        # Every SPARSE_STEP-th key is kept in memory (a few KB) so a lookup
+        # bisects in memory and then only searches one block of the file.
+        self._index = [self._key(i) for i in range(0, count, SPARSE_STEP)]
+        # syllable lookups usually ask for the same word twice in a row
+        # (custom, then CMU), so remember the last search
+        self._last = ("", -1)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def close(self) -> None:
+        if isinstance(self._offsets, memoryview):
+            self._offsets.release()
+        self._mmap.close()
+
+    def find(self, word: str) -> int:
+        """Returns the index of `word`, or -1 if it is not in the lexicon."""
+        last_word, last_index = self._last
+        if word == last_word:
+            return last_index
+        key = word.encode("utf-8")
+        index = -1
+        block = bisect_right(self._index, key) - 1
+        if block >= 0:
+            lo = block * SPARSE_STEP
+            hi = min(lo + SPARSE_STEP, self._count)
+            while lo < hi:
+                mid = (lo + hi) // 2
+                if self._key(mid) < key:
+                    lo = mid + 1
+                else:
+                    hi = mid
+            if lo < self._count and self._key(lo) == key:
+                index = lo
+        self._last = (word, index)
+        return index
+
+    def _key(self, index: int) -> bytes:
+        """Returns the utf-8 bytes of the word at `index`."""
+        start = self._blob + self._offsets[index]
+        return self._mmap[start : self._blob + self._offsets[index + 1] - 1]
+
+    def word(self, index: int) -> str:
+        return self._key(index).decode("utf-8")
+
+    def flags(self, index: int) -> int:
+        return self._mmap[self._flags + index]
+
+    def syllables(self, index: int, flag: int) -> int:
+        table = 1 if flag == FLAG_CMU else 2
+        return self._mmap[self._flags + table * self._count + index]
+
+    def lexicon(self) -> Lexicon:
+        """Returns a Lexicon whose lookups read from the mapped file."""
+        return Lexicon(
+            custom=_MappedSyllables(self, FLAG_CUSTOM),
+            cmu=_MappedSyllables(self, FLAG_CMU),
+            easy=_MappedWords(self, FLAG_EASY),
+            digest=self.digest,
+        )
+
+
+class _MappedWords(Collection):
+    """The words of a MappedLexicon carrying a given flag."""
+
+    def __init__(self, source: MappedLexicon, flag: int):
+        self._source = source
+        self._flag = flag
+
+    def __contains__(self, word) -> bool:
+        index = self._source.find(word)
+        return index >= 0 and bool(self._source.flags(index) & self._flag)
+
+    def __iter__(self):
+        source = self._source
+        for index in range(len(source)):
+            if source.flags(index) & self._flag:
+                yield source.word(index)
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+
+class _MappedSyllables(_MappedWords, Mapping):
+    """Syllable counts of a MappedLexicon for one source (CMU or custom)."""
+
+    def __getitem__(self, word: str) -> int:
+        syls = self.get(word)
+        if syls is None:
+            raise KeyError(word)
+        return syls
+
+    def get(self, word: str, default=None):
+        index = self._source.find(word)
+        if index < 0 or not self._source.flags(index) & self._flag:
+            return default
+        return self._source.syllables(index, self._flag)
+
+
+LEXICON_BACKENDS = ("memory", "mmap")
+
+
+def load_lexicon(path: Optional[str] = None, backend: str = "memory") -> Lexicon:
+    """Loads the compiled lexicon, rebuilding it first if it is missing or
+    out of date with its sources.
+
+    With the "memory" backend the lookups are plain dicts. With "mmap" they
+    are served from the memory-mapped file, which all processes share. If the
+    compiled file cannot be written (e.g. a read-only home directory), the
+    lexicon is parsed from the text sources into memory instead.
+    """
+    if backend not in LEXICON_BACKENDS:
+        raise ValueError(f"Unknown lexicon backend: {backend}")
+    path = path or default_lexicon_path()
+    sources = _read_sources()
+    digest = source_digest(*sources)
+    if read_lexicon_digest(path) == digest:
+        try:
+            if backend == "mmap":
+                return MappedLexicon(path).lexicon()
+            return read_lexicon(path)
+        except (OSError, ValueError):
+            pass
+
+    lexicon = parse_lexicon(*sources)
+    try:
+        write_lexicon(lexicon, path)
+    except (OSError, ValueError):
+        return lexicon
+    if backend == "mmap":
+        return MappedLexicon(path).lexicon()
+    return lexicon
+
+
+def load_read_only_lexicon(
+    path: Optional[str] = None,
+    custom: Optional[Mapping[str, int]] = None,
+    backend: str = "memory",
+) -> Lexicon:
+    """Loads a lexicon without touching the user's config or cache
+    directories.
+
+    With `path`, the compiled file there is used as is (e.g. one built into
+    a container image); otherwise the packaged sources are parsed in memory,
+    and the "mmap" backend falls back to dicts. `custom` replaces the custom
+    dictionary, which otherwise is the compiled file's or the packaged
+    default.
+    """
+    if backend not in LEXICON_BACKENDS:
+        raise ValueError(f"Unknown lexicon backend: {backend}")
+    if path is None:
+        if custom is None:
+            custom = load_default_custom_dict()
+        return parse_lexicon(*_read_package_sources(), custom)
+    if backend == "mmap":
+        lexicon = MappedLexicon(path).lexicon()
+    else:
+        lexicon = read_lexicon(path)
+    if custom is None:
+        return lexicon
+    return with_custom_dict(lexicon, custom)
@@ -1,26 +1,76 @@
 import math
+import os
 import re
+import threading
 import warnings
+from array import array
 from collections import Counter
-from functools import lru_cache, wraps
-from typing import Union, Dict, List, Set, Optional
-
-from importlib.resources import files
+from contextlib import contextmanager
+from functools import cached_property, wraps
+from typing import (
+    Any,
+    Container,
+    Mapping,
+    Union,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
 
+from . import instrumentation as _instrumentation
+from .caching import (
+    CacheInfo,
+    DocumentCache,
+    DocumentCacheInfo,
+    WordCache,
+    content_digest,
+    content_key,
+)
 from .dictionary_utils import (
     add_term_to_custom_dict,
     add_terms_from_file,
+    add_terms_to_custom_dict,
+    export_custom_dict,
     load_custom_syllable_dict,
     overwrite_custom_dict,
     print_custom_dict,
     revert_custom_dict_to_default,
 )
+from .instrumentation import Profiler, instrumented, stage as _stage
+from .lexicon import (
+    LEXICON_BACKENDS,
+    Lexicon,
+    load_cmu_pronunciations,
+    load_lexicon,
+    load_read_only_lexicon,
+    with_custom_dict,
+    with_custom_terms,
+)
+from .tokens import TokenStream, leading_tokens
 
 # --- module level state ---
 _round_outputs = False
 _round_points = None
 _rm_apostrophe = False
+_lexicon_backend = os.environ.get("SCIREADABILITY_LEXICON", "memory")
+# read-only mode: no user config or cache directories, no output
+_read_only = os.environ.get("SCIREADABILITY_READ_ONLY", "") not in ("", "0")
+_read_only_lexicon_path = os.environ.get("SCIREADABILITY_LEXICON_PATH") or None
+_read_only_custom: Optional[Dict[str, int]] = None
 text_encoding = "utf-8"
+# per-word syllable counts, kept apart from the document cache
+_word_cache = WordCache()
+# per-document counts, keyed by a text fingerprint, the apostrophe mode and
+# the lexicon generation
+_document_cache = DocumentCache()
+_lexicon: Optional[Lexicon] = None
+_lexicon_lock = threading.Lock()
+# bumped whenever the custom dictionary changes, so documents counted under an
+# older lexicon are no longer found in the document cache
+_lexicon_generation = 0
 
 
 # --- helper functions and decorators ---
@@ -61,27 +111,75 @@ def get_grade_suffix(grade: int) -> str:
     return teens_map.get(grade % 100, ordinal_map.get(grade % 10, "th"))
 
 
-@lru_cache(maxsize=1)
-def _load_cmu_dict() -> Dict[str, List[List[str]]]:
-    """Loads the CMU dictionary from package resources."""
-    cmu_dict_path = "resources/en/cmudict.dict"
-    pronouncing_dict: Dict[str, List[List[str]]] = {}
-    cmu_text = files("scireadability").joinpath(cmu_dict_path).read_text("utf-8")
-    for line in cmu_text.splitlines():
-        if not line.startswith(";;;"):
-            parts = line.split()
-            if len(parts) > 1:
-                word = re.sub(r"\(\d+\)$", "", parts[0]).lower()
-                pronunciation = parts[1:]
-                if word not in pronouncing_dict:
-                    pronouncing_dict[word] = []
-                pronouncing_dict[word].append(pronunciation)
-    return pronouncing_dict
-
-
-# --- initializations ---
-custom_dict = load_custom_syllable_dict()
-cmu_pronouncing_dict = _load_cmu_dict()
+def _load_lexicon(backend: str) -> Lexicon:
+    """Loads a lexicon for `backend` as the read-only setting allows."""
+    if _read_only:
+        return load_read_only_lexicon(
+            _read_only_lexicon_path, _read_only_custom, backend
+        )
+    return load_lexicon(backend=backend)
+
+
+def _get_lexicon() -> Lexicon:
+    """Loads the compiled lexicon on first use."""
+    global _lexicon
+    lexicon = _lexicon
+    if lexicon is None:
+        with _lexicon_lock:
+            if _lexicon is None:
+                _lexicon = _load_lexicon(_lexicon_backend)
+            lexicon = _lexicon
+    return lexicon
+
+
+def _unload_lexicon() -> None:
+    """Drops the lexicon, to be loaded again on next use."""
+    global _lexicon
+    with _lexicon_lock:
+        _lexicon = None
+
+
+def _dictionary_changed(terms: Optional[Dict[str, int]] = None) -> None:
+    """Brings the lexicon up to date after an edit of the custom dictionary.
+
+    CMUdict and the easy words are kept. Added `terms` are applied to the
+    custom dictionary directly; without them it is reread. Words whose counts
+    changed leave the word cache, and documents counted under the old lexicon
+    are left to age out of the document cache.
+    """
+    global _lexicon, _lexicon_generation
+    with _lexicon_lock:
+        old = _lexicon
+        if old is None:
+            _word_cache.clear()
+        elif terms is not None:
+            terms = {word.lower(): syls for word, syls in terms.items()}
+            _lexicon = with_custom_terms(old, terms)
+            for word in terms:
+                _word_cache.discard(word)
+        else:
+            custom = load_custom_syllable_dict()
+            _lexicon = with_custom_dict(old, custom)
+            for word in old.custom.keys() | custom.keys():
+                if old.custom.get(word) != custom.get(word):
+                    _word_cache.discard(word)
+        _lexicon_generation += 1
+
+
+# Lexicons used to be module attributes loaded at import. They are now loaded
+# on first use, but stay reachable under their old names.
+_LAZY_ATTRIBUTES = {
+    "custom_dict": lambda: _get_lexicon().custom,
+    "cmu_syllable_dict": lambda: _get_lexicon().cmu,
+    "cmu_pronouncing_dict": lambda: load_cmu_pronunciations(),
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_ATTRIBUTES:
+        return _LAZY_ATTRIBUTES[name]()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 # --- readability constants ---
 FRE_BASE = 206.835
@@ -99,6 +197,21 @@ ADDITIONAL = re.compile(
     r"ian$|^bio",
     flags=re.I,
 )
+SENTENCE_RE = re.compile(r"\b[^.!?]+[.!?]*", flags=re.UNICODE)
+# a word of a sentence, from its first word character to the end of its token;
+# the empty group makes findall() return empty strings rather than the words
+SENTENCE_WORD_RE = re.compile(r"\w\S*()")
+# punctuation removal: runs of anything but word characters and whitespace
+# (keeping apostrophes unless they are removed too), and apostrophes that
+# don't start a contraction suffix, which are dropped along with the quotes
+PUNCTUATION_RUNS = re.compile(r"[^\w\s]+")
+PUNCTUATION_RUNS_KEEP_APOSTROPHES = re.compile(r"[^\w\s']+")
+NON_CONTRACTION_APOSTROPHE = re.compile(r"\'(?![tsd]\b|ve\b|ll\b|re\b)")
+WHITESPACE_RE = re.compile(r"\s")
+# apostrophes that only survive punctuation removal once the text is lowercased
+MIXED_CASE_CONTRACTION = re.compile(
+    r"\'(?![tsd]\b|ve\b|ll\b|re\b)(?=(?i:[tsd]|ve|ll|re)\b)"
+)
 
 # --- species name adjustments ---
 SPECIES_NAME_ADJUSTMENTS = {
@@ -110,6 +223,45 @@ SPECIES_NAME_ADJUSTMENTS = {
 }
 
 
+# --- default rounding precision of each formula ---
+FORMULA_POINTS = {
+    "flesch_reading_ease": 2,
+    "flesch_kincaid_grade": 1,
+    "smog_index": 1,
+    "coleman_liau_index": 2,
+    "automated_readability_index": 1,
+    "dale_chall_readability_score": 2,
+    "linsear_write_formula": 2,
+    "gunning_fog": 2,
+    "forcast": 1,
+    "spache_readability": 2,
+    "mcalpine_eflaw": 1,
+    "lix": 2,
+    "rix": 2,
+    "reading_time": 2,
+}
+DEFAULT_METRICS = tuple(name for name in FORMULA_POINTS if name != "reading_time")
+STATISTICS = (
+    "char_count",
+    "letter_count",
+    "lexicon_count",
+    "sentence_count",
+    "syllable_count",
+    "polysyllabcount",
+    "monosyllabcount",
+    "long_word_count",
+    "miniword_count",
+    "difficult_words",
+    "avg_sentence_length",
+    "avg_syllables_per_word",
+    "avg_character_per_word",
+    "avg_letter_per_word",
+    "avg_sentence_per_word",
+    "words_per_sentence",
+)
+METRICS = STATISTICS + tuple(FORMULA_POINTS) + ("text_standard",)
+
+
 # --- public API for configuration ---
 def set_rounding(rounding: bool, points: Optional[int] = None) -> None:
     """Sets the module-level rounding for all readability scores."""
@@ -122,149 +274,898 @@ def set_rm_apostrophe(rm_apostrophe: bool) -> None:
     """Sets the module-level apostrophe handling."""
     global _rm_apostrophe
     _rm_apostrophe = rm_apostrophe
-    _cache_clear()
+
+
+def set_lexicon_backend(backend: str) -> None:
+    """Selects how dictionary lookups are served: "memory" (dicts, the
+    default) or "mmap" (straight from the memory-mapped compiled lexicon,
+    shared by every process on the machine)."""
+    global _lexicon_backend
+    if backend not in LEXICON_BACKENDS:
+        raise ValueError(
+            f"Unknown lexicon backend: {backend}. Choose from {LEXICON_BACKENDS}."
+        )
+    _lexicon_backend = backend
+    _unload_lexicon()
+    _word_cache.clear()
+
+
+def set_read_only(
+    read_only: bool = True,
+    custom_dict: Optional[Mapping[str, int]] = None,
+    lexicon_path: Optional[str] = None,
+) -> None:
+    """Turns read-only mode on or off. In read-only mode the user's config
+    and cache directories are never touched and nothing is printed: the
+    lexicon is read from the compiled file at `lexicon_path` if given, or
+    else parsed from the packaged sources, and `custom_dict` ({word:
+    syllables}) replaces the custom dictionary. Dictionary edits raise
+    RuntimeError. Setting SCIREADABILITY_READ_ONLY=1 (and optionally
+    SCIREADABILITY_LEXICON_PATH) turns it on at import."""
+    global _read_only, _read_only_lexicon_path, _read_only_custom
+    global _lexicon, _lexicon_generation
+    if custom_dict is not None:
+        custom_dict = {
+            str(word).lower(): int(syls) for word, syls in custom_dict.items()
+        }
+    with _lexicon_lock:
+        _read_only = read_only
+        _read_only_lexicon_path = lexicon_path
+        _read_only_custom = custom_dict
+        _lexicon = None
+        _word_cache.clear()
+        _lexicon_generation += 1
+
+
+def set_word_cache_size(maxsize: int) -> None:
+    """Sets how many per-word syllable counts are remembered (0 disables the
+    word cache). Shrinking the cache evicts the least recently used words."""
+    _word_cache.resize(maxsize)
+
+
+def word_cache_info() -> CacheInfo:
+    """Reports the word cache's hits, misses, evictions, maxsize and
+    currsize; `hit_rate` is also available on the result."""
+    return _word_cache.info()
+
+
+def set_document_cache_size(maxbytes: int) -> None:
+    """Sets the approximate memory budget, in bytes, of the per-document
+    statistics cache (0 disables it)."""
+    _document_cache.resize(maxbytes)
+
+
+def document_cache_info() -> DocumentCacheInfo:
+    """Reports the document cache's hits, misses, evictions, maxbytes,
+    currbytes and number of entries."""
+    return _document_cache.info()
+
+
+def enable_stats(enabled: bool = True) -> None:
+    """Turns call timing and syllable-tier counting on or off. Setting
+    SCIREADABILITY_STATS=1 turns it on at import."""
+    _instrumentation.enabled = enabled
+
+
+def stats() -> Dict[str, Any]:
+    """Returns per-function call counts and cumulative seconds, the word and
+    document cache counters, and how many word-cache misses each syllable
+    tier answered ("species" counts regex results that got a species-name
+    adjustment)."""
+    caches = {"word": word_cache_info(), "document": document_cache_info()}
+    return {
+        "enabled": _instrumentation.enabled,
+        "calls": _instrumentation.calls(),
+        "caches": {
+            name: dict(info._asdict(), hit_rate=info.hit_rate)
+            for name, info in caches.items()
+        },
+        "syllable_tiers": _instrumentation.syllable_tiers(),
+    }
+
+
+def reset_stats() -> None:
+    """Zeroes every counter reported by `stats`, keeping cached entries."""
+    _instrumentation.reset()
+    _word_cache.reset_stats()
+    _document_cache.reset_stats()
+
+
+@contextmanager
+def profile() -> Iterator[Profiler]:
+    """Times each pipeline stage (load_lexicon, normalize, tokenize,
+    segment_sentences, syllables and the syllables_* dictionary tiers,
+    easy_words, count_chars, formula) while the block runs, in this process:
+
+        with scireadability.profile() as p:
+            scireadability.text_standard(text)
+        p.to_dict()      # seconds per stage, overall and per document
+        p.collapsed()    # flamegraph input
+    """
+    previous = _instrumentation.profiler
+    profiler = Profiler()
+    _instrumentation.profiler = profiler
+    try:
+        yield profiler
+    finally:
+        _instrumentation.profiler = previous
+
+
+def warmup() -> None:
+    """Loads the syllable dictionaries and easy-word list now rather than on
+    first use, e.g. before a server starts taking requests."""
+    _get_lexicon()
 
 
 def _cache_clear() -> None:
-    """Clears all cached results from LRU caches."""
-    caching_funcs = [
-        _load_cmu_dict,
-        _get_easy_words,
-        char_count,
-        letter_count,
-        lexicon_count,
-        miniword_count,
-        syllable_count,
-        sentence_count,
-        avg_sentence_length,
-        avg_syllables_per_word,
-        avg_character_per_word,
-        avg_letter_per_word,
-        avg_sentence_per_word,
-        words_per_sentence,
-    ]
-    for func in caching_funcs:
-        if hasattr(func, "cache_clear"):
-            func.cache_clear()
+    """Reloads the lexicon and clears all cached results."""
+    _unload_lexicon()
+    load_cmu_pronunciations.cache_clear()
+    _word_cache.clear()
+    _document_cache.clear()
 
 
 # --- dictionary management ---
+def _check_writable() -> None:
+    if _read_only:
+        raise RuntimeError("The custom dictionary can't be edited in read-only mode.")
+
+
 def add_word_to_dictionary(word: str, syll_count: int):
     """Adds a single word to the custom dictionary."""
-    global custom_dict
+    _check_writable()
     add_term_to_custom_dict(word, syll_count)
-    custom_dict = load_custom_syllable_dict()
-    _cache_clear()
+    _dictionary_changed({word: syll_count})
+
+
+def add_words_to_dictionary(terms: Dict[str, int]):
+    """Adds or updates many words ({word: syllables}) in the custom
+    dictionary in one transaction."""
+    _check_writable()
+    terms = dict(terms)
+    add_terms_to_custom_dict(terms)
+    if terms:
+        _dictionary_changed(terms)
 
 
 def add_words_from_file_to_dictionary(file_path: str):
     """Adds words from a file to the custom dictionary."""
-    global custom_dict
+    _check_writable()
     add_terms_from_file(file_path)
-    custom_dict = load_custom_syllable_dict()
-    _cache_clear()
+    _dictionary_changed()
+
+
+def export_dictionary(file_path: str):
+    """Writes the custom dictionary to a JSON file in the format
+    `add_words_from_file_to_dictionary` and `overwrite_dictionary` read."""
+    if _read_only:
+        export_custom_dict(file_path, dict(_get_lexicon().custom))
+    else:
+        export_custom_dict(file_path)
 
 
 def overwrite_dictionary(file_path: str):
     """Overwrites the custom dictionary with a new one from a file."""
-    global custom_dict
+    _check_writable()
     overwrite_custom_dict(file_path)
-    custom_dict = load_custom_syllable_dict()
-    _cache_clear()
+    _dictionary_changed()
 
 
 def revert_dictionary_to_default():
     """Reverts the custom dictionary to the default."""
-    global custom_dict
+    _check_writable()
     revert_custom_dict_to_default()
-    custom_dict = load_custom_syllable_dict()
-    _cache_clear()
+    _dictionary_changed()
 
 
 def print_dictionary():
     """Prints the current custom dictionary."""
-    print_custom_dict()
+    if _read_only:
+        print_custom_dict(dict(_get_lexicon().custom))
+    else:
+        print_custom_dict()
+
+
+# --- text profile ---
+def _strip_punctuation(text: str, rm_apostrophe: bool) -> str:
+    """Removes punctuation from a text using an explicit apostrophe mode."""
+    if rm_apostrophe or "'" not in text:
+        return PUNCTUATION_RUNS.sub("", text)
+    # an apostrophe is kept only before a contraction suffix, which is judged
+    # on the text as given, before any other punctuation is removed
+    text = NON_CONTRACTION_APOSTROPHE.sub('"', text)
+    return PUNCTUATION_RUNS_KEEP_APOSTROPHES.sub("", text)
+
+
+def _tokenize(text: str, rm_apostrophe: bool) -> List[str]:
+    """Splits a text into punctuation-free word tokens in their original
+    case, as `remove_punctuation(text).split()` does."""
+    return _strip_punctuation(text, rm_apostrophe).split()
+
+
+def _word_syllables(word: str) -> int:
+    """Counts the syllables of a single lowercase, punctuation-free word,
+    going through the word cache."""
+    syls = _word_cache.get(word)
+    if syls is None:
+        syls = _lookup_word_syllables(word)
+        _word_cache.put(word, syls)
+    return syls
+
+
+def _lookup_word_syllables(word: str, lexicon: Optional[Lexicon] = None) -> int:
+    """Looks a word up in the custom dictionary, then CMUdict, then falls back
+    to the regex counter. `lexicon` defaults to the module's lexicon."""
+    if "\u0307" in word:
+        # "İ" lowercases to "i" and a combining dot above, which punctuation
+        # removal drops when a text is lowercased before it is stripped
+        word = word.replace("\u0307", "")
+    if _instrumentation.profiler is not None:
+        return _profiled_lookup_word_syllables(word, lexicon)
+    if lexicon is None:
+        lexicon = _get_lexicon()
+    syls = lexicon.custom.get(word)
+    if syls is not None:
+        if _instrumentation.enabled:
+            _instrumentation.tiers["custom"] += 1
+        return syls
+
+    syls = lexicon.cmu.get(word)
+    if syls is not None:
+        if _instrumentation.enabled:
+            _instrumentation.tiers["cmu"] += 1
+        return syls
+
+    count = regex_syllable_count(word)
+    if _instrumentation.enabled:
+        _instrumentation.tiers["regex"] += 1
+    for ending, adjust in SPECIES_NAME_ADJUSTMENTS.items():
+        if word.endswith(ending):
+            count += adjust
+            if _instrumentation.enabled:
+                _instrumentation.tiers["species"] += 1
+            break
+    return count
+
+
+def _profiled_lookup_word_syllables(
+    word: str, lexicon: Optional[Lexicon] = None
+) -> int:
+    """`_lookup_word_syllables` with each tier timed as its own stage."""
+    if lexicon is None:
+        with _stage("load_lexicon"):
+            lexicon = _get_lexicon()
+    with _stage("syllables_custom"):
+        syls = lexicon.custom.get(word)
+    tier = "custom"
+    if syls is None:
+        with _stage("syllables_cmu"):
+            syls = lexicon.cmu.get(word)
+        tier = "cmu"
+    if syls is None:
+        with _stage("syllables_regex"):
+            syls = regex_syllable_count(word)
+        tier = "regex"
+        with _stage("syllables_species"):
+            for ending, adjust in SPECIES_NAME_ADJUSTMENTS.items():
+                if word.endswith(ending):
+                    syls += adjust
+                    tier = "species"
+                    break
+    if _instrumentation.enabled:
+        _instrumentation.tiers[tier] += 1
+        if tier == "species":
+            _instrumentation.tiers["regex"] += 1
+    return syls
+
+
+def _text_syllables(
+    text: str, rm_apostrophe: bool, word_syllables=_word_syllables
+) -> int:
+    """Counts the syllables of a raw text, lowercasing before tokenizing."""
+    words = _tokenize(text.lower(), rm_apostrophe)
+    return sum(word_syllables(word) for word in words)
+
+
+def _sentence_spans(text: str) -> List[Tuple[int, int, int]]:
+    """Returns the (start, end, word count) of each sentence of a text.
+
+    A sentence's words are the tokens left once its punctuation is removed,
+    in either apostrophe mode: a token survives if it has a word character,
+    and an apostrophe is only kept in front of one.
+    """
+    count_words = SENTENCE_WORD_RE.findall
+    spans = []
+    for match in SENTENCE_RE.finditer(text):
+        start, end = match.span()
+        spans.append((start, end, len(count_words(text, start, end))))
+    return spans
+
+
+def _count_sentences(text: str) -> int:
+    """Counts sentences, ignoring fragments of two words or fewer."""
+    spans = _sentence_spans(text)
+    return max(1, sum(1 for _, _, words in spans if words > 2))
+
+
+def _count_longer_than(lengths: Iterable[int], length: int) -> int:
+    return sum(1 for n in lengths if n > length)
+
+
+def _count_up_to(lengths: Iterable[int], length: int) -> int:
+    return sum(1 for n in lengths if n <= length)
+
+
+def _count_at_least(syllables: List[int], threshold: int) -> int:
+    return sum(1 for syls in syllables if syls >= threshold)
+
+
+def _count_below(syllables: List[int], threshold: int) -> int:
+    return sum(1 for syls in syllables if syls < threshold)
+
+
+def _count_difficult(syllables: array, easy: array, syllable_threshold: int) -> int:
+    """Counts the words that are not easy and, with a positive threshold,
+    have at least that many syllables."""
+    if syllable_threshold <= 0:
+        return easy.count(0)
+    return sum(
+        1
+        for is_easy, syls in zip(easy, syllables)
+        if not is_easy and syls >= syllable_threshold
+    )
+
+
+def _forcast_sample(syllables: List[int]):
+    sample = syllables[:150]
+    return len(sample), sum(1 for syls in sample if syls == 1)
+
+
+def _linsear_sample(
+    tokens: List[str], rm_apostrophe: bool, word_syllables=_word_syllables
+):
+    easy_word = sum(
+        1
+        for word in tokens
+        if _text_syllables(word, rm_apostrophe, word_syllables) < 3
+    )
+    sentences = _count_sentences(" ".join(tokens))
+    return easy_word, len(tokens) - easy_word, sentences
+
+
+class _count:
+    """Like `cached_property`, but the value is also recorded in the profile's
+    `counts`, which profiles of the same text share through the document
+    cache."""
+
+    def __init__(self, func):
+        self.func = func
+        self.__doc__ = func.__doc__
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        try:
+            value = instance.counts[self.name]
+        except KeyError:
+            value = instance._memo(self.name, self.func, instance)
+        instance.__dict__[self.name] = value
+        return value
+
+
+class TextProfile:
+    """Statistics and readability scores for one text, computed from a single
+    tokenization.
+
+    Raw counts are computed lazily and cached on the instance, so asking only
+    for ``char_count`` never tokenizes the text and asking only for
+    ``lexicon_count`` never touches the syllable dictionaries. Formula
+    properties return unrounded scores; use :meth:`score` (or the module-level
+    functions) to apply the rounding settings.
+
+    Counts are also recorded in ``counts``, a dict of small values that holds
+    no reference to the text. Profiles returned by :func:`analyze` share it
+    through the document cache.
+
+    A profile made by an :class:`Analyzer` takes its settings, lexicon and
+    caches from the analyzer instead of the module.
+    """
+
+    _analyzer = None
+
+    def __init__(self, text: str, counts: Optional[Dict] = None, analyzer=None):
+        self.text = text
+        self.counts = {} if counts is None else counts
+        if analyzer is None:
+            self._rm_apostrophe = _rm_apostrophe
+        else:
+            self._analyzer = analyzer
+            self._rm_apostrophe = analyzer.config.rm_apostrophe
+        self._cache_key = None
+
+    def _memo(self, name, compute, *args):
+        """Returns ``counts[name]``, computing and recording it if missing."""
+        try:
+            return self.counts[name]
+        except KeyError:
+            pass
+        value = compute(*args)
+        if self._cache_key is None:
+            self.counts[name] = value
+        elif self._analyzer is None:
+            _document_cache.add(self._cache_key, self.counts, name, value)
+        else:
+            cache = self._analyzer._document_cache
+            cache.add(self._cache_key, self.counts, name, value)
+        return value
+
+    def _syllable_lookup(self):
+        """The per-word syllable counter of this profile's lexicon."""
+        if self._analyzer is None:
+            return _word_syllables
+        return self._analyzer._word_syllables
+
+    def _easy_words(self) -> Container[str]:
+        if self._analyzer is None:
+            return _get_easy_words()
+        return self._analyzer._lexicon().easy
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({len(self.text)} chars)"
+
+    # --- tokens ---
+    # Tokens are not shared between profiles, so whenever they are computed
+    # every count that follows from them is recorded at once; another profile
+    # of the same text then never has to tokenize it again.
+    @cached_property
+    def _tokens(self) -> TokenStream:
+        with _stage("normalize", self):
+            stripped = _strip_punctuation(self.text, self._rm_apostrophe)
+        with _stage("tokenize", self):
+            tokens = TokenStream(stripped)
+        self._memo("lexicon_count", len, tokens)
+        self._memo("long_word_count", _count_longer_than, tokens.lengths, 6)
+        self._memo("miniword_count", _count_up_to, tokens.lengths, 3)
+        return tokens
+
+    @property
+    def words(self) -> List[str]:
+        """Word tokens with punctuation removed, in their original case."""
+        return list(self._tokens)
+
+    @cached_property
+    def _lookups(self) -> Tuple[array, array]:
+        """The syllables of each word and whether it is an easy word."""
+        word_syllables = self._syllable_lookup()
+        is_easy = self._easy_words().__contains__
+        syllables, easy = array("I"), array("B")
+        for lowered in self._tokens.chunks(lower=True):
+            with _stage("syllables", self):
+                syllables.extend(map(word_syllables, lowered))
+            with _stage("easy_words", self):
+                easy.extend(map(is_easy, lowered))
+        with _stage("syllables", self):
+            self._memo("polysyllabcount", _count_at_least, syllables, 3)
+            self._memo("monosyllabcount", _count_below, syllables, 2)
+            self._memo("_forcast_counts", _forcast_sample, syllables)
+        for syllable_threshold in (0, 2):
+            self._memo(
+                ("difficult_words", syllable_threshold),
+                _count_difficult,
+                syllables,
+                easy,
+                syllable_threshold,
+            )
+        return syllables, easy
+
+    @property
+    def _syllables(self) -> array:
+        return self._lookups[0]
+
+    @_count
+    def _is_blank(self) -> bool:
+        with _stage("count_chars", self):
+            return not self.text.strip()
+
+    # --- raw counts ---
+    @_count
+    def char_count(self) -> int:
+        """Characters, ignoring whitespace."""
+        with _stage("count_chars", self):
+            return len(WHITESPACE_RE.sub("", self.text))
+
+    @_count
+    def letter_count(self) -> int:
+        """Alphabetic characters."""
+        with _stage("count_chars", self):
+            return sum(1 for ch in self.text if ch.isalpha())
+
+    @_count
+    def lexicon_count(self) -> int:
+        """Words, with punctuation removed."""
+        return len(self._tokens)
+
+    @_count
+    def sentence_count(self) -> int:
+        """Sentences of more than two words (at least one)."""
+        with _stage("segment_sentences", self):
+            return _count_sentences(self.text)
+
+    @_count
+    def syllable_count(self) -> int:
+        """Total syllables."""
+        if self._rm_apostrophe or not MIXED_CASE_CONTRACTION.search(self.text):
+            return sum(self._syllables)
+        # Contractions such as "DON'T" lose their apostrophe unless the text
+        # is lowercased first, so the per-token counts don't apply.
+        with _stage("syllables", self):
+            return _text_syllables(
+                self.text, self._rm_apostrophe, self._syllable_lookup()
+            )
+
+    @_count
+    def polysyllabcount(self) -> int:
+        """Words with three or more syllables."""
+        return _count_at_least(self._syllables, 3)
+
+    @_count
+    def monosyllabcount(self) -> int:
+        """Words with one syllable."""
+        return _count_below(self._syllables, 2)
+
+    @_count
+    def long_word_count(self) -> int:
+        """Words with more than 6 characters."""
+        return _count_longer_than(self._tokens.lengths, 6)
+
+    @_count
+    def miniword_count(self) -> int:
+        """Words with 3 characters or less."""
+        return _count_up_to(self._tokens.lengths, 3)
+
+    def difficult_words(self, syllable_threshold: int = 2) -> int:
+        """Counts difficult word tokens."""
+        return self._memo(
+            ("difficult_words", syllable_threshold),
+            lambda: _count_difficult(*self._lookups, syllable_threshold),
+        )
+
+    def difficult_words_list(self, syllable_threshold: int = 2) -> List[str]:
+        """Lists difficult word tokens, lowercased."""
+        syllables, easy = self._lookups
+        lowered = self._tokens.lowered()
+        with _stage("easy_words", self):
+            return [
+                word
+                for word, is_easy, syls in zip(lowered, easy, syllables)
+                if not is_easy
+                and not (syllable_threshold > 0 and syls < syllable_threshold)
+            ]
+
+    # --- averaged statistics ---
+    @property
+    def avg_sentence_length(self) -> float:
+        return float(self.lexicon_count / self.sentence_count)
+
+    @property
+    def avg_syllables_per_word(self) -> float:
+        if not self.lexicon_count:
+            return 0.0
+        return float(self.syllable_count) / float(self.lexicon_count)
+
+    @property
+    def avg_character_per_word(self) -> float:
+        if not self.lexicon_count:
+            return 0.0
+        return float(self.char_count) / float(self.lexicon_count)
+
+    @property
+    def avg_letter_per_word(self) -> float:
+        if not self.lexicon_count:
+            return 0.0
+        return float(self.letter_count) / float(self.lexicon_count)
+
+    @property
+    def avg_sentence_per_word(self) -> float:
+        if not self.lexicon_count:
+            return 0.0
+        return float(self.sentence_count) / float(self.lexicon_count)
+
+    @property
+    def words_per_sentence(self) -> float:
+        return float(self.lexicon_count / self.sentence_count)
+
+    # --- readability formulas ---
+    @property
+    def flesch_reading_ease(self) -> float:
+        if not self.lexicon_count:
+            return 0.0
+        return (
+            FRE_BASE
+            - (FRE_SENTENCE_LENGTH * self.avg_sentence_length)
+            - (FRE_SYLL_PER_WORD * self.avg_syllables_per_word)
+        )
+
+    @property
+    def flesch_kincaid_grade(self) -> float:
+        if not self.lexicon_count:
+            return 0.0
+        return (0.39 * self.avg_sentence_length) + (
+            11.8 * self.avg_syllables_per_word
+        ) - 15.59
+
+    @property
+    def smog_index(self) -> float:
+        if not self.lexicon_count or self.sentence_count < 3:
+            return 0.0
+        return (
+            1.043 * (30 * (self.polysyllabcount / self.sentence_count)) ** 0.5
+        ) + 3.1291
+
+    @property
+    def coleman_liau_index(self) -> float:
+        if not self.lexicon_count:
+            return 0.0
+        letters = self.avg_letter_per_word * 100
+        sentences = self.avg_sentence_per_word * 100
+        return (0.0588 * letters) - (0.296 * sentences) - 15.8
+
+    @property
+    def automated_readability_index(self) -> float:
+        if not self.lexicon_count:
+            return 0.0
+        return (
+            (4.71 * self.avg_character_per_word)
+            + (0.5 * self.words_per_sentence)
+            - 21.43
+        )
+
+    @_count
+    def _linsear_counts(self):
+        """(easy words, difficult words, sentences) in the first 100 words."""
+        return _linsear_sample(
+            leading_tokens(self.text, 100), self._rm_apostrophe, self._syllable_lookup()
+        )
+
+    @property
+    def linsear_write_formula(self) -> float:
+        if self._is_blank:
+            return -1.0
+        easy_word, difficult_word, sentences = self._linsear_counts
+        number = float((easy_word + (difficult_word * 3)) / sentences)
+        result = number / 2
+        if number <= 20:
+            result -= 1
+        return result
+
+    @_count
+    def _forcast_counts(self):
+        """(sample words, single-syllable words) in the first 150 words."""
+        return _forcast_sample(self._syllables)
+
+    @property
+    def forcast(self) -> float:
+        if self._is_blank:
+            return 0.0
+        sample_size, single_syllable_count = self._forcast_counts
+        if sample_size < 150:
+            warnings.warn(
+                "FORCAST formula is validated on a 150-word sample. "
+                "The text is shorter than 150 words, so the result may be less reliable."
+            )
+        return 20.0 - (single_syllable_count / 10.0)
+
+    @property
+    def dale_chall_readability_score(self) -> float:
+        if not self.lexicon_count:
+            return 0.0
+        pdw = (self.difficult_words(syllable_threshold=0) / self.lexicon_count) * 100
+        score = (0.1579 * pdw) + (0.0496 * self.avg_sentence_length)
+        if pdw > 5:
+            score += 3.6365
+        return score
+
+    @property
+    def gunning_fog(self) -> float:
+        if not self.lexicon_count:
+            return 0.0
+        per_complex_words = (self.polysyllabcount / self.lexicon_count) * 100
+        return 0.4 * (self.avg_sentence_length + per_complex_words)
+
+    @property
+    def lix(self) -> float:
+        if not self.lexicon_count:
+            return 0.0
+        per_long_words = (float(self.long_word_count) * 100) / self.lexicon_count
+        return self.lexicon_count / self.sentence_count + per_long_words
+
+    @property
+    def rix(self) -> float:
+        if not self.lexicon_count:
+            return 0.0
+        return self.long_word_count / self.sentence_count
+
+    @property
+    def spache_readability(self) -> float:
+        if not self.lexicon_count:
+            return 0.0
+        pdw = (self.difficult_words() / self.lexicon_count) * 100
+        return (0.141 * self.avg_sentence_length) + (0.086 * pdw) + 0.839
+
+    @property
+    def mcalpine_eflaw(self) -> float:
+        if not self.lexicon_count:
+            return 0.0
+        return (self.lexicon_count + self.miniword_count) / self.sentence_count
+
+    def reading_time(self, wpm: float = 200.0) -> float:
+        """Reading time in seconds based on words per minute."""
+        if not self.lexicon_count:
+            return 0.0
+        return (self.lexicon_count / wpm) * 60.0
+
+    def text_standard(self, as_string: bool = True) -> Union[float, str]:
+        """Consensus grade level of all formulas."""
+        if self._is_blank:
+            return "0th grade" if as_string else 0.0
+
+        grade_levels = []
+
+        fk_grade = self.flesch_kincaid_grade
+        grade_levels.extend([round(fk_grade), math.ceil(fk_grade)])
+
+        score = self.flesch_reading_ease
+        if 100 > score >= 90:
+            grade_levels.append(5)
+        elif 90 > score >= 80:
+            grade_levels.append(6)
+        elif 80 > score >= 70:
+            grade_levels.append(7)
+        elif 70 > score >= 60:
+            grade_levels.extend([8, 9])
+        elif 60 > score >= 50:
+            grade_levels.append(10)
+        elif 50 > score >= 40:
+            grade_levels.append(11)
+        elif 40 > score >= 30:
+            grade_levels.append(12)
+        else:
+            grade_levels.append(13)
+
+        for metric in (
+            "smog_index",
+            "coleman_liau_index",
+            "automated_readability_index",
+            "dale_chall_readability_score",
+            "linsear_write_formula",
+            "gunning_fog",
+        ):
+            val = getattr(self, metric)
+            if not isinstance(val, (int, float)) or val < 0:
+                continue
+            if metric == "dale_chall_readability_score":
+                grade_levels.append(_dc_score_to_grade(val))
+            else:
+                grade_levels.extend([round(val), math.ceil(val)])
+
+        if not grade_levels:
+            return "N/A" if as_string else 0.0
+
+        consensus_grade = Counter(int(g) for g in grade_levels).most_common(1)[0][0]
+
+        if not as_string:
+            return float(consensus_grade)
+
+        if consensus_grade <= 1:
+            return "Kindergarten to 1st grade"
+
+        lower_grade = consensus_grade - 1
+        return (
+            f"{lower_grade}{get_grade_suffix(lower_grade)} and "
+            f"{consensus_grade}{get_grade_suffix(consensus_grade)} grade"
+        )
+
+    # --- output ---
+    def score(
+        self, name: str, rounding: Optional[bool] = None, points: Optional[int] = None
+    ) -> Union[float, int, str]:
+        """Returns a statistic or formula by name, rounding formulas like the
+        module-level functions do."""
+        with _stage(f"formula:{name}", self):
+            value = getattr(self, name)
+            if callable(value):
+                value = value()
+        if name not in FORMULA_POINTS:
+            return value
+        if name == "linsear_write_formula" and self._is_blank:
+            return value
+        if self._analyzer is not None:
+            # the analyzer's settings stand in for the module's
+            config = self._analyzer.config
+            if rounding is None:
+                rounding = config.rounding
+            if points is None:
+                points = config.points
+            if points is None:
+                points = FORMULA_POINTS[name]
+        return _apply_rounding(value, rounding, points, FORMULA_POINTS[name])
+
+    def scores(
+        self,
+        metrics: Optional[Iterable[str]] = None,
+        rounding: Optional[bool] = None,
+        points: Optional[int] = None,
+    ) -> Dict[str, Union[float, int, str]]:
+        """Returns a dict of the requested metrics (default: all formulas)."""
+        if metrics is None:
+            metrics = DEFAULT_METRICS
+        return {name: self.score(name, rounding, points) for name in metrics}
+
+
+@instrumented
+def analyze(text: str) -> TextProfile:
+    """Returns a TextProfile of a text, reusing any counts already computed
+    for the same text and settings."""
+    key = (content_key(text), _rm_apostrophe, _lexicon_generation)
+    digest = content_digest(text)
+    counts = _document_cache.get(key, digest)
+    if counts is None:
+        counts = _document_cache.create(key, digest)
+    profile = TextProfile(text, counts)
+    profile._cache_key = key
+    return profile
 
 
 # --- core text statistics ---
-@lru_cache(maxsize=128)
+@instrumented
 def char_count(text: str, ignore_spaces: bool = True) -> int:
     """Counts the number of characters in a text."""
-    if ignore_spaces:
-        text = re.sub(r"\s", "", text)
-    return len(text)
+    if not ignore_spaces:
+        return len(text)
+    return analyze(text).char_count
 
 
-@lru_cache(maxsize=128)
+@instrumented
 def letter_count(text: str, ignore_spaces: bool = True) -> int:
     """Counts the letters (A–Z) in a text."""
-    if ignore_spaces:
-        text = re.sub(r"\s", "", text)
-    return sum(1 for ch in text if ch.isalpha())
+    return analyze(text).letter_count
 
 
+@instrumented
 def remove_punctuation(text: str) -> str:
     """Removes punctuation from a text."""
-    if _rm_apostrophe:
-        punctuation_regex = r"[^\w\s]"
-    else:
-        text = re.sub(r"\'(?![tsd]\b|ve\b|ll\b|re\b)", '"', text)
-        punctuation_regex = r"[^\w\s\']"
-    return re.sub(punctuation_regex, "", text)
+    return _strip_punctuation(text, _rm_apostrophe)
 
 
-@lru_cache(maxsize=128)
+@instrumented
 def lexicon_count(text: str, removepunct: bool = True) -> int:
     """Counts words in a text."""
-    if removepunct:
-        text = remove_punctuation(text)
-    return len(text.split())
+    if not removepunct:
+        return len(text.split())
+    return analyze(text).lexicon_count
 
 
-@lru_cache(maxsize=128)
+@instrumented
 def miniword_count(text: str, max_size: int = 3) -> int:
     """Counts common words with `max_size` letters or less."""
-    return len(
-        [word for word in remove_punctuation(text).split() if len(word) <= max_size]
-    )
+    profile = analyze(text)
+    if max_size != 3:
+        return profile._memo(
+            ("miniword_count", max_size),
+            lambda: _count_up_to(profile._tokens.lengths, max_size),
+        )
+    return profile.miniword_count
 
 
-@lru_cache(maxsize=128)
+@instrumented
 def syllable_count(text: str) -> int:
     """Calculates syllables in words using a multi-tiered approach."""
     if isinstance(text, bytes):
         text = text.decode(text_encoding)
-
-    text = text.lower()
-    text = remove_punctuation(text)
-
-    if not text:
-        return 0
-
-    total_syllables = 0
-    for word in text.split():
-        if word in custom_dict:
-            total_syllables += custom_dict[word]
-            continue
-
-        if word in cmu_pronouncing_dict:
-            try:
-                phones_list = cmu_pronouncing_dict[word]
-                syls = min(
-                    sum(1 for p in phones if p[-1].isdigit()) for phones in phones_list
-                )
-                total_syllables += syls
-                continue
-            except (TypeError, IndexError, ValueError):
-                pass
-
-        count = regex_syllable_count(word)
-        for ending, adjust in SPECIES_NAME_ADJUSTMENTS.items():
-            if word.endswith(ending):
-                count += adjust
-                break
-        total_syllables += count
-    return total_syllables
+    return analyze(text).syllable_count
 
 
 def regex_syllable_count(word: str) -> int:
@@ -276,248 +1177,144 @@ def regex_syllable_count(word: str) -> int:
     return max(1, vowel_runs - exceptions + additional)
 
 
-@lru_cache(maxsize=128)
+@instrumented
 def sentence_count(text: str) -> int:
     """Counts the sentences in a text."""
-    sentences = re.findall(r"\b[^.!?]+[.!?]*", text, re.UNICODE)
-    ignore_count = sum(1 for s in sentences if lexicon_count(s) <= 2)
-    return max(1, len(sentences) - ignore_count)
+    return analyze(text).sentence_count
 
 
 # --- averaged text statistics ---
-@lru_cache(maxsize=128)
+@instrumented
 @_handle_zero_division
 def avg_sentence_length(text: str) -> float:
     """Calculates the average sentence length."""
-    return float(lexicon_count(text) / sentence_count(text))
+    return analyze(text).avg_sentence_length
 
 
-@lru_cache(maxsize=128)
+@instrumented
 @_handle_zero_division
 def avg_syllables_per_word(text: str) -> float:
     """Gets the average number of syllables per word."""
-    return float(syllable_count(text)) / float(lexicon_count(text))
+    return analyze(text).avg_syllables_per_word
 
 
-@lru_cache(maxsize=128)
+@instrumented
 @_handle_zero_division
 def avg_character_per_word(text: str) -> float:
     """Calculates the average word length in characters."""
-    return float(char_count(text)) / float(lexicon_count(text))
+    return analyze(text).avg_character_per_word
 
 
-@lru_cache(maxsize=128)
+@instrumented
 @_handle_zero_division
 def avg_letter_per_word(text: str) -> float:
     """Calculates the average word length in letters."""
-    return float(letter_count(text)) / float(lexicon_count(text))
+    return analyze(text).avg_letter_per_word
 
 
-@lru_cache(maxsize=128)
+@instrumented
 @_handle_zero_division
 def avg_sentence_per_word(text: str) -> float:
     """Gets the number of sentences per word."""
-    return float(sentence_count(text)) / float(lexicon_count(text))
+    return analyze(text).avg_sentence_per_word
 
 
-@lru_cache(maxsize=128)
+@instrumented
 def words_per_sentence(text: str) -> float:
     """Calculates the average number of words per sentence."""
-    s_count = sentence_count(text)
-    return float(lexicon_count(text) / s_count) if s_count >= 1 else lexicon_count(text)
+    return analyze(text).words_per_sentence
 
 
 # --- readability formulas ---
+@instrumented
 def flesch_reading_ease(
     text: str, rounding: Optional[bool] = None, points: Optional[int] = None
 ) -> float:
     """Calculates the Flesch reading ease score."""
-    if not text.strip() or lexicon_count(text) == 0:
-        return 0.0
-
-    asl = avg_sentence_length(text)
-    asw = avg_syllables_per_word(text)
-
-    score = FRE_BASE - (FRE_SENTENCE_LENGTH * asl) - (FRE_SYLL_PER_WORD * asw)
-    return _apply_rounding(score, rounding, points, default_points=2)
+    return analyze(text).score("flesch_reading_ease", rounding, points)
 
 
+@instrumented
 def flesch_kincaid_grade(
     text: str, rounding: Optional[bool] = None, points: Optional[int] = None
 ) -> float:
     """Calculates the Flesch-Kincaid grade."""
-    if not text.strip() or lexicon_count(text) == 0:
-        return 0.0
-
-    asl = avg_sentence_length(text)
-    asw = avg_syllables_per_word(text)
-
-    score = (0.39 * asl) + (11.8 * asw) - 15.59
-    return _apply_rounding(score, rounding, points, default_points=1)
+    return analyze(text).score("flesch_kincaid_grade", rounding, points)
 
 
+@instrumented
 def smog_index(
     text: str, rounding: Optional[bool] = None, points: Optional[int] = None
 ) -> float:
     """Calculates the SMOG index."""
-    if not text.strip() or lexicon_count(text) == 0:
-        return 0.0
-    sentences = sentence_count(text)
-    if sentences < 3:
-        return 0.0
-    try:
-        poly_syllab = polysyllabcount(text)
-        smog = (1.043 * (30 * (poly_syllab / sentences)) ** 0.5) + 3.1291
-        return _apply_rounding(smog, rounding, points, default_points=1)
-    except ZeroDivisionError:
-        return 0.0
+    return analyze(text).score("smog_index", rounding, points)
 
 
+@instrumented
 def coleman_liau_index(
     text: str, rounding: Optional[bool] = None, points: Optional[int] = None
 ) -> float:
     """Calculates the Coleman-Liau index."""
-    if not text.strip() or lexicon_count(text) == 0:
-        return 0.0
-
-    alw = avg_letter_per_word(text)
-    asw = avg_sentence_per_word(text)
-
-    letters = alw * 100
-    sentences = asw * 100
+    return analyze(text).score("coleman_liau_index", rounding, points)
 
-    coleman = (0.0588 * letters) - (0.296 * sentences) - 15.8
-    return _apply_rounding(coleman, rounding, points, default_points=2)
 
-
-@_handle_zero_division
+@instrumented
 def automated_readability_index(
     text: str, rounding: Optional[bool] = None, points: Optional[int] = None
 ) -> float:
     """Calculates the automated readability index."""
-    if not text.strip() or lexicon_count(text) == 0:
-        return 0.0
-
-    acw = avg_character_per_word(text)
-    wps = words_per_sentence(text)
-
-    readability = (4.71 * acw) + (0.5 * wps) - 21.43
-    return _apply_rounding(readability, rounding, points, default_points=1)
+    return analyze(text).score("automated_readability_index", rounding, points)
 
 
+@instrumented
 def linsear_write_formula(
     text: str, rounding: Optional[bool] = None, points: Optional[int] = None
 ) -> float:
     """Calculates the Linsear Write formula."""
-    if not text.strip():
-        return -1.0
-
-    text_list = text.split()[:100]
-    easy_word = sum(1 for word in text_list if syllable_count(word) < 3)
-    difficult_word = len(text_list) - easy_word
-    text_sample = " ".join(text_list)
-
-    try:
-        number = float((easy_word + (difficult_word * 3)) / sentence_count(text_sample))
-    except ZeroDivisionError:
-        return -1.0
-
-    result = number / 2
-    if number <= 20:
-        result -= 1
-
-    return _apply_rounding(result, rounding, points, default_points=2)
+    return analyze(text).score("linsear_write_formula", rounding, points)
 
 
+@instrumented
 def forcast(
     text: str, rounding: Optional[bool] = None, points: Optional[int] = None
 ) -> float:
     """Calculates the FORCAST readability score."""
-    if not text.strip():
-        return 0.0
-
-    words = remove_punctuation(text).split()
-    if len(words) < 150:
-        warnings.warn(
-            "FORCAST formula is validated on a 150-word sample. "
-            "The text is shorter than 150 words, so the result may be less reliable."
-        )
-
-    sample = words[:150]
-    single_syllable_count = sum(1 for w in sample if syllable_count(w) == 1)
-    score = 20.0 - (single_syllable_count / 10.0)
-    return _apply_rounding(score, rounding, points, default_points=1)
+    return analyze(text).score("forcast", rounding, points)
 
 
-@_handle_zero_division
+@instrumented
 def dale_chall_readability_score(
     text: str, rounding: Optional[bool] = None, points: Optional[int] = None
 ) -> float:
     """Calculates the Dale-Chall readability score."""
-    if not text.strip() or lexicon_count(text) == 0:
-        return 0.0
-
-    word_count = lexicon_count(text)
-    pdw = (difficult_words(text, syllable_threshold=0) / word_count) * 100
-    asl = avg_sentence_length(text)
-
-    score = (0.1579 * pdw) + (0.0496 * asl)
-    if pdw > 5:
-        score += 3.6365
+    return analyze(text).score("dale_chall_readability_score", rounding, points)
 
-    return _apply_rounding(score, rounding, points, default_points=2)
 
-
-@_handle_zero_division
+@instrumented
 def gunning_fog(
     text: str, rounding: Optional[bool] = None, points: Optional[int] = None
 ) -> float:
     """Calculates the Gunning Fog index."""
-    if not text.strip() or lexicon_count(text) == 0:
-        return 0.0
-
-    asl = avg_sentence_length(text)
-    per_complex_words = (polysyllabcount(text) / lexicon_count(text)) * 100
+    return analyze(text).score("gunning_fog", rounding, points)
 
-    grade = 0.4 * (asl + per_complex_words)
-    return _apply_rounding(grade, rounding, points, default_points=2)
 
-
-@_handle_zero_division
+@instrumented
 def lix(
     text: str, rounding: Optional[bool] = None, points: Optional[int] = None
 ) -> float:
     """Calculates the LIX score."""
-    if not text.strip() or lexicon_count(text) == 0:
-        return 0.0
+    return analyze(text).score("lix", rounding, points)
 
-    tokens = remove_punctuation(text).split()
-    words_len = len(tokens)
-    long_words = sum(1 for w in tokens if len(w) > 6)
-    per_long_words = (float(long_words) * 100) / words_len
-    asl = words_len / sentence_count(text)
 
-    score = asl + per_long_words
-    return _apply_rounding(score, rounding, points, default_points=2)
-
-
-@_handle_zero_division
+@instrumented
 def rix(
     text: str, rounding: Optional[bool] = None, points: Optional[int] = None
 ) -> float:
     """Calculates the RIX score."""
-    if not text.strip() or lexicon_count(text) == 0:
-        return 0.0
-
-    words = remove_punctuation(text).split()
-    long_words_count = len([wrd for wrd in words if len(wrd) > 6])
-    sentences_count = sentence_count(text)
-
-    score = long_words_count / sentences_count
-    return _apply_rounding(score, rounding, points, default_points=2)
+    return analyze(text).score("rix", rounding, points)
 
 
-@_handle_zero_division
+@instrumented
 def spache_readability(
     text: str,
     float_output: bool = True,
@@ -525,156 +1322,86 @@ def spache_readability(
     points: Optional[int] = None,
 ) -> Union[float, int]:
     """Calculates SPACHE readability."""
-    if not text.strip() or lexicon_count(text) == 0:
-        return 0.0 if float_output else 0
-
-    asl = avg_sentence_length(text)
-    pdw = (difficult_words(text) / lexicon_count(text)) * 100
-
-    spache = (0.141 * asl) + (0.086 * pdw) + 0.839
-
+    profile = analyze(text)
     if not float_output:
-        return int(spache)
-    else:
-        return _apply_rounding(spache, rounding, points, default_points=2)
+        return int(profile.spache_readability)
+    return profile.score("spache_readability", rounding, points)
 
 
-@_handle_zero_division
+@instrumented
 def mcalpine_eflaw(
     text: str, rounding: Optional[bool] = None, points: Optional[int] = None
 ) -> float:
     """Calculates the McAlpine EFLAW score."""
-    if not text.strip() or lexicon_count(text) == 0:
-        return 0.0
-
-    score = (lexicon_count(text) + miniword_count(text)) / sentence_count(text)
-    return _apply_rounding(score, rounding, points, default_points=1)
+    return analyze(text).score("mcalpine_eflaw", rounding, points)
 
 
+@instrumented
 def text_standard(text: str, as_string: bool = True) -> Union[float, str]:
     """Calculates a consensus readability score."""
-    if not text.strip():
-        return "0th grade" if as_string else 0.0
-
-    grade_levels = []
-
-    fk_grade = flesch_kincaid_grade(text, rounding=False)
-    grade_levels.extend([round(fk_grade), math.ceil(fk_grade)])
-
-    score = flesch_reading_ease(text, rounding=False)
-    if 100 > score >= 90:
-        grade_levels.append(5)
-    elif 90 > score >= 80:
-        grade_levels.append(6)
-    elif 80 > score >= 70:
-        grade_levels.append(7)
-    elif 70 > score >= 60:
-        grade_levels.extend([8, 9])
-    elif 60 > score >= 50:
-        grade_levels.append(10)
-    elif 50 > score >= 40:
-        grade_levels.append(11)
-    elif 40 > score >= 30:
-        grade_levels.append(12)
-    else:
-        grade_levels.append(13)
-
-    metrics = [
-        smog_index,
-        coleman_liau_index,
-        automated_readability_index,
-        dale_chall_readability_score,
-        linsear_write_formula,
-        gunning_fog,
-    ]
-    for metric in metrics:
-        val = metric(text, rounding=False)
-        if not isinstance(val, (int, float)) or val < 0:
-            continue
-        if metric is dale_chall_readability_score:
-            grade_levels.append(_dc_score_to_grade(val))
-        else:
-            grade_levels.extend([round(val), math.ceil(val)])
-
-    if not grade_levels:
-        return "N/A" if as_string else 0.0
-
-    consensus_grade = Counter(int(g) for g in grade_levels).most_common(1)[0][0]
-
-    if not as_string:
-        return float(consensus_grade)
-
-    if consensus_grade <= 1:
-        return "Kindergarten to 1st grade"
-
-    lower_grade = consensus_grade - 1
-    return (
-        f"{lower_grade}{get_grade_suffix(lower_grade)} and "
-        f"{consensus_grade}{get_grade_suffix(consensus_grade)} grade"
-    )
+    profile = analyze(text)
+    with _stage("formula:text_standard", profile):
+        return profile.text_standard(as_string)
 
 
 # --- word and syllable counts ---
+@instrumented
 def polysyllabcount(text: str) -> int:
     """Counts words with three or more syllables."""
-    return sum(
-        1 for word in remove_punctuation(text).split() if syllable_count(word) >= 3
-    )
+    return analyze(text).polysyllabcount
 
 
+@instrumented
 def monosyllabcount(text: str) -> int:
     """Counts words with one syllable."""
-    return sum(
-        1 for word in remove_punctuation(text).split() if syllable_count(word) < 2
-    )
+    return analyze(text).monosyllabcount
 
 
+@instrumented
 def long_word_count(text: str) -> int:
     """Counts words with more than 6 characters."""
-    return sum(1 for word in remove_punctuation(text).split() if len(word) > 6)
+    return analyze(text).long_word_count
 
 
 # --- difficult word analysis ---
+@instrumented
 def difficult_words(text: str, syllable_threshold: int = 2) -> int:
     """Counts the number of difficult words (token-based)."""
-    return len(difficult_words_list(text, syllable_threshold))
+    return analyze(text).difficult_words(syllable_threshold)
 
 
+@instrumented
 def difficult_words_list(text: str, syllable_threshold: int = 2) -> List[str]:
     """Gets a list of difficult word tokens."""
-    tokens = remove_punctuation(text).lower().split()
-    return [word for word in tokens if is_difficult_word(word, syllable_threshold)]
+    return analyze(text).difficult_words_list(syllable_threshold)
 
 
+@instrumented
 def is_difficult_word(word: str, syllable_threshold: int = 2) -> bool:
     easy_word_set = _get_easy_words()
     w = word.lower()
     if w in easy_word_set:
         return False
-    if syllable_threshold > 0 and syllable_count(w) < syllable_threshold:
-        return False
+    if syllable_threshold > 0:
+        # a plain word needs no punctuation stripping or tokenizing
+        if w.isalpha():
+            syls = _word_syllables(w)
+        else:
+            syls = _text_syllables(w, _rm_apostrophe)
+        if syls < syllable_threshold:
+            return False
     return True
 
 
+@instrumented
 def is_easy_word(word: str, syllable_threshold: int = 2) -> bool:
     """Returns true if a word is easy."""
     return not is_difficult_word(word, syllable_threshold)
 
 
-@lru_cache(maxsize=1)
-def _get_easy_words() -> Set[str]:
-    """Loads the set of easy words from resources."""
-    try:
-        return {
-            ln.decode("utf-8").strip()
-            for ln in files("scireadability")
-            .joinpath("resources/en/easy_words.txt")
-            .read_bytes()
-            .splitlines()
-        }
-    except FileNotFoundError:
-        warnings.warn("Could not find the easy words vocabulary file.", Warning)
-        return set()
+def _get_easy_words() -> Container[str]:
+    """Returns the set of easy words."""
+    return _get_lexicon().easy
 
 
 # --- other utilities ---
@@ -693,6 +1420,7 @@ def _dc_score_to_grade(score: float) -> int:
         return 13  # College
 
 
+@instrumented
 def reading_time(
     text: str,
     wpm: float = 200.0,
@@ -700,8 +1428,5 @@ def reading_time(
     points: Optional[int] = None,
 ) -> float:
     """Calculates reading time in seconds based on words per minute."""
-    words = lexicon_count(text)
-    if words == 0:
-        return 0.0
-    seconds = (words / wpm) * 60.0
+    seconds = analyze(text).reading_time(wpm)
     return _apply_rounding(seconds, rounding, points, default_points=2)
@@ -0,0 +1,231 @@
+import codecs
+import re
+from collections import Counter
+from typing import IO, Iterable, Iterator, List, Union
+
+from . import scireadability as _core
+from .instrumentation import instrumented
+from .scireadability import (
+    MIXED_CASE_CONTRACTION,
+    SENTENCE_RE,
+    SENTENCE_WORD_RE,
+    WHITESPACE_RE,
+    TextProfile,
+    _forcast_sample,
+    _get_easy_words,
+    _linsear_sample,
+    _text_syllables,
+    _tokenize,
+    _word_syllables,
+)
+
+Source = Union[IO, Iterable[Union[str, bytes]]]
+
+# the rest of a sentence that started in an earlier segment
+SENTENCE_REST_RE = re.compile(r"[^.!?]*[.!?]*")
+TERMINATORS = ".!?"
+
+
+def _iter_chunks(source: Source, chunk_size: int) -> Iterator[str]:
+    """Yields text chunks from a file object or an iterable of chunks,
+    decoding bytes incrementally with `text_encoding`."""
+    if isinstance(source, (str, bytes)):
+        chunks: Iterable = (source,)
+    elif hasattr(source, "read"):
+        chunks = iter(lambda: source.read(chunk_size), source.read(0))
+    else:
+        chunks = source
+
+    decoder = None
+    for chunk in chunks:
+        if isinstance(chunk, bytes):
+            if decoder is None:
+                decoder = codecs.getincrementaldecoder(_core.text_encoding)()
+            chunk = decoder.decode(chunk)
+        if chunk:
+            yield chunk
+    if decoder is not None:
+        tail = decoder.decode(b"", final=True)
+        if tail:
+            yield tail
+
+
+def _segments(chunks: Iterable[str]) -> Iterator[str]:
+    """Regroups chunks into segments that end in whitespace (except the last),
+    so that no word, contraction or sentence terminator run is ever split."""
+    pending = ""
+    for chunk in chunks:
+        text = pending + chunk
+        if text[-1].isspace():
+            yield text
+            pending = ""
+            continue
+        parts = text.rsplit(None, 1)
+        if len(parts) == 1:
+            pending = text
+            continue
+        cut = len(text) - len(parts[1])
+        yield text[:cut]
+        pending = text[cut:]
+    if pending:
+        yield pending
+
+
+class _StreamCounter:
+    """Running counts over whitespace-terminated segments of a text."""
+
+    def __init__(self, rm_apostrophe: bool):
+        self.rm_apostrophe = rm_apostrophe
+        self.easy_words = _get_easy_words()
+        self.char_count = 0
+        self.letter_count = 0
+        self.lexicon_count = 0
+        self.word_lengths: Counter = Counter()
+        self.syllables: Counter = Counter()
+        self.difficult_syllables: Counter = Counter()
+        self.token_syllables = 0
+        self.text_syllables = 0
+        self.mixed_case_contraction = False
+        self.forcast_syllables: List[int] = []
+        self.linsear_tokens: List[str] = []
+        self.sentences = 0
+        self.ignored_sentences = 0
+        self.sentence_open = False
+        self.sentence_words = 0
+
+    def feed(self, segment: str) -> None:
+        rm_apostrophe = self.rm_apostrophe
+        self.char_count += len(WHITESPACE_RE.sub("", segment))
+        self.letter_count += sum(1 for ch in segment if ch.isalpha())
+
+        words = _tokenize(segment, rm_apostrophe)
+        lowered = [word.lower() for word in words]
+        syllables = [_word_syllables(word) for word in lowered]
+        self.lexicon_count += len(words)
+        self.word_lengths.update(map(len, words))
+        self.syllables.update(syllables)
+        self.difficult_syllables.update(
+            syls
+            for word, syls in zip(lowered, syllables)
+            if word not in self.easy_words
+        )
+        # FORCAST and Linsear Write only look at the start of the text
+        missing = 150 - len(self.forcast_syllables)
+        if missing > 0:
+            self.forcast_syllables.extend(syllables[:missing])
+        missing = 100 - len(self.linsear_tokens)
+        if missing > 0:
+            self.linsear_tokens.extend(segment.split()[:missing])
+
+        # TextProfile.syllable_count lowercases the whole text before
+        # tokenizing if it has a mixed-case contraction, so keep both sums.
+        token_syllables = sum(syllables)
+        self.token_syllables += token_syllables
+        if not rm_apostrophe:
+            mixed = MIXED_CASE_CONTRACTION.search(segment) is not None
+            self.mixed_case_contraction |= mixed
+            if segment.isascii() and not mixed:
+                self.text_syllables += token_syllables
+            else:
+                self.text_syllables += _text_syllables(segment, rm_apostrophe)
+
+        self._feed_sentences(segment)
+
+    def _feed_sentences(self, segment: str) -> None:
+        count_words = SENTENCE_WORD_RE.findall
+        start = 0
+        if self.sentence_open:
+            end = SENTENCE_REST_RE.match(segment).end()
+            self.sentence_words += len(count_words(segment, 0, end))
+            if not end or segment[end - 1] not in TERMINATORS:
+                return
+            self._close_sentence()
+            start = end
+        for match in SENTENCE_RE.finditer(segment, start):
+            start, end = match.span()
+            self.sentence_words = len(count_words(segment, start, end))
+            if end == len(segment) and segment[end - 1] not in TERMINATORS:
+                self.sentence_open = True
+            else:
+                self._close_sentence()
+
+    def _close_sentence(self) -> None:
+        self.sentences += 1
+        if self.sentence_words <= 2:
+            self.ignored_sentences += 1
+        self.sentence_open = False
+        self.sentence_words = 0
+
+    def finish(self) -> "StreamProfile":
+        if self.sentence_open:
+            self._close_sentence()
+        if self.rm_apostrophe or not self.mixed_case_contraction:
+            syllable_count = self.token_syllables
+        else:
+            syllable_count = self.text_syllables
+        syllables, lengths = self.syllables, self.word_lengths
+        counts = {
+            "_is_blank": self.char_count == 0,
+            "char_count": self.char_count,
+            "letter_count": self.letter_count,
+            "lexicon_count": self.lexicon_count,
+            "sentence_count": max(1, self.sentences - self.ignored_sentences),
+            "syllable_count": syllable_count,
+            "polysyllabcount": sum(n for syls, n in syllables.items() if syls >= 3),
+            "monosyllabcount": sum(n for syls, n in syllables.items() if syls < 2),
+            "long_word_count": sum(n for size, n in lengths.items() if size > 6),
+            "miniword_count": sum(n for size, n in lengths.items() if size <= 3),
+            "_forcast_counts": _forcast_sample(self.forcast_syllables),
+            "_linsear_counts": _linsear_sample(
+                self.linsear_tokens, self.rm_apostrophe
+            ),
+        }
+        return StreamProfile(counts, self.difficult_syllables, self.rm_apostrophe)
+
+
+class StreamProfile(TextProfile):
+    """The TextProfile of a streamed text.
+
+    It holds counts only: the text and its tokens were never kept, so
+    ``words`` and ``difficult_words_list`` are unavailable.
+    """
+
+    def __init__(self, counts, difficult_syllables: Counter, rm_apostrophe: bool):
+        super().__init__(None, counts)
+        self._rm_apostrophe = rm_apostrophe
+        self._difficult_syllables = difficult_syllables
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.char_count} non-space chars)"
+
+    @property
+    def words(self) -> List[str]:
+        raise ValueError("Tokens are not kept when a text is streamed.")
+
+    def difficult_words(self, syllable_threshold: int = 2) -> int:
+        """Counts difficult word tokens."""
+        return sum(
+            n
+            for syls, n in self._difficult_syllables.items()
+            if not (syllable_threshold > 0 and syls < syllable_threshold)
+        )
+
+    def difficult_words_list(self, syllable_threshold: int = 2) -> List[str]:
+        raise ValueError("Tokens are not kept when a text is streamed.")
+
+
+@instrumented
+def analyze_stream(source: Source, chunk_size: int = 1 << 16) -> StreamProfile:
+    """Profiles a text read incrementally from a file object (text or binary)
+    or an iterable of str/bytes chunks.
+
+    Memory use is bounded by the chunk size (plus the longest run of
+    non-whitespace), and the counts and scores equal those of
+    `analyze(text)` on the whole text.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be a positive integer.")
+    counter = _StreamCounter(_core._rm_apostrophe)
+    for segment in _segments(_iter_chunks(source, chunk_size)):
+        counter.feed(segment)
+    return counter.finish()
@@ -0,0 +1,71 @@
+"""Compact word token streams.
+
+A `TokenStream` keeps one punctuation-free copy of a text, the offsets at
+which it was cut into chunks, and the length of every whitespace-separated
+token in an array, rather than a list of token strings. Tokens are sliced out
+of the text only when strings are needed (dictionary keys, or the public word
+lists), one chunk at a time, so a profile of a long document holds a few bytes
+per word.
+"""
+
+import re
+from array import array
+from itertools import chain
+from typing import Iterator, List
+
+# texts are split a chunk at a time, each cut made at whitespace
+CHUNK_CHARS = 1 << 14
+
+WHITESPACE_RE = re.compile(r"\s")
+
+
+def leading_tokens(text: str, limit: int) -> List[str]:
+    """The first `limit` whitespace-separated tokens of a text, without
+    splitting the rest of it."""
+    return text.split(maxsplit=limit)[:limit]
+
+
+class TokenStream:
+    """The whitespace-separated tokens of a text.
+
+    Iterating yields the tokens as `text.split()` would, and `lowered()` their
+    lowercase forms, both built a chunk at a time. `lengths` holds the length
+    of each token.
+    """
+
+    __slots__ = ("text", "cuts", "lengths")
+
+    def __init__(self, text: str):
+        self.text = text
+        typecode = "I" if len(text) < 2**32 else "Q"
+        self.cuts = array(typecode, [0])
+        self.lengths = array("I")
+        pos = 0
+        while pos < len(text):
+            cut = WHITESPACE_RE.search(text, pos + CHUNK_CHARS)
+            pos = cut.end() if cut is not None else len(text)
+            self.cuts.append(pos)
+            self.lengths.extend(map(len, self._chunk(len(self.cuts) - 2)))
+
+    def _chunk(self, index: int, lower: bool = False) -> List[str]:
+        chunk = self.text[self.cuts[index] : self.cuts[index + 1]]
+        # lowercasing never adds or removes whitespace
+        return (chunk.lower() if lower else chunk).split()
+
+    def chunks(self, lower: bool = False) -> Iterator[List[str]]:
+        """Yields the tokens in lists, one per chunk of the text."""
+        for index in range(len(self.cuts) - 1):
+            yield self._chunk(index, lower)
+
+    def __len__(self) -> int:
+        return len(self.lengths)
+
+    def __iter__(self) -> Iterator[str]:
+        return chain.from_iterable(self.chunks())
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({len(self)} tokens)"
+
+    def lowered(self) -> Iterator[str]:
+        """The lowercased tokens."""
+        return chain.from_iterable(self.chunks(lower=True))
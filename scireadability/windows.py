@@ -0,0 +1,175 @@
+import re
+from array import array
+from bisect import bisect_left
+from itertools import accumulate
+from typing import Dict, Iterable, List, NamedTuple, Optional
+
+from . import scireadability as _core
+from .instrumentation import instrumented
+from .scireadability import (
+    METRICS,
+    MIXED_CASE_CONTRACTION,
+    TextProfile,
+    _get_easy_words,
+    _sentence_spans,
+    _strip_punctuation,
+    _text_syllables,
+    _word_syllables,
+)
+
+TOKEN_RE = re.compile(r"\S+")
+# these read a sample of raw tokens rather than per-word counts
+WINDOW_UNSUPPORTED = ("linsear_write_formula", "text_standard")
+
+
+class WindowScores(NamedTuple):
+    """Per-window results: the character span of each window's words and,
+    for every metric, one score per window."""
+
+    starts: array
+    ends: array
+    scores: Dict[str, array]
+
+
+def _prefix(values: Iterable[int]) -> List[int]:
+    return list(accumulate(values, initial=0))
+
+
+@instrumented
+def readability_profile(
+    text: str,
+    window: int = 300,
+    stride: int = 50,
+    metrics: Optional[Iterable[str]] = None,
+    rounding: Optional[bool] = None,
+    points: Optional[int] = None,
+) -> WindowScores:
+    """Scores every `window`-word slice of a text, moving `stride` words at a
+    time, e.g. to find dense sections of a long paper.
+
+    The text is tokenized once; each window is scored from prefix sums of
+    per-word counts, so the cost is linear in the length of the text.
+    Sentences are those of the whole text, a sentence cut by the start of a
+    window counting as one. A text shorter than `window` gets a single
+    window, and a window that covers the whole text scores exactly like the
+    text itself. Linsear Write and text_standard are not available.
+    """
+    metrics = tuple(metrics) if metrics is not None else ("flesch_kincaid_grade",)
+    for name in metrics:
+        if name not in METRICS or name in WINDOW_UNSUPPORTED:
+            raise ValueError(f"Unsupported metric for windows: {name}")
+    if window < 1 or stride < 1:
+        raise ValueError("window and stride must be positive integers.")
+
+    rm_apostrophe = _core._rm_apostrophe
+    easy_words = _get_easy_words()
+    starts, ends = array("Q"), array("Q")
+    chars: List[int] = []
+    letters: List[int] = []
+    syllables: List[int] = []
+    text_syllables: List[int] = []
+    mixed: List[int] = []
+    lengths: List[int] = []
+    easy: List[bool] = []
+    leading_chars = 0
+    for match in TOKEN_RE.finditer(text):
+        token = match.group()
+        word = _strip_punctuation(token, rm_apostrophe)
+        if not word:
+            # punctuation-only tokens count towards the preceding word
+            if chars:
+                chars[-1] += len(token)
+            else:
+                leading_chars += len(token)
+            continue
+        lowered = word.lower()
+        syls = _word_syllables(lowered)
+        has_mixed = (
+            not rm_apostrophe and MIXED_CASE_CONTRACTION.search(token) is not None
+        )
+        starts.append(match.start())
+        ends.append(match.end())
+        chars.append(len(token))
+        letters.append(sum(1 for ch in token if ch.isalpha()))
+        syllables.append(syls)
+        if rm_apostrophe or (token.isascii() and not has_mixed):
+            text_syllables.append(syls)
+        else:
+            text_syllables.append(_text_syllables(token, rm_apostrophe))
+        mixed.append(has_mixed)
+        lengths.append(len(word))
+        easy.append(lowered in easy_words)
+    if chars:
+        chars[0] += leading_chars
+
+    # the sentences that count (more than two words)
+    counted = [
+        (start, end) for start, end, words in _sentence_spans(text) if words > 2
+    ]
+    sentence_starts = [start for start, _ in counted]
+    sentence_ends = [end for _, end in counted]
+    started_before = [bisect_left(sentence_starts, start) for start in starts]
+    started_by_end = [bisect_left(sentence_starts, end) for end in ends]
+
+    p_chars = _prefix(chars)
+    p_letters = _prefix(letters)
+    p_syllables = _prefix(syllables)
+    p_text_syllables = _prefix(text_syllables)
+    p_mixed = _prefix(mixed)
+    p_poly = _prefix(syls >= 3 for syls in syllables)
+    p_mono = _prefix(syls < 2 for syls in syllables)
+    p_single = _prefix(syls == 1 for syls in syllables)
+    p_long = _prefix(length > 6 for length in lengths)
+    p_mini = _prefix(length <= 3 for length in lengths)
+    p_difficult_any = _prefix(not is_easy for is_easy in easy)
+    p_difficult = _prefix(
+        not is_easy and syls >= 2 for is_easy, syls in zip(easy, syllables)
+    )
+
+    n_words = len(syllables)
+    if n_words == 0:
+        first_words: Iterable[int] = ()
+    else:
+        first_words = range(0, max(n_words - window, 0) + 1, stride)
+    scores = {name: array("d") for name in metrics}
+    window_starts, window_ends = array("Q"), array("Q")
+    for first in first_words:
+        end = min(first + window, n_words)
+        last = end - 1
+        sentences = started_by_end[last] - started_before[first]
+        previous = started_before[first] - 1
+        if (
+            started_by_end[first] == previous + 1
+            and previous >= 0
+            and sentence_ends[previous] > starts[first]
+        ):
+            sentences += 1  # the window starts inside a sentence
+        if p_mixed[end] - p_mixed[first] and not rm_apostrophe:
+            syllable_count = p_text_syllables[end] - p_text_syllables[first]
+        else:
+            syllable_count = p_syllables[end] - p_syllables[first]
+        sample_end = min(first + 150, end)
+        counts = {
+            "_is_blank": False,
+            "char_count": p_chars[end] - p_chars[first],
+            "letter_count": p_letters[end] - p_letters[first],
+            "lexicon_count": end - first,
+            "sentence_count": max(1, sentences),
+            "syllable_count": syllable_count,
+            "polysyllabcount": p_poly[end] - p_poly[first],
+            "monosyllabcount": p_mono[end] - p_mono[first],
+            "long_word_count": p_long[end] - p_long[first],
+            "miniword_count": p_mini[end] - p_mini[first],
+            ("difficult_words", 0): p_difficult_any[end] - p_difficult_any[first],
+            ("difficult_words", 2): p_difficult[end] - p_difficult[first],
+            "_forcast_counts": (
+                sample_end - first,
+                p_single[sample_end] - p_single[first],
+            ),
+        }
+        profile = TextProfile(None, counts)
+        for name in metrics:
+            scores[name].append(profile.score(name, rounding, points))
+        window_starts.append(starts[first])
+        window_ends.append(ends[last])
+    return WindowScores(window_starts, window_ends, scores)
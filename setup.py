@@ -3,7 +3,7 @@ from io import open
 
 setup(
     name="scireadability",
-    packages=["scireadability"],
+    packages=["scireadability", "scireadability.formulas"],
     version="2.0.2",
     description="Calculate statistical features from text, mainly scientific literature",
     author="Robert Roth",
@@ -20,6 +20,12 @@ setup(
     },
     include_package_data=True,
     install_requires=["appdirs"],
+    extras_require={
+        "numpy": ["numpy"],
+        "pandas": ["pandas"],
+        "arrow": ["pyarrow"],
+    },
+    entry_points={"console_scripts": ["scireadability=scireadability.cli:main"]},
     license="MIT",
     python_requires=">=3.10",
     project_urls={
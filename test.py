@@ -3,10 +3,15 @@
 
 """Test suite for scireadability (English-Only Version)"""
 
+import asyncio
+import dataclasses
+import io
 import json
 import os
 import shutil
-from scireadability import dictionary_utils
+import subprocess
+import sys
+from scireadability import cli, dictionary_utils, lexicon
 import scireadability
 import pytest
 
@@ -170,6 +175,22 @@ def test_remove_punctuation_excl_apostrophe():
     assert text == punct_text_result_w_apostr
 
 
+def test_tokenize_contractions():
+    from scireadability.scireadability import _tokenize
+
+    text = "'Tis the doctors' cat's toy, isn't it? 'Quoted' we'll--'d, rock'n'roll"
+    assert _tokenize(text, False) == [
+        "Tis", "the", "doctors", "cat's", "toy", "isn't", "it",
+        "Quoted", "we'll'd", "rocknroll",
+    ]  # fmt: skip
+    assert _tokenize(text, True) == [
+        "Tis", "the", "doctors", "cats", "toy", "isnt", "it",
+        "Quoted", "welld", "rocknroll",
+    ]  # fmt: skip
+    assert _tokenize(punct_text, False) == punct_text_result_w_apostr.split()
+    assert _tokenize("no apostrophes here.", False) == ["no", "apostrophes", "here"]
+
+
 def test_lexicon_count():
     count = scireadability.lexicon_count(long_test)
     count_punc = scireadability.lexicon_count(long_test, removepunct=False)
@@ -215,11 +236,52 @@ def test_syllable_count(text: str, n_syllables: int, margin: int):
     assert diff <= margin
 
 
+def test_cmu_syllable_table():
+    from scireadability import scireadability as core
+
+    table = core._get_lexicon().cmu
+    pronunciations = scireadability.load_cmu_pronunciations()
+    assert table["hello"] == 2
+    for word in ("hello", "fire", "interpersonal", "marriage"):
+        expected = min(
+            sum(1 for p in phones if p[-1].isdigit())
+            for phones in pronunciations[word]
+        )
+        assert table[word] == expected
+
+
 def test_sentence_count():
     count = scireadability.sentence_count(long_test)
     assert count == 17
 
 
+def test_sentence_spans():
+    from scireadability.scireadability import _sentence_spans
+
+    text = "Hi there. It's a cat's toy -- isn't it? 'Yes' . Ok!"
+    assert _sentence_spans(text) == [(0, 9, 2), (10, 39, 6), (41, 47, 1), (48, 51, 1)]
+    assert scireadability.sentence_count(text) == 1
+    assert _sentence_spans("") == []
+
+
+def test_token_stream():
+    from scireadability import tokens
+
+    text = "  Ünïcode  İstanbul\tword\n\nsplit across   chunks "
+    original = tokens.CHUNK_CHARS
+    tokens.CHUNK_CHARS = 5
+    try:
+        stream = tokens.TokenStream(text)
+    finally:
+        tokens.CHUNK_CHARS = original
+    assert len(stream.cuts) > 3
+    assert list(stream) == text.split()
+    assert list(stream.lowered()) == [word.lower() for word in text.split()]
+    assert list(stream.lengths) == [len(word) for word in text.split()]
+    assert len(tokens.TokenStream("")) == 0
+    assert tokens.leading_tokens(long_test, 100) == long_test.split()[:100]
+
+
 def test_avg_sentence_length():
     # Test for the precise, unrounded value
     avg = scireadability.avg_sentence_length(long_test)
@@ -363,47 +425,243 @@ def test_reading_time():
     scireadability.set_rounding(False)
 
 
-def test_lru_caching():
-    # Clear any cache before starting
-    scireadability.sentence_count.cache_clear()
+def test_document_caching():
+    scireadability._cache_clear()
 
-    # Call the function for the first time (a "miss")
+    # The first call on a text is a miss
     scireadability.sentence_count(long_test)
-    assert scireadability.sentence_count.cache_info().misses == 1
-    assert scireadability.sentence_count.cache_info().hits == 0
+    info = scireadability.document_cache_info()
+    assert (info.misses, info.hits, info.entries) == (1, 0, 1)
 
-    # Call it a second time (should be a "hit")
+    # Later calls on the same text, from any function, are hits
     scireadability.sentence_count(long_test)
-    assert (
-        scireadability.sentence_count.cache_info().misses == 1
-    )  # Misses don't increase
-    assert scireadability.sentence_count.cache_info().hits >= 1  # Hits increase
+    scireadability.avg_sentence_length(long_test)
+    info = scireadability.document_cache_info()
+    assert (info.misses, info.hits) == (1, 2)
+    assert 0 < info.currbytes <= info.maxbytes
+
+    # Only counts are kept, never the text itself
+    counts = scireadability.analyze(long_test).counts
+    assert counts["sentence_count"] == scireadability.sentence_count(long_test)
+    assert all(not isinstance(value, str) for value in counts.values())
+
+
+def test_document_cache_survives_key_collisions(monkeypatch):
+    scireadability._cache_clear()
+    core = scireadability.scireadability
+    monkeypatch.setattr(core, "content_key", lambda text: (0, 0))
+    try:
+        assert scireadability.lexicon_count(long_test) == 372
+        assert scireadability.lexicon_count(short_test) != 372
+        assert scireadability.lexicon_count(long_test) == 372
+        info = scireadability.document_cache_info()
+        assert (info.hits, info.misses, info.entries) == (0, 3, 1)
+    finally:
+        scireadability._cache_clear()
+
+
+def test_document_cache_is_keyed_on_settings():
+    scireadability._cache_clear()
+    text = "Isn't it the doctor's cat? It isn't."
+    with_apostrophes = scireadability.lexicon_count(text)
+    scireadability.set_rm_apostrophe(True)
+    try:
+        assert scireadability.lexicon_count(text) == with_apostrophes
+        assert scireadability.document_cache_info().entries == 2
+    finally:
+        scireadability.set_rm_apostrophe(False)
+
+
+@pytest.mark.filterwarnings("ignore:FORCAST")
+def test_analyzer_matches_module_settings():
+    texts = [long_test, punct_text, "DON'T STOP. It'S fine!", empty_str]
+    config = scireadability.Config(rounding=True, points=3, rm_apostrophe=True)
+    scireadability.set_rm_apostrophe(True)
+    scireadability.set_rounding(True, 3)
+    try:
+        expected = [scireadability.TextProfile(t).scores() for t in texts]
+    finally:
+        scireadability.set_rm_apostrophe(False)
+        scireadability.set_rounding(False)
+
+    analyzer = scireadability.Analyzer(config)
+    default = scireadability.Analyzer()
+    assert [analyzer.scores(t) for t in texts] == expected
+    # module settings don't leak into analyzers, nor analyzers into them
+    scireadability.set_rounding(True, 1)
+    try:
+        assert [analyzer.scores(t) for t in texts] == expected
+        assert default.score(long_test, "gunning_fog") == (
+            scireadability.TextProfile(long_test).gunning_fog
+        )
+    finally:
+        scireadability.set_rounding(False)
+    assert analyzer.document_cache_info().hits == len(texts)
+    assert scireadability.remove_punctuation("doctor's") == "doctor's"
+
+
+def test_analyzer_custom_dict():
+    config = scireadability.Config(custom_dict={"Pterodactyl": 7})
+    assert config.custom_dict == (("pterodactyl", 7),)
+    assert hash(config) == hash(scireadability.Config(custom_dict=[("pterodactyl", 7)]))
+    analyzer = scireadability.Analyzer(config)
+    assert analyzer.score("pterodactyl", "syllable_count") == 7
+    assert scireadability.syllable_count("pterodactyl") != 7
+    default = analyzer.replace(custom_dict=None)
+    assert default.score("pterodactyl", "syllable_count") == (
+        scireadability.syllable_count("pterodactyl")
+    )
+    with pytest.raises(ValueError):
+        scireadability.Config(lexicon_backend="disk")
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        config.rounding = True
+
+
+def test_document_cache_evicts_by_size():
+    scireadability._cache_clear()
+    default_size = scireadability.document_cache_info().maxbytes
+    scireadability.set_document_cache_size(4096)
+    try:
+        for i in range(50):
+            scireadability.flesch_reading_ease(f"{short_test} {i}")
+        info = scireadability.document_cache_info()
+        assert info.currbytes <= 4096
+        assert info.evictions > 0
+        assert info.entries < 50
+    finally:
+        scireadability.set_document_cache_size(default_size)
 
 
 def test_cache_clearing():
-    # Clear all caches initially
     scireadability._cache_clear()
 
-    # 1. Populate the cache for a specific function
     scireadability.avg_sentence_length(short_test)
-    info_before = scireadability.avg_sentence_length.cache_info()
-    assert info_before.misses == 1
-
-    # 2. Call again to confirm a cache hit
     scireadability.avg_sentence_length(short_test)
-    info_hit = scireadability.avg_sentence_length.cache_info()
-    assert info_hit.hits >= 1
+    assert scireadability.document_cache_info().hits >= 1
 
-    # 3. Use the global clear function
     scireadability._cache_clear()
 
-    # 4. Verify the cache for that specific function is now empty
-    info_after = scireadability.avg_sentence_length.cache_info()
-    assert info_after.currsize == 0
+    info_after = scireadability.document_cache_info()
+    assert info_after.entries == 0
+    assert info_after.currbytes == 0
     assert info_after.hits == 0
     assert info_after.misses == 0
 
 
+def test_word_cache():
+    scireadability._cache_clear()
+    default_size = scireadability.word_cache_info().maxsize
+    scireadability.set_word_cache_size(2)
+    try:
+        scireadability.syllable_count("Alpha beta alpha gamma.")
+        info = scireadability.word_cache_info()
+        assert (info.hits, info.misses, info.evictions) == (1, 3, 1)
+        assert (info.maxsize, info.currsize) == (2, 2)
+        assert info.hit_rate == 0.25
+
+        # single words skip the document caches entirely
+        assert scireadability.is_difficult_word("gamma")
+        assert scireadability.word_cache_info().hits == 2
+
+        scireadability.set_word_cache_size(1)
+        assert scireadability.word_cache_info().evictions == 2
+        with pytest.raises(ValueError):
+            scireadability.set_word_cache_size(-1)
+    finally:
+        scireadability.set_word_cache_size(default_size)
+        scireadability._cache_clear()
+    assert scireadability.word_cache_info().currsize == 0
+
+
+def test_stats():
+    scireadability._cache_clear()
+    scireadability.reset_stats()
+    scireadability.flesch_reading_ease(long_test)
+    assert scireadability.stats()["calls"] == {}
+    assert sum(scireadability.stats()["syllable_tiers"].values()) == 0
+
+    scireadability.enable_stats()
+    try:
+        scireadability.flesch_reading_ease(long_test)
+        scireadability.syllable_count("Aspergillus fumigatus and Homo sapiens.")
+        report = scireadability.stats()
+    finally:
+        scireadability.enable_stats(False)
+
+    assert report["enabled"]
+    assert report["calls"]["flesch_reading_ease"]["calls"] == 1
+    assert report["calls"]["flesch_reading_ease"]["seconds"] >= 0
+    assert report["calls"]["syllable_count"]["calls"] == 1
+    assert report["caches"]["document"]["hits"] == 1
+    assert 0 < report["caches"]["word"]["hit_rate"] < 1
+    tiers = report["syllable_tiers"]
+    assert tiers["cmu"] >= 2 and tiers["regex"] >= 1
+
+    scireadability.reset_stats()
+    report = scireadability.stats()
+    assert report["calls"] == {}
+    assert report["caches"]["document"]["hits"] == 0
+    assert report["caches"]["document"]["entries"] == 2
+
+
+def test_profile_stages():
+    scireadability._cache_clear()
+    species_text = "Aspergillus fumigatus and Burkholderia mallei grow."
+    with scireadability.profile() as profiler:
+        scireadability.text_standard(long_test)
+        scireadability.syllable_count(species_text)
+        scireadability.gunning_fog(long_test)  # counts come from the cache
+    scireadability.text_standard(short_test)  # outside the block
+
+    stages = profiler.stages()
+    for name in (
+        "load_lexicon",
+        "normalize",
+        "tokenize",
+        "segment_sentences",
+        "syllables",
+        "syllables_cmu",
+        "syllables_regex",
+        "easy_words",
+        "formula",
+    ):
+        assert stages[name] >= 0
+    documents = profiler.documents()
+    assert [document["chars"] for document in documents] == [
+        len(long_test),
+        len(species_text),
+    ]
+    assert documents[0]["stages"]["segment_sentences"] > 0
+    report = profiler.to_dict()
+    assert report["seconds"] == pytest.approx(sum(stages.values()))
+
+    lines = profiler.collapsed().splitlines()
+    assert "formula:text_standard;syllables" in [line.split()[0] for line in lines]
+    assert all(line.rsplit(" ", 1)[1].isdigit() for line in lines)
+
+
+def test_import_does_not_load_lexicons():
+    code = (
+        "import scireadability\n"
+        "from scireadability import scireadability as core\n"
+        "print(int(core._lexicon is not None))\n"
+        "scireadability.char_count('Hello there.')\n"
+        "scireadability.reading_time('Hello there.')\n"
+        "print(int(core._lexicon is not None))\n"
+        "scireadability.warmup()\n"
+        "print(int(core._lexicon is not None))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+    )
+    counts = [line for line in result.stdout.splitlines() if line[:1].isdigit()]
+    assert counts == ["0", "0", "1"]
+
+
 def test_unicode_support():
     scireadability.text_standard(
         "\u3042\u308a\u304c\u3068\u3046\u3054\u3056\u3044\u307e\u3059"
@@ -461,6 +719,58 @@ def test_empty_string_handling():
     assert scireadability.text_standard(empty_str) == "0th grade"
 
 
+def test_text_profile_matches_functions():
+    scireadability.set_rounding(False)
+    profile = scireadability.TextProfile(long_test)
+    assert profile.lexicon_count == 372
+    assert profile.sentence_count == 17
+    assert profile.polysyllabcount == 36
+    assert profile.difficult_words() == 67
+    assert profile.flesch_reading_ease == 60.90828273244783
+    assert profile.gunning_fog == 12.623908918406073
+    assert profile.text_standard() == "11th and 12th grade"
+    assert profile.scores(["lix", "rix"]) == {
+        "lix": scireadability.lix(long_test),
+        "rix": scireadability.rix(long_test),
+    }
+
+
+def test_text_profile_is_lazy():
+    profile = scireadability.TextProfile(long_test)
+    assert profile.char_count == 1748
+    assert "words" not in vars(profile)
+    assert profile.lexicon_count == 372
+    assert "_syllables" not in vars(profile)
+
+
+def test_text_profile_score_rounding():
+    profile = scireadability.analyze(long_test)
+    assert profile.score("mcalpine_eflaw", rounding=True, points=1) == 30.8
+    assert profile.score("linsear_write_formula", rounding=True) == 15.0
+    blank = scireadability.analyze(empty_str)
+    assert blank.score("linsear_write_formula", rounding=True) == -1.0
+
+
+def test_syllable_count_uppercase_contractions():
+    text = "DON'T STOP. IT'S fine. They'VE gone home."
+    expected = sum(
+        scireadability.syllable_count(word) for word in text.lower().split()
+    )
+    assert scireadability.syllable_count(text) == expected
+
+
+def test_syllable_count_dotted_capital_i():
+    # "İ" lowercases to "i" plus a combining dot, which punctuation removal
+    # drops; counts must not depend on the order of the two steps
+    assert scireadability.syllable_count("İİİİ") == 2
+    assert scireadability.polysyllabcount("İİİİ") == 0
+    text = "İstanbul and KİLİMANJARO are far."
+    assert scireadability.syllable_count(text) == scireadability.syllable_count(
+        "istanbul and kilimanjaro are far."
+    )
+    assert scireadability.difficult_words_list(text) == ["i̇stanbul", "ki̇li̇manjaro"]
+
+
 # --- Dictionary Util Tests ---
 def test_load_custom_syllable_dict_user_dict_exists_valid_json(test_env):
     test_config_dir, _ = test_env
@@ -517,3 +827,565 @@ def test_overwrite_custom_dict_valid_json_file(test_env):
     loaded_dict = dictionary_utils.load_custom_syllable_dict()
 
     assert loaded_dict == new_dict_content["CUSTOM_SYLLABLE_DICT"]
+
+
+def test_dictionary_edit_keeps_lexicon(test_env):
+    _, test_resources_dir = test_env
+    default_dict_path = dictionary_utils._get_default_dict_path()
+    with open(
+        os.path.join(test_resources_dir, default_dict_path), "w", encoding="utf-8"
+    ) as f:
+        json.dump({"CUSTOM_SYLLABLE_DICT": {}}, f)
+    core = scireadability.scireadability
+    scireadability._cache_clear()
+    text = "Alpha beta gamma."
+    try:
+        before = scireadability.syllable_count(text)
+        cmu = core._get_lexicon().cmu
+        assert scireadability.word_cache_info().currsize == 3
+
+        scireadability.add_word_to_dictionary("Alpha", 7)
+        # CMUdict is kept, and only the edited word leaves the word cache
+        assert core._get_lexicon().cmu is cmu
+        assert scireadability.word_cache_info().currsize == 2
+        # documents counted under the old lexicon are no longer found
+        assert scireadability.syllable_count(text) == before - 2 + 7
+        assert scireadability.document_cache_info().misses == 2
+
+        scireadability.revert_dictionary_to_default()
+        assert core._get_lexicon().cmu is cmu
+        assert scireadability.syllable_count(text) == before
+    finally:
+        scireadability._cache_clear()
+
+
+def test_dictionary_adds_stay_linear(test_env, monkeypatch, capsys):
+    import time
+
+    _, test_resources_dir = test_env
+    default_dict_path = dictionary_utils._get_default_dict_path()
+    with open(
+        os.path.join(test_resources_dir, default_dict_path), "w", encoding="utf-8"
+    ) as f:
+        json.dump({"CUSTOM_SYLLABLE_DICT": {}}, f)
+    core = scireadability.scireadability
+    scireadability._cache_clear()
+    try:
+        scireadability.warmup()
+        snapshot = scireadability.Analyzer()
+        snapshot.warmup()
+
+        # added words are applied directly, without rereading the dictionary
+        def reload():
+            raise AssertionError("the custom dictionary was reread")
+
+        monkeypatch.setattr(core, "load_custom_syllable_dict", reload)
+        seconds = []
+        for batch in range(3):
+            start = time.perf_counter()
+            for i in range(300):
+                scireadability.add_word_to_dictionary(f"w{batch}x{i}", 5)
+            seconds.append(time.perf_counter() - start)
+        assert seconds[-1] < 3 * seconds[0]
+        scireadability.add_words_to_dictionary({"Alpha": 7, "w0x0": 6})
+
+        assert len(core._get_lexicon().custom) == 901
+        assert scireadability.syllable_count("w2x299 alpha w0x0") == 18
+        assert snapshot.score("the alpha", "syllable_count") == 3
+    finally:
+        scireadability._cache_clear()
+    capsys.readouterr()
+
+
+def _add_terms_in_process(config_dir, start):
+    dictionary_utils.user_config_dir = lambda package_name: config_dir
+    for i in range(start, start + 50):
+        dictionary_utils.add_term_to_custom_dict(f"word{i}", 2)
+
+
+def test_custom_dict_log_and_compaction(test_env, monkeypatch, capsys):
+    test_config_dir, test_resources_dir = test_env
+    default_dict_path = dictionary_utils._get_default_dict_path()
+    with open(
+        os.path.join(test_resources_dir, default_dict_path), "w", encoding="utf-8"
+    ) as f:
+        json.dump({"CUSTOM_SYLLABLE_DICT": {}}, f)
+    user_dict_path = dictionary_utils._get_user_dict_path()
+    log_path = dictionary_utils._get_user_log_path(user_dict_path)
+
+    dictionary_utils.add_term_to_custom_dict("Pterodactyl", 4)
+    dictionary_utils.add_terms_to_custom_dict({"alpha": 2, "beta": 2})
+    dictionary_utils.add_terms_to_custom_dict({"alpha": 3})
+    assert not os.path.exists(user_dict_path)  # only the log was written
+    with pytest.raises(ValueError):
+        dictionary_utils.add_terms_to_custom_dict({"gamma": 2, "delta": 0})
+
+    # invalid terms are refused on every path, before anything is written
+    bad_file = os.path.join(test_config_dir, "bad.json")
+    with open(bad_file, "w", encoding="utf-8") as f:
+        json.dump({"CUSTOM_SYLLABLE_DICT": {"zorblax": "3"}}, f)
+    with pytest.raises(ValueError):
+        dictionary_utils.add_terms_from_file(bad_file)
+    for word, syllables in (("zorblax", True), ("", 2), ("zorblax", "3")):
+        with pytest.raises(ValueError):
+            dictionary_utils.add_term_to_custom_dict(word, syllables)
+    assert "zorblax" not in dictionary_utils.load_custom_syllable_dict()
+
+    # a corrupt line loses only its own terms
+    with open(log_path, "ab") as log:
+        log.write(b'{"zorblax": "3"}\n[1]\n\xff{\n')
+    # a batch cut short by a crash is ignored, and the next write drops it
+    with open(log_path, "ab") as log:
+        log.write(b'{"torn": ')
+    expected = {"pterodactyl": 4, "alpha": 3, "beta": 2}
+    assert dictionary_utils.load_custom_syllable_dict() == expected
+    dictionary_utils.add_term_to_custom_dict("gamma", 2)
+    expected["gamma"] = 2
+    assert dictionary_utils.load_custom_syllable_dict() == expected
+
+    exported = os.path.join(test_config_dir, "export.json")
+    dictionary_utils.export_custom_dict(exported)
+    dictionary_utils.compact_custom_dict()
+    assert not os.path.exists(log_path)
+    with open(user_dict_path, encoding="utf-8") as f:
+        assert json.load(f) == {"CUSTOM_SYLLABLE_DICT": expected}
+    dictionary_utils.revert_custom_dict_to_default()
+    assert dictionary_utils.load_custom_syllable_dict() == {}
+    dictionary_utils.add_terms_from_file(exported)
+    assert dictionary_utils.load_custom_syllable_dict() == expected
+
+    # the log is folded into the snapshot automatically once it is large
+    monkeypatch.setattr(dictionary_utils, "LOG_COMPACT_BYTES", 64)
+    capsys.readouterr()
+    dictionary_utils.add_terms_to_custom_dict({f"w{i}": 1 for i in range(10)})
+    assert not os.path.exists(log_path)
+    assert "Loaded" not in capsys.readouterr().out  # compaction is quiet
+    assert dictionary_utils.load_custom_syllable_dict()["w9"] == 1
+
+
+def test_custom_dict_concurrent_writers(test_env):
+    import multiprocessing
+
+    test_config_dir, _ = test_env
+    context = multiprocessing.get_context("spawn")
+    processes = [
+        context.Process(target=_add_terms_in_process, args=(test_config_dir, start))
+        for start in (0, 50, 100)
+    ]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+    loaded = dictionary_utils.load_custom_syllable_dict()
+    assert loaded == {f"word{i}": 2 for i in range(150)}
+
+
+# --- Batch Tests ---
+def test_analyze_many_inline_matches_functions():
+    texts = (t for t in [long_test, short_test, empty_str])
+    results = list(
+        scireadability.analyze_many(
+            texts, metrics=["lexicon_count", "gunning_fog"], workers=1
+        )
+    )
+    assert results == [
+        {
+            "lexicon_count": scireadability.lexicon_count(t),
+            "gunning_fog": scireadability.gunning_fog(t),
+        }
+        for t in [long_test, short_test, empty_str]
+    ]
+
+
+def test_analyze_many_process_pool():
+    texts = [long_test, short_test, easy_text] * 5
+    metrics = ["flesch_kincaid_grade", "text_standard"]
+    expected = [scireadability.analyze(t).scores(metrics) for t in texts]
+
+    ordered = scireadability.analyze_many(
+        iter(texts), metrics=metrics, workers=2, chunksize=2
+    )
+    assert list(ordered) == expected
+
+    unordered = scireadability.analyze_many(
+        iter(texts), metrics=metrics, workers=2, chunksize=2, ordered=False
+    )
+    assert sorted(unordered, key=lambda pair: pair[0]) == list(enumerate(expected))
+
+
+def test_analyze_many_unknown_metric():
+    with pytest.raises(ValueError):
+        scireadability.analyze_many([short_test], metrics=["not_a_metric"])
+
+
+def test_score_frame_pandas():
+    pandas = pytest.importorskip("pandas")
+    texts = [long_test, None, short_test, empty_str]
+    frame = pandas.DataFrame({"body": texts}, index=[10, 11, 12, 13])
+    metrics = ["gunning_fog", "text_standard"]
+    result = scireadability.score_frame(frame, "body", metrics)
+    assert list(result.columns) == metrics
+    assert list(result.index) == [10, 11, 12, 13]
+    for label, text in zip(result.index, texts):
+        if text is None:
+            assert result.loc[label].isna().all()
+        else:
+            assert result.loc[label].to_dict() == scireadability.analyze(
+                text
+            ).scores(metrics)
+
+
+def test_score_frame_arrow():
+    pyarrow = pytest.importorskip("pyarrow")
+    table = pyarrow.table({"body": [long_test, None, short_test]})
+    result = scireadability.score_frame(table, "body", ["lexicon_count"])
+    assert result.column("lexicon_count").to_pylist() == [
+        scireadability.lexicon_count(long_test),
+        None,
+        scireadability.lexicon_count(short_test),
+    ]
+
+
+# --- Asyncio Tests ---
+@pytest.mark.filterwarnings("ignore:FORCAST")
+def test_aio_matches_sync():
+    from scireadability import aio
+
+    texts = [long_test, long_test * 3, short_test, empty_str]
+    expected = [scireadability.analyze(t).scores() for t in texts]
+
+    async def texts_later():
+        for text in texts:
+            await asyncio.sleep(0)
+            yield text
+
+    async def run():
+        assert await aio.scores_many(texts) == expected
+        assert await aio.scores_many(texts_later()) == expected
+        profile = await aio.analyze(long_test * 3)
+        assert profile.scores() == expected[1]
+        assert await aio.text_standard(short_test) == (
+            scireadability.text_standard(short_test)
+        )
+        assert await aio.score(long_test, "lexicon_count") == (
+            scireadability.lexicon_count(long_test)
+        )
+        with pytest.raises(ValueError):
+            await aio.scores(long_test, ["not_a_metric"])
+
+    aio.configure(max_workers=2, max_pending=1, inline_chars=100)
+    try:
+        asyncio.run(run())
+    finally:
+        aio.configure()
+
+
+def test_aio_cancellation():
+    from scireadability import aio
+
+    async def run():
+        task = asyncio.ensure_future(aio.scores(long_test * 100 + "."))
+        await asyncio.sleep(0)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        # the pool is still usable afterwards
+        return await aio.score(long_test, "lexicon_count")
+
+    aio.configure(max_workers=1, inline_chars=0)
+    try:
+        assert asyncio.run(run()) == scireadability.lexicon_count(long_test)
+    finally:
+        aio.configure()
+
+
+# --- Streaming Tests ---
+@pytest.mark.filterwarnings("ignore:FORCAST")
+@pytest.mark.parametrize("rm_apostrophe", [False, True])
+@pytest.mark.parametrize("text", [long_test, punct_text, "DON'T STOP. It'S fine!"])
+def test_analyze_stream_matches_analyze(text, rm_apostrophe):
+    scireadability.set_rm_apostrophe(rm_apostrophe)
+    try:
+        metrics = [m for m in scireadability.METRICS if m != "difficult_words"]
+        expected = scireadability.TextProfile(text).scores(metrics)
+        for size in (1, 5, 64):
+            chunks = [text[i : i + size] for i in range(0, len(text), size)]
+            profile = scireadability.analyze_stream(chunks)
+            assert profile.scores(metrics) == expected
+            assert profile.difficult_words(0) == scireadability.difficult_words(
+                text, 0
+            )
+    finally:
+        scireadability.set_rm_apostrophe(False)
+
+
+def test_analyze_stream_file_objects():
+    expected = scireadability.analyze(long_test).scores()
+    text_file = io.StringIO(long_test)
+    binary_file = io.BytesIO(long_test.encode("utf-8"))
+    assert scireadability.analyze_stream(text_file, chunk_size=10).scores() == expected
+    assert scireadability.analyze_stream(binary_file, chunk_size=3).scores() == expected
+    with pytest.raises(ValueError):
+        scireadability.analyze_stream(io.StringIO(long_test)).words
+
+
+# --- Incremental Document Tests ---
+@pytest.mark.filterwarnings("ignore:FORCAST")
+def test_document_edits_match_analyze():
+    doc = scireadability.Document(long_test)
+    text = long_test
+    edits = [
+        (0, 0, "Preface. "),
+        (120, 40, ""),  # inside a sentence
+        (300, 2, "! New sentence? Yes"),
+        (len(long_test) // 2, 200, "DON'T STOP. "),  # across sentences
+        (50, 0, "doctor's"),
+    ]
+    for offset, deleted, inserted in edits:
+        doc.edit(offset, deleted, inserted)
+        text = text[:offset] + inserted + text[offset + deleted :]
+        assert doc.text == text
+        assert doc.scores() == scireadability.TextProfile(text).scores()
+        assert doc.score("lexicon_count") == scireadability.lexicon_count(text)
+
+    doc.edit(0, len(doc), "")
+    assert doc.text == ""
+    assert doc.score("linsear_write_formula") == -1.0
+    with pytest.raises(ValueError):
+        doc.edit(1, 0, "x")
+
+
+# --- Sliding Window Tests ---
+def test_readability_profile_windows():
+    text = long_test * 3
+    result = scireadability.readability_profile(
+        text, window=60, stride=20, metrics=["flesch_kincaid_grade", "lexicon_count"]
+    )
+    n_words = scireadability.lexicon_count(text)
+    assert len(result.starts) == (n_words - 60) // 20 + 1
+    assert set(result.scores["lexicon_count"]) == {60.0}
+    assert result.starts[0] == 0
+    assert result.ends[-1] <= len(text)
+    # the first window starts with the text, so it scores like the slice it covers
+    assert result.scores["flesch_kincaid_grade"][0] == pytest.approx(
+        scireadability.flesch_kincaid_grade(text[result.starts[0] : result.ends[0]])
+    )
+
+
+def test_readability_profile_window_after_fragment():
+    text = (
+        "This is a fairly long opening sentence here. Ok then. "
+        "Now here we go again with more words."
+    )
+    result = scireadability.readability_profile(
+        text, window=4, stride=1, metrics=["sentence_count"]
+    )
+    windows = {
+        text[start:end]: score
+        for start, end, score in zip(
+            result.starts, result.ends, result.scores["sentence_count"]
+        )
+    }
+    # only the last sentence touches a window that starts on the fragment
+    assert windows["Ok then. Now here"] == 1
+    assert windows["here. Ok then. Now"] == 2
+
+
+@pytest.mark.filterwarnings("ignore:FORCAST")
+def test_readability_profile_whole_text_window():
+    metrics = [
+        m
+        for m in scireadability.METRICS
+        if m not in ("linsear_write_formula", "text_standard")
+    ]
+    for text in (long_test, punct_text, "DON'T STOP. It'S fine!"):
+        result = scireadability.readability_profile(
+            text, window=10**6, metrics=metrics
+        )
+        expected = scireadability.analyze(text).scores(metrics)
+        assert {name: values[0] for name, values in result.scores.items()} == expected
+    assert len(scireadability.readability_profile("...").starts) == 0
+    with pytest.raises(ValueError):
+        scireadability.readability_profile(long_test, metrics=["text_standard"])
+
+
+# --- Vectorized Formula Tests ---
+@pytest.mark.parametrize("rounding,points", [(False, None), (True, None), (True, 3)])
+def test_vectorized_formulas_match_scalar(rounding, points):
+    vectorized = pytest.importorskip("scireadability.formulas.vectorized")
+    texts = [long_test, punct_text, "", "...", "Hi.", "DON'T STOP. It'S fine!"]
+    texts += [long_test[:n] for n in range(7, len(long_test), 97)]
+    profiles = [scireadability.analyze(text) for text in texts]
+    counts = vectorized.count_arrays(profiles)
+    results = vectorized.scores(counts, rounding=rounding, points=points)
+    assert set(results) == set(vectorized.VECTORIZED_METRICS)
+    for name, values in results.items():
+        assert list(values) == [p.score(name, rounding, points) for p in profiles]
+
+    assert list(vectorized.rix([0, 10, 10], [0, 0, 2], [0, 4, 4])) == [0.0, 4.0, 2.0]
+    assert list(vectorized.smog_index([50, 50], [2, 3], [9, 9]))[0] == 0.0
+    with pytest.raises(ValueError):
+        vectorized.scores(counts, ["text_standard"])
+
+
+# --- Lexicon Tests ---
+def test_compiled_lexicon_round_trip(tmp_path):
+    cmu_bytes = (
+        b"hello HH AH0 L OW1\nhello(1) HH EH0 L OW1\n"
+        b"fire F AY1 ER0\nfire(1) F AY1 R\n"
+    )
+    parsed = lexicon.parse_lexicon(cmu_bytes, b"dog\nhello\n", {"zyzzyva": 3})
+    assert parsed.cmu == {"hello": 2, "fire": 1}
+
+    path = lexicon.write_lexicon(parsed, str(tmp_path / "lexicon.bin"))
+    assert lexicon.read_lexicon_digest(path) == parsed.digest
+    assert lexicon.read_lexicon(path) == parsed
+
+
+def test_mapped_lexicon_lookups(tmp_path):
+    parsed = lexicon.parse_lexicon(
+        b"hello HH AH0 L OW1\nzebra Z IY1 B R AH0\n", b"dog\nhello\n", {"abc": 3}
+    )
+    path = lexicon.write_lexicon(parsed, str(tmp_path / "lexicon.bin"))
+    mapped = lexicon.MappedLexicon(path).lexicon()
+    assert mapped.digest == parsed.digest
+    assert dict(mapped.cmu) == {"hello": 2, "zebra": 2}
+    assert dict(mapped.custom) == {"abc": 3}
+    assert mapped.cmu.get("abc") is None
+    assert "dog" in mapped.easy and "zebra" not in mapped.easy
+    assert "aardvark" not in mapped.cmu and "zzz" not in mapped.cmu
+
+
+@pytest.mark.filterwarnings("ignore:FORCAST")
+def test_mmap_backend_matches_memory_backend():
+    texts = [long_test, short_test, punct_text, easy_text]
+    metrics = scireadability.METRICS
+    expected = [scireadability.TextProfile(t).scores(metrics) for t in texts]
+    try:
+        scireadability.set_lexicon_backend("mmap")
+        assert [scireadability.TextProfile(t).scores(metrics) for t in texts] == expected
+    finally:
+        scireadability.set_lexicon_backend("memory")
+    with pytest.raises(ValueError):
+        scireadability.set_lexicon_backend("sqlite")
+
+
+def test_compiled_lexicon_rebuilds_when_user_dict_changes(test_env, tmp_path):
+    path = str(tmp_path / "lexicon.bin")
+    first = lexicon.load_lexicon(path)
+    assert lexicon.read_lexicon_digest(path) == first.digest
+    assert "pterodactyl" not in first.custom
+
+    dictionary_utils.add_term_to_custom_dict("pterodactyl", 4)
+    second = lexicon.load_lexicon(path)
+    assert second.custom["pterodactyl"] == 4
+    assert second.digest != first.digest
+    assert lexicon.read_lexicon_digest(path) == second.digest
+    assert lexicon.load_lexicon(path) == second
+
+
+def test_read_only_mode_touches_no_user_files(tmp_path):
+    home = tmp_path / "home"
+    home.mkdir()
+    env = dict(os.environ, HOME=str(home), SCIREADABILITY_READ_ONLY="1")
+    env["XDG_CONFIG_HOME"] = env["XDG_CACHE_HOME"] = str(home)
+    code = (
+        "import scireadability\n"
+        "scireadability.set_read_only(custom_dict={'Pterodactyl': 9})\n"
+        "print(scireadability.syllable_count('pterodactyl'))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        env=env,
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+    )
+    assert result.stdout == "9\n"
+    assert list(home.iterdir()) == []
+
+
+def test_read_only_mode(tmp_path):
+    path = lexicon.build_lexicon(str(tmp_path / "lexicon.bin"))
+    expected = scireadability.TextProfile(long_test).scores()
+    try:
+        scireadability.set_read_only()
+        assert scireadability.TextProfile(long_test).scores() == expected
+        with pytest.raises(RuntimeError):
+            scireadability.add_word_to_dictionary("pterodactyl", 4)
+
+        scireadability.set_read_only(custom_dict={"Dog": 5}, lexicon_path=path)
+        assert scireadability.syllable_count("The dog.") == 6
+        exported = tmp_path / "custom.json"
+        scireadability.export_dictionary(str(exported))
+        assert json.loads(exported.read_text()) == {"CUSTOM_SYLLABLE_DICT": {"dog": 5}}
+    finally:
+        scireadability.set_read_only(False)
+    assert scireadability.syllable_count("The dog.") == 2
+
+
+def test_cli_lexicon_build_and_check(tmp_path, capsys):
+    path = str(tmp_path / "lexicon.bin")
+    assert cli.main(["lexicon", "check", "--output", path]) == 1
+    assert cli.main(["lexicon", "build", "--output", path]) == 0
+    assert cli.main(["lexicon", "check", "--output", path]) == 0
+    assert "up to date" in capsys.readouterr().out
+
+
+@pytest.mark.filterwarnings("ignore:FORCAST")
+def test_cli_score_inputs(tmp_path, capsys):
+    (tmp_path / "docs" / "sub").mkdir(parents=True)
+    (tmp_path / "docs" / "a.txt").write_text(long_test, encoding="utf-8")
+    (tmp_path / "docs" / "sub" / "b.txt").write_text(short_test, encoding="utf-8")
+    (tmp_path / "docs" / "skip.md").write_text(easy_text, encoding="utf-8")
+    records = tmp_path / "records.csv"
+    records.write_text('key,body\nx,"Two lines.\nOf text here."\n', encoding="utf-8")
+
+    argv = ["score", str(tmp_path / "docs"), "--metrics", "lexicon_count,rix"]
+    assert cli.main(argv + ["--workers", "1"]) == 0
+    rows = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert [row["id"] for row in rows] == [
+        str(tmp_path / "docs" / "a.txt"),
+        str(tmp_path / "docs" / "sub" / "b.txt"),
+    ]
+    assert rows[0]["lexicon_count"] == scireadability.lexicon_count(long_test)
+    assert rows[1]["rix"] == scireadability.rix(short_test)
+
+    argv = ["score", str(records), "--text-field", "body", "--id-field", "key"]
+    assert cli.main(argv + ["--metrics", "lexicon_count", "--format", "csv"]) == 0
+    assert capsys.readouterr().out.splitlines() == ["id,lexicon_count", "x,5"]
+    assert cli.main(argv + ["--metrics", "lexicon_count, ,", "--format", "csv"]) == 0
+    assert capsys.readouterr().out.splitlines() == ["id,lexicon_count", "x,5"]
+
+
+@pytest.mark.filterwarnings("ignore:FORCAST")
+def test_cli_score_resumes_from_checkpoint(tmp_path):
+    records = tmp_path / "records.jsonl"
+    texts = [f"Record {i} has a sentence. And another one here." for i in range(25)]
+    records.write_text(
+        "".join(json.dumps({"text": text}) + "\n" for text in texts), encoding="utf-8"
+    )
+    output, checkpoint = tmp_path / "out.jsonl", tmp_path / "checkpoint.json"
+    argv = ["score", str(records), "-o", str(output), "--checkpoint", str(checkpoint)]
+    argv += ["--checkpoint-every", "10", "--metrics", "flesch_kincaid_grade"]
+    argv += ["--workers", "1"]
+    assert cli.main(argv) == 0
+    complete = output.read_bytes()
+    assert len(complete.splitlines()) == 25
+
+    # an interrupted run: checkpointed after 10 records, then a partial line
+    state = json.loads(checkpoint.read_text())
+    state["records"] = 10
+    state["offset"] = sum(len(line) for line in complete.splitlines(True)[:10])
+    checkpoint.write_text(json.dumps(state))
+    output.write_bytes(complete[: state["offset"] + 15])
+    assert cli.main(argv) == 0
+    assert output.read_bytes() == complete
+
+    with pytest.raises(SystemExit):
+        cli.main(argv[:-4] + ["--metrics", "rix"])
+    for every in ("0", "-5"):
+        with pytest.raises(SystemExit):
+            cli.main(argv + ["--checkpoint-every", every])
+